@@ -1,18 +1,27 @@
 import calendar
 import logging
 import os
+import sys
 import time
 from datetime import datetime
 
-import gspread
 import pandas as pd
 import pytz
 import streamlit as st
 import streamlit_authenticator as stauth
-from google.oauth2.service_account import Credentials
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
+# Every module shares cached frames through shallow copies, copy-on-write keeps a page's writes
+# to its copy away from the shared frame (a copy only shares columns until one side writes)
+pd.set_option("mode.copy_on_write", True)
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "utils"))
+
+from API_loader import get_sheet_data, refresh_sheets
+from data_sources import normalize_name
+from typed_frames import get_typed_frame, format_dates
+
 st.set_page_config(
     page_title="Trustpilot Review Manager",
     page_icon="⭐",
@@ -48,22 +57,6 @@ SLACK_BOT_TOKEN = os.getenv("SLACK") or st.secrets["Slack"]["Slack"]
 client = WebClient(token=SLACK_BOT_TOKEN)
 channel_usa = os.getenv("CHANNEL_USA") or st.secrets["Channels"]["usa"]
 channel_uk = os.getenv("CHANNEL_UK") or st.secrets["Channels"]["uk"]
-SPREADSHEET_ID = os.getenv("SPREADSHEET_ID") or st.secrets['connections']['gsheets']['SPREADSHEET_ID']
-
-creds_dict = {
-    "type": st.secrets["connections"]["gsheets"]["type"],
-    "project_id": st.secrets["connections"]["gsheets"]["project_id"],
-    "private_key_id": st.secrets["connections"]["gsheets"]["private_key_id"],
-    "private_key": st.secrets["connections"]["gsheets"]["private_key"].replace("\\n", "\n"),
-    "client_email": st.secrets["connections"]["gsheets"]["client_email"],
-    "client_id": st.secrets["connections"]["gsheets"]["client_id"],
-    "auth_uri": st.secrets["connections"]["gsheets"]["auth_uri"],
-    "token_uri": st.secrets["connections"]["gsheets"]["token_uri"],
-    "auth_provider_x509_cert_url": st.secrets["connections"]["gsheets"]["auth_provider_x509_cert_url"],
-    "client_x509_cert_url": st.secrets["connections"]["gsheets"]["client_x509_cert_url"]
-}
-SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
-
 # Constants
 sheet_usa = "USA"
 sheet_uk = "UK"
@@ -112,60 +105,12 @@ BP: https://bookspublisher.co.uk/
 """
 
 
-@st.cache_resource
-def get_gsheets_client(creds_dict: dict, spreadsheet_id: str):
-    """Create and cache Google Sheets client + spreadsheet"""
-    creds = Credentials.from_service_account_info(
-        creds_dict,
-        scopes=SCOPES
-    )
-    client = gspread.authorize(creds)
-    spreadsheet = client.open_by_key(spreadsheet_id)
-    return spreadsheet
-
-
-
-
-@st.cache_data(ttl=300)
-def get_sheet_data(sheet_name):
-    try:
-        spreadsheet = get_gsheets_client(creds_dict, SPREADSHEET_ID)
-        worksheet = spreadsheet.worksheet(sheet_name)
-        records = worksheet.get_all_values()
-        headers = records[0]
-        rows = records[1:]
-        df = pd.DataFrame(rows, columns=headers)
-        return df
-    except Exception as e:
-        logging.error(f"Failed to get data from sheet {sheet_name}: {e}")
-        st.error(f"Failed to get data from sheet {sheet_name}: {e}")
-        return pd.DataFrame()
-
-
-def normalize_name(name):
-    if pd.isna(name) or name == "":
-        return ""
-    return str(name).strip().title()
-
-
 def clean_data_reviews(sheet_name: str) -> pd.DataFrame:
-    data = get_sheet_data(sheet_name)
+    data = get_typed_frame(sheet_name)
     if data.empty:
         logging.warning(f"No data found in sheet: {sheet_name}")
         return data
 
-    columns = list(data.columns)
-    if "Issues" in columns:
-        end_col_index = columns.index("Issues")
-        data = data.iloc[:, :end_col_index + 1]
-
-    if "Project Manager" in data.columns:
-        data["Project Manager"] = data["Project Manager"].apply(normalize_name)
-
-    for col in ["Publishing Date", "Last Edit (Revision)", "Trustpilot Review Date"]:
-        if col in data.columns:
-            data[col] = pd.to_datetime(data[col], format="%d-%B-%Y", errors="coerce")
-
     data = data.sort_values(by="Publishing Date", ascending=True)
     data.index = range(1, len(data) + 1)
     return data
@@ -224,25 +169,12 @@ def load_pending_reviews(sheet_name: str, name: str) -> tuple:
 
 
 def load_attained_reviews(sheet_name: str, name: str, year: int, month_number=None) -> pd.DataFrame:
-    data = get_sheet_data(sheet_name)
+    data = get_typed_frame(sheet_name)
     if data.empty:
         return pd.DataFrame()
 
-    columns = list(data.columns)
-    if "Issues" in columns:
-        end_col_index = columns.index("Issues")
-        data = data.iloc[:, :end_col_index + 1]
-
-    if "Project Manager" in data.columns:
-        data["Project Manager"] = data["Project Manager"].apply(normalize_name)
-
     name = normalize_name(name)
 
-    date_columns = ["Publishing Date", "Last Edit (Revision)", "Trustpilot Review Date"]
-    for col in date_columns:
-        if col in data.columns:
-            data[col] = pd.to_datetime(data[col], format="%d-%B-%Y", errors="coerce")
-
     try:
         if "Trustpilot Review Date" in data.columns and month_number:
             data = data[(data["Trustpilot Review Date"].dt.month == month_number) &
@@ -260,9 +192,7 @@ def load_attained_reviews(sheet_name: str, name: str, year: int, month_number=No
 
         data = data.sort_values(by="Trustpilot Review Date", ascending=True)
         data = data.drop_duplicates(subset=["Name"])
-        data["Trustpilot Review Date"] = pd.to_datetime(
-            data["Trustpilot Review Date"], errors="coerce"
-        ).dt.strftime("%d-%B-%Y")
+        data["Trustpilot Review Date"] = format_dates(data["Trustpilot Review Date"])
         data.index = range(1, len(data) + 1)
         return data
     except Exception as e:
@@ -280,11 +210,6 @@ def load_total_reviews(sheet_name: str, name: str, year: int, month_number=None)
     if data.empty:
         return 0
 
-    date_columns = ["Publishing Date", "Last Edit (Revision)", "Trustpilot Review Date"]
-    for col in date_columns:
-        if col in data.columns:
-            data[col] = pd.to_datetime(data[col], format="%d-%B-%Y", errors="coerce")
-
     try:
         if "Publishing Date" in data.columns and month_number:
             data = data[(data["Publishing Date"].dt.month == month_number) &
@@ -301,9 +226,7 @@ def load_total_reviews(sheet_name: str, name: str, year: int, month_number=None)
                 ["BookMarketeers", "Writers Clique", "Authors Solution", "Book Publication", "Aurora Writers", "Books Publisher"])) &
             (data_original["Status"] == "Published")
             ]
-        data_count["Publishing Date"] = pd.to_datetime(
-            data_count["Publishing Date"], errors="coerce"
-        ).dt.strftime("%d-%B-%Y")
+        data_count["Publishing Date"] = format_dates(data_count["Publishing Date"])
 
         return data_count
     except Exception as e:
@@ -358,7 +281,7 @@ def send_pending_reviews_per_pm(name: str, sheet_name: str, email: str, channel:
         df["Book Name & Link"] = df["Book Name & Link"].apply(truncate_title)
 
     if "Publishing Date" in df.columns and not df.empty:
-        df["Publishing Date"] = pd.to_datetime(df["Publishing Date"], errors='coerce').dt.strftime("%d-%B-%Y")
+        df["Publishing Date"] = format_dates(df["Publishing Date"])
 
     merged_df = df[["Name", "Brand", "Book Name & Link", "Publishing Date", "Trustpilot Review"]]
 
@@ -448,33 +371,18 @@ def printing_data_month(month: int, year: int, choice: str) -> pd.DataFrame:
             selected_brands = usa_brands
         else:
             selected_brands = uk_brands
-        data = get_sheet_data("Printing")
-
-        columns = list(data.columns)
-        if "Accepted" in columns:
-            end_col_index = columns.index("Accepted")
-            data = data.iloc[:, :end_col_index + 1]
-
-        data = data.astype(str)
-        for col in ["Order Date", "Shipping Date", "Fulfilled"]:
-            if col in data.columns:
-                data[col] = pd.to_datetime(data[col], format="%d-%B-%Y", errors="coerce")
+        data = get_typed_frame("Printing")
 
         if month and "Order Date" in data.columns:
             data = data[(data["Order Date"].dt.month == month) & (data["Order Date"].dt.year == year) & (data["Brand"].isin(selected_brands))]
         if data.empty:
             return pd.DataFrame()
-        if "Order Cost" in data.columns:
-            data["Order Cost"] = data["Order Cost"].astype(str)
-            data["Order Cost"] = pd.to_numeric(
-                data["Order Cost"].str.replace("$", "", regex=False).str.replace(",", "", regex=False), errors="coerce")
 
         data = data.sort_values(by="Order Date", ascending=True)
 
-        data["No of Copies"] = data["No of Copies"].astype(float)
         for col in ["Order Date", "Shipping Date", "Fulfilled"]:
             if col in data.columns:
-                data[col] = pd.to_datetime(data[col], errors="coerce").dt.strftime("%d-%B-%Y")
+                data[col] = format_dates(data[col])
 
         data.index = range(1, len(data) + 1)
 
@@ -484,7 +392,6 @@ def printing_data_month(month: int, year: int, choice: str) -> pd.DataFrame:
         return pd.DataFrame()
 
 def printing_data_year(year: int, choice: str) -> pd.DataFrame:
-    data = get_sheet_data("Printing")
     usa_brands = ["BookMarketeers", "Writers Clique", "Aurora Writers", "KDP"]
     uk_brands = ["Authors Solution", "Book Publication", "Books Publisher"]
 
@@ -492,35 +399,15 @@ def printing_data_year(year: int, choice: str) -> pd.DataFrame:
         selected_brands = usa_brands
     else:
         selected_brands = uk_brands
-    data = get_sheet_data("Printing")
+    data = get_typed_frame("Printing")
     if data.empty:
         return pd.DataFrame()
 
-    columns = list(data.columns)
-    if "Accepted" in columns:
-        end_col_index = columns.index("Accepted")
-        data = data.iloc[:, :end_col_index + 1]
-
-    data = data.astype(str)
-
-    for col in ["Order Date", "Shipping Date", "Fulfilled"]:
-        if col in data.columns:
-            data[col] = pd.to_datetime(data[col], format="%d-%B-%Y", errors="coerce")
-
     data = data[(data["Order Date"].dt.year == year) & (data["Brand"].isin(selected_brands))]
 
     if data.empty:
         return pd.DataFrame()
 
-    if "Order Cost" in data.columns:
-        data["Order Cost"] = pd.to_numeric(
-            data["Order Cost"].str.replace("$", "", regex=False).str.replace(",", "", regex=False),
-            errors="coerce"
-        )
-
-    if "No of Copies" in data.columns:
-        data["No of Copies"] = pd.to_numeric(data["No of Copies"], errors='coerce')
-
     for col in ["Order Date", "Shipping Date", "Fulfilled"]:
         if col in data.columns:
             data[col] = data[col].dt.strftime("%d-%B-%Y")
@@ -530,7 +417,6 @@ def printing_data_year(year: int, choice: str) -> pd.DataFrame:
     return data
 
 def printing_data_search(year: int, choice: str) -> pd.DataFrame:
-    data = get_sheet_data("Printing")
     usa_brands = ["BookMarketeers", "Writers Clique", "Aurora Writers", "KDP"]
     uk_brands = ["Authors Solution", "Book Publication", "Books Publisher"]
 
@@ -538,36 +424,16 @@ def printing_data_search(year: int, choice: str) -> pd.DataFrame:
         selected_brands = usa_brands
     else:
         selected_brands = uk_brands
-    data = get_sheet_data("Printing")
+    data = get_typed_frame("Printing")
     if data.empty:
         return pd.DataFrame()
 
-    columns = list(data.columns)
-    if "Accepted" in columns:
-        end_col_index = columns.index("Accepted")
-        data = data.iloc[:, :end_col_index + 1]
-
-    data = data.astype(str)
-
-    for col in ["Order Date", "Shipping Date", "Fulfilled"]:
-        if col in data.columns:
-            data[col] = pd.to_datetime(data[col], format="%d-%B-%Y", errors="coerce")
-
     data = data[((data["Order Date"].dt.year >= 2025) & (data["Order Date"].dt.year <= year)) &
                 (data["Brand"].isin(selected_brands))]
 
     if data.empty:
         return pd.DataFrame()
 
-    if "Order Cost" in data.columns:
-        data["Order Cost"] = pd.to_numeric(
-            data["Order Cost"].str.replace("$", "", regex=False).str.replace(",", "", regex=False),
-            errors="coerce"
-        )
-
-    if "No of Copies" in data.columns:
-        data["No of Copies"] = pd.to_numeric(data["No of Copies"], errors='coerce')
-
     for col in ["Order Date", "Shipping Date", "Fulfilled"]:
         if col in data.columns:
             data[col] = data[col].dt.strftime("%d-%B-%Y")
@@ -577,7 +443,6 @@ def printing_data_search(year: int, choice: str) -> pd.DataFrame:
     return data
 
 def get_printing_upcoming(choice: str):
-    data = get_sheet_data("Printing")
     usa_brands = ["BookMarketeers", "Writers Clique", "Aurora Writers", "KDP"]
     uk_brands = ["Authors Solution", "Book Publication", "Books Publisher"]
 
@@ -603,8 +468,8 @@ def get_printing_upcoming(choice: str):
     data.index = range(1, len(data) + 1)
     return data
 
-def fetch(region: str):
-    st.cache_data.clear()
+def fetch(region: str, sheet_name: str):
+    refresh_sheets([sheet_name])
     st.info(f"Fetching latest reviews for {region} ...")
     st.session_state.fetched = True
     pkt = pytz.timezone("Asia/Karachi")
@@ -680,7 +545,10 @@ def main():
                 )
 
             if st.button("🔃 Fetch Latest"):
-                fetch(region)
+                if action == "Printing Data":
+                    fetch(region, "Printing")
+                else:
+                    fetch(region, sheet_usa if region == "USA" else sheet_uk)
 
             if st.session_state.fetched:
                 st.success(
@@ -717,8 +585,7 @@ def main():
                     if pd.notna(min_date) and pd.notna(max_date):
                         st.info(f"Date Range: {min_date.strftime('%B %Y')} - {max_date.strftime('%B %Y')}")
 
-                    df["Publishing Date"] = pd.to_datetime(df["Publishing Date"], errors='coerce').dt.strftime(
-                        "%d-%B-%Y")
+                    df["Publishing Date"] = format_dates(df["Publishing Date"])
                     df = df[[
                         "Name", "Brand", "Publishing Date", "Status",
                         "Trustpilot Review", "Trustpilot Review Date", "Trustpilot Review Links"
@@ -735,8 +602,7 @@ def main():
                     st.warning(f"No pending reviews found for {selected_pm}")
 
                 if not df2.empty:
-                    df2["Publishing Date"] = pd.to_datetime(df2["Publishing Date"], errors='coerce').dt.strftime(
-                        "%d-%B-%Y")
+                    df2["Publishing Date"] = format_dates(df2["Publishing Date"])
                     df2 = df2[[
                         "Name", "Brand", "Publishing Date", "Status", "Trustpilot Review"
                     ]].rename(columns={"Status": "Publishing Status"})
@@ -772,8 +638,7 @@ def main():
                     col3.metric("🤵🏻 Total Reviews", f"{total}")
                     col4.metric("🎯 Retention Rate", f"{percent:.1%}")
 
-                    df["Publishing Date"] = pd.to_datetime(df["Publishing Date"], errors='coerce').dt.strftime(
-                        "%d-%B-%Y")
+                    df["Publishing Date"] = format_dates(df["Publishing Date"])
                     df = df[[
                         "Name", "Brand", "Publishing Date", "Status",
                         "Trustpilot Review", "Trustpilot Review Date", "Trustpilot Review Links"
@@ -995,7 +860,7 @@ def main():
                 col2.metric("❓ Pending", total_reviews)
                 col3.metric("🤵🏻 Total", total)
                 col4.metric("🎯 Retention", f"{percent:.1%}")
-                df["Publishing Date"] = pd.to_datetime(df["Publishing Date"], errors='coerce').dt.strftime("%d-%B-%Y")
+                df["Publishing Date"] = format_dates(df["Publishing Date"])
                 df = df[["Name", "Brand", "Publishing Date", "Status", "Trustpilot Review", "Trustpilot Review Date",
                          "Trustpilot Review Links"]]
                 st.dataframe(df, width="stretch")
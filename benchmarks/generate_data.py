@@ -0,0 +1,188 @@
+"""
+Generate synthetic copies of the dashboard sheets for offline profiling.
+
+Writes one Parquet file per sheet (USA, UK, AudioBook, Printing, Copyright, A_plus,
+Sales, Nielsen ISBN) with the real column names, date format and vocabularies, in
+the layout the local data source reads:
+
+    python benchmarks/generate_data.py --rows 100000 --out bench_data/100k
+    DATA_SOURCE=local DATA_DIR=bench_data/100k streamlit run App_Streamlit.py
+"""
+import argparse
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+DATE_FORMAT = "%d-%B-%Y"
+
+USA_BRANDS = ["BookMarketeers", "Writers Clique", "Aurora Writers", "KDP"]
+UK_BRANDS = ["Authors Solution", "Book Publication", "Books Publisher"]
+PLATFORMS = ["Amazon", "Barnes & Noble", "Ingram Spark", "Draft2Digital", "Kobo", "LULU", "FAV", "ACX"]
+STATUSES = ["Published", "In Progress", "Pending", "On Hold"]
+REVIEW_STATES = ["Attained", "Pending", "Sent", "Negative", ""]
+ISSUES = ["", "Self Publishing", "Printing Only", "Formatting", "Cover"]
+PROJECT_MANAGERS = ["Aiza Ali", "Ahmed Asif", "Maheen Sami", "Youha Khan", "Hamza Tariq", "Sara Malik",
+                    "Bilal Ahmed", "Hira Shah", "Usman Raza", "Zainab Noor", "Fahad Iqbal", "Ayesha Siddiqui"]
+PRINT_TYPES = ["Upcoming", "Shipped", "Fulfilled"]
+COUNTRIES = ["USA", "Canada", "UK"]
+
+# Size of each sheet relative to the USA sheet
+SHEET_RATIOS = {
+    "USA": 1.0,
+    "UK": 0.6,
+    "AudioBook": 0.05,
+    "Printing": 0.2,
+    "Copyright": 0.1,
+    "A_plus": 0.1,
+    "Sales": 0.3,
+    "Nielsen ISBN": 0.05,
+}
+
+
+def _pick(rng: np.random.Generator, values: list[str], n: int, p: list[float] | None = None) -> pd.Series:
+    """n values drawn from a vocabulary"""
+    return pd.Series(np.array(values, dtype=object)[rng.choice(len(values), n, p=p)])
+
+
+def _dates(rng: np.random.Generator, n: int, start: datetime, end: datetime, blank: float = 0.05) -> pd.Series:
+    """Random dates between start and end in the sheets' "%d-%B-%Y" format, some left blank"""
+    days = rng.integers(0, (end - start).days + 1, n)
+    dates = pd.Series((pd.Timestamp(start) + pd.to_timedelta(days, unit="D")).strftime(DATE_FORMAT))
+    return dates.mask(rng.random(n) < blank, "")
+
+
+def _untidy(rng: np.random.Generator, names: pd.Series) -> pd.Series:
+    """Add the stray whitespace and casing seen in hand-typed names"""
+    variant = rng.random(len(names))
+    names = names.mask(variant < 0.1, names.str.lower())
+    return names.mask(variant > 0.9, " " + names + " ")
+
+
+def _clients(rng: np.random.Generator, n: int) -> pd.Series:
+    """Client names from a pool of about n / 3 clients, so clients return across months"""
+    pool = max(n // 3, 1)
+    return _untidy(rng, "Client " + pd.Series(rng.integers(0, pool, n)).astype(str))
+
+
+def _money(rng: np.random.Generator, n: int, low: int, high: int) -> pd.Series:
+    """Amounts formatted like the sheets ("$1,250.00")"""
+    return "$" + pd.Series(rng.integers(low, high, n)).map("{:,}".format) + ".00"
+
+
+def review_sheet(rng: np.random.Generator, n: int, brands: list[str], start: datetime, end: datetime) -> pd.DataFrame:
+    """USA / UK / AudioBook publishing sheet"""
+    names = _clients(rng, n)
+    return pd.DataFrame({
+        "Name": names,
+        "Email": names.str.strip().str.lower().str.replace(" ", "", regex=False) + "@mail.com",
+        "Book Name & Link": "https://www.amazon.com/dp/B0" + pd.Series(rng.integers(10 ** 7, 10 ** 8, n)).astype(str),
+        "Brand": _pick(rng, brands, n),
+        "Project Manager": _untidy(rng, _pick(rng, PROJECT_MANAGERS, n)),
+        "Platform": _pick(rng, PLATFORMS, n, [0.45, 0.15, 0.15, 0.07, 0.06, 0.04, 0.04, 0.04]),
+        "Publishing Date": _dates(rng, n, start, end),
+        "Status": _pick(rng, STATUSES, n, [0.7, 0.15, 0.1, 0.05]),
+        "Trustpilot Review": _pick(rng, REVIEW_STATES, n, [0.3, 0.2, 0.15, 0.05, 0.3]),
+        "Trustpilot Review Date": _dates(rng, n, start, end, blank=0.6),
+        "Trustpilot Review Links": _pick(rng, ["https://www.trustpilot.com/reviews/", ""], n, [0.3, 0.7]),
+        "Last Edit (Revision)": _dates(rng, n, start, end, blank=0.7),
+        "Copyright": _pick(rng, ["Yes", "No"], n),
+        "Issues": _pick(rng, ISSUES, n, [0.8, 0.08, 0.06, 0.03, 0.03]),
+    })
+
+
+def printing_sheet(rng: np.random.Generator, n: int, start: datetime, end: datetime) -> pd.DataFrame:
+    return pd.DataFrame({
+        "Name": _clients(rng, n),
+        "Brand": _pick(rng, USA_BRANDS + UK_BRANDS, n),
+        "Book": "Book " + pd.Series(rng.integers(0, max(n // 2, 1), n)).astype(str),
+        "No of Copies": pd.Series(rng.integers(1, 200, n)).astype(str),
+        "Order Cost": _money(rng, n, 10, 3000),
+        "Order Date": _dates(rng, n, start, end),
+        "Shipping Date": _dates(rng, n, start, end, blank=0.3),
+        "Fulfilled": _dates(rng, n, start, end, blank=0.4),
+        "Type": _pick(rng, PRINT_TYPES, n, [0.2, 0.3, 0.5]),
+        "Accepted": _pick(rng, ["Yes", "No"], n, [0.9, 0.1]),
+    })
+
+
+def copyright_sheet(rng: np.random.Generator, n: int, start: datetime, end: datetime) -> pd.DataFrame:
+    return pd.DataFrame({
+        "Name": _clients(rng, n),
+        "Brand": _pick(rng, USA_BRANDS + UK_BRANDS, n),
+        "Submission Date": _dates(rng, n, start, end),
+        "Result": _pick(rng, ["Yes", "No", ""], n, [0.7, 0.1, 0.2]),
+        "Country": _pick(rng, COUNTRIES, n, [0.7, 0.1, 0.2]),
+    })
+
+
+def a_plus_sheet(rng: np.random.Generator, n: int, start: datetime, end: datetime) -> pd.DataFrame:
+    return pd.DataFrame({
+        "Name": _clients(rng, n),
+        "Brand": _pick(rng, USA_BRANDS + UK_BRANDS, n),
+        "A+ Content Date": _dates(rng, n, start, end),
+        "Status": _pick(rng, STATUSES, n, [0.7, 0.15, 0.1, 0.05]),
+        "Issues": _pick(rng, ISSUES, n, [0.8, 0.08, 0.06, 0.03, 0.03]),
+    })
+
+
+def sales_sheet(rng: np.random.Generator, n: int, start: datetime, end: datetime) -> pd.DataFrame:
+    return pd.DataFrame({
+        "Name": _clients(rng, n),
+        "Brand": _pick(rng, USA_BRANDS + UK_BRANDS, n),
+        "Payment Date": _dates(rng, n, start, end),
+        "Payment": _money(rng, n, 50, 5000),
+    })
+
+
+def nielsen_sheet(rng: np.random.Generator, n: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "ISBN": "978" + pd.Series(rng.integers(10 ** 9, 10 ** 10, n)).astype(str),
+        "Title": "Book " + pd.Series(np.arange(n)).astype(str),
+        "Subtitle": "",
+        "Brand": _pick(rng, USA_BRANDS + UK_BRANDS, n),
+        "Author": _clients(rng, n),
+    })
+
+
+def generate_sheets(rows: int, years: int = 4, seed: int = 7) -> dict[str, pd.DataFrame]:
+    """Every sheet, sized relative to a USA sheet of the given number of rows and spanning the last few years"""
+    rng = np.random.default_rng(seed)
+    end = datetime(datetime.now().year, 12, 31)
+    start = datetime(end.year - years + 1, 1, 1)
+    sizes = {sheet_name: max(int(rows * ratio), 1) for sheet_name, ratio in SHEET_RATIOS.items()}
+
+    return {
+        "USA": review_sheet(rng, sizes["USA"], USA_BRANDS, start, end),
+        "UK": review_sheet(rng, sizes["UK"], UK_BRANDS, start, end),
+        "AudioBook": review_sheet(rng, sizes["AudioBook"], USA_BRANDS, start, end),
+        "Printing": printing_sheet(rng, sizes["Printing"], start, end),
+        "Copyright": copyright_sheet(rng, sizes["Copyright"], start, end),
+        "A_plus": a_plus_sheet(rng, sizes["A_plus"], start, end),
+        "Sales": sales_sheet(rng, sizes["Sales"], start, end),
+        "Nielsen ISBN": nielsen_sheet(rng, sizes["Nielsen ISBN"]),
+    }
+
+
+def write_sheets(sheets: dict[str, pd.DataFrame], directory: str) -> None:
+    """Write the sheets as <sheet name>.parquet files"""
+    os.makedirs(directory, exist_ok=True)
+    for sheet_name, data in sheets.items():
+        data.to_parquet(os.path.join(directory, f"{sheet_name}.parquet"), index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic dashboard sheets")
+    parser.add_argument("--rows", type=int, default=100_000, help="rows in the USA sheet, other sheets scale with it")
+    parser.add_argument("--years", type=int, default=4, help="years of history, ending with the current year")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--out", required=True, help="directory to write the Parquet files to")
+    args = parser.parse_args()
+
+    write_sheets(generate_sheets(args.rows, args.years, args.seed), args.out)
+    print(f"Wrote {args.rows:,}-row sheets to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
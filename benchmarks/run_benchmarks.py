@@ -0,0 +1,222 @@
+"""
+Benchmark the summary and review loaders against synthetic sheets.
+
+For every size the sheets are generated (see generate_data.py) unless they already
+exist, then each entry point is run in a fresh process on the local data source and
+its wall time and peak traced memory are reported:
+
+    python benchmarks/run_benchmarks.py --sizes 10000 100000 1000000
+"""
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _measure(func, *args) -> tuple[float, float]:
+    """Wall time (s) of one call, then peak traced memory (MB) of a second, traced call"""
+    gc.collect()
+    start = time.perf_counter()
+    func(*args)
+    wall = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return wall, peak / 1024 ** 2
+
+
+def run_worker(data_dir: str) -> list[dict]:
+    """Run every entry point against one generated data directory (needs a fresh process)"""
+    os.environ["DATA_SOURCE"] = "local"
+    os.environ["DATA_DIR"] = data_dir
+    os.environ["SNAPSHOT_DIR"] = tempfile.mkdtemp(prefix="bench_snapshots_")
+    sys.path.append(os.path.join(ROOT, "utils"))
+
+    import pandas as pd
+    import streamlit as st
+    from streamlit.logger import set_log_level
+    set_log_level("error")
+
+    # The dashboard runs with copy-on-write (see App_Streamlit.py), the loaders rely on it
+    pd.set_option("mode.copy_on_write", True)
+
+    import client_identity
+    import client_presence
+    import daily_totals
+    import sheet_query
+    import summary_cube
+    import typed_frames
+    from API_loader import refresh_sheets
+    from data_loader import load_reviews, load_reviews_year, load_reviews_year_to_date, load_reviews_filter, \
+        load_reviews_year_multiple, load_pm_reviews, REVIEW_TYPES
+    from summary_generators import summary, generate_year_summary, generate_year_summary_multiple
+    from similarity_loader import get_names_in_both_months, get_names_in_both_years, \
+        get_clients_returning_in_month, get_names_in_year, get_active_clients
+
+    year = datetime.now().year - 1
+    month = 6
+    pm = "Aiza Ali"
+    sheets = ["USA", "UK", "Printing", "Copyright", "A_plus", "Sales"]
+
+    def build_typed_frames():
+        typed_frames._typed_cache.clear()
+        for sheet_name in sheets:
+            typed_frames.get_typed_frame(sheet_name)
+
+    def build_summary_cube():
+        summary_cube._cube_cache = None
+        summary_cube._month_cells.clear()
+        summary_cube._loaded_sheets.update(summary_cube.CUBE_SHEETS)
+        summary_cube.get_summary_cube()
+
+    def rebuild_summary_cube():
+        # A new data version with no closed month changed, every closed month is reused
+        summary_cube._cube_cache = None
+        summary_cube.get_summary_cube()
+
+    def restart_summary_cube():
+        # A new process, the closed months are read back from the persisted partials
+        summary_cube._cube_cache = None
+        summary_cube._month_cells.clear()
+        summary_cube._loaded_sheets.clear()
+        summary_cube.get_summary_cube()
+
+    def cold(func):
+        # Nothing parsed or rolled up yet, as right after a refresh that changed every sheet
+        def run(*args):
+            typed_frames._typed_cache.clear()
+            typed_frames._partition_cache.clear()
+            summary_cube._cube_cache = None
+            summary_cube._month_cells.clear()
+            summary_cube._loaded_sheets.update(summary_cube.CUBE_SHEETS)
+            return uncached(func)(*args)
+        return run
+
+    def read_typed_frames():
+        # The loaders of one page read the shared frames dozens of times
+        for _ in range(50):
+            typed_frames.get_typed_frame("USA")
+            typed_frames.get_typed_slice("USA", "Publishing Date", year)
+
+    def build_daily_totals():
+        daily_totals._daily_cache.clear()
+        for sheet_name in sheets:
+            daily_totals.get_daily_totals(sheet_name)
+
+    def range_totals():
+        for metric in ("Published", "Attained", "Negative"):
+            daily_totals.range_total("USA", metric, date(year, 1, 15), date(year, 8, 20))
+
+    def build_client_identities():
+        client_identity._identity_cache.clear()
+        client_identity.get_client_identities("USA")
+
+    def build_client_presence():
+        client_presence._presence_cache.clear()
+        client_presence.get_client_presence("USA")
+
+    def with_details(func):
+        # Summaries build their detail tables on first access, read every one of them
+        def run(*args):
+            return func(*args).as_tuple()
+        return run
+
+    def uncached(func):
+        # Summaries and sheet queries are memoized per data version, clear them so every call does the work
+        def run(*args):
+            st.cache_data.clear()
+            sheet_query._query_cache.clear()
+            return func(*args)
+        return run
+
+    refresh_sheets()
+    build_typed_frames()
+    pms = typed_frames.get_typed_frame("USA")["Project Manager"].unique().tolist()
+
+    def pm_reviews_year():
+        return load_pm_reviews("USA", pms, REVIEW_TYPES, start_year=year)
+
+    cases = [
+        ("refresh_sheets", refresh_sheets),
+        ("typed frames", build_typed_frames),
+        ("typed frame reads (50)", read_typed_frames),
+        ("summary cube", build_summary_cube),
+        ("summary cube (closed months cached)", rebuild_summary_cube),
+        ("summary cube (closed months on disk)", restart_summary_cube),
+        ("daily totals", build_daily_totals),
+        ("range_total", range_totals),
+        ("summary (cold)", cold(summary), month, year),
+        ("generate_year_summary (cold)", cold(generate_year_summary), year),
+        ("summary", uncached(summary), month, year),
+        ("generate_year_summary", uncached(generate_year_summary), year),
+        ("generate_year_summary_multiple", uncached(generate_year_summary_multiple), year - 2, year),
+        ("summary (with details)", uncached(with_details(summary)), month, year),
+        ("generate_year_summary (with details)", uncached(with_details(generate_year_summary)), year),
+        ("load_reviews", uncached(load_reviews), "USA", year, month),
+        ("load_reviews_year", uncached(load_reviews_year), "USA", year, pm, "Attained"),
+        ("load_reviews_year_to_date", uncached(load_reviews_year_to_date), "USA", year, pm, "Attained"),
+        ("load_reviews_filter", uncached(load_reviews_filter), "USA", date(year, 1, 1), date(year, 6, 30), pm,
+         "Attained"),
+        ("load_reviews_year_multiple", uncached(load_reviews_year_multiple), "USA", year - 2, year, pm, "Attained"),
+        ("load_pm_reviews", uncached(pm_reviews_year)),
+        ("get_names_in_both_months", get_names_in_both_months, "USA", "March", year, "June", year),
+        ("get_names_in_both_years", get_names_in_both_years, "USA", year - 1, year),
+        ("get_clients_returning_in_month", get_clients_returning_in_month, "USA", year - 1, "June", year),
+        ("get_names_in_year", get_names_in_year, "USA", year),
+        ("client identities", build_client_identities),
+        ("client presence", build_client_presence),
+        ("get_active_clients", get_active_clients, "USA", 3, 12, "June", year),
+    ]
+
+    results = []
+    for name, func, *args in cases:
+        wall, peak = _measure(func, *args)
+        results.append({"entry point": name, "wall (s)": round(wall, 3), "peak (MB)": round(peak, 1)})
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dashboard loaders on synthetic sheets")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+                        help="rows in the USA sheet for each run")
+    parser.add_argument("--data-root", default=os.path.join(ROOT, "bench_data"),
+                        help="where generated sheets are kept between runs")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker)))
+        return
+
+    import pandas as pd
+
+    for rows in args.sizes:
+        data_dir = os.path.join(args.data_root, str(rows))
+        if not os.path.exists(os.path.join(data_dir, "USA.parquet")):
+            subprocess.run([sys.executable, os.path.join(BENCH_DIR, "generate_data.py"),
+                            "--rows", str(rows), "--out", data_dir], check=True)
+
+        output = subprocess.run([sys.executable, __file__, "--worker", data_dir],
+                                check=True, capture_output=True, text=True).stdout
+        results = json.loads(output.strip().splitlines()[-1])
+
+        print(f"\n{rows:,} rows")
+        print(pd.DataFrame(results).to_markdown(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Shared setup: the loaders read a small synthetic copy of the sheets from a local directory.
+
+The data source and the snapshot directory are picked when the utils modules are imported,
+so both are set here before any test imports them.
+"""
+import os
+import sys
+import tempfile
+
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = tempfile.mkdtemp(prefix="blink_test_data_")
+
+os.environ["DATA_SOURCE"] = "local"
+os.environ["DATA_DIR"] = DATA_DIR
+os.environ["SNAPSHOT_DIR"] = tempfile.mkdtemp(prefix="blink_test_snapshots_")
+sys.path.append(os.path.join(ROOT, "utils"))
+sys.path.append(os.path.join(ROOT, "benchmarks"))
+
+# The dashboard runs with copy-on-write (see App_Streamlit.py), the loaders rely on it
+pd.set_option("mode.copy_on_write", True)
+
+from generate_data import generate_sheets, write_sheets  # noqa: E402
+
+# Rows in the USA sheet of the fixture, the other sheets are sized from it
+FIXTURE_ROWS = 5000
+
+write_sheets(generate_sheets(FIXTURE_ROWS), DATA_DIR)
+
+
+def reset_sheet_store() -> None:
+    """Forget every fetched sheet and everything derived from it, the next read fetches again"""
+    import streamlit as st
+    import API_loader
+    import daily_totals
+    import sheet_query
+    import typed_frames
+
+    with API_loader._store_lock:
+        for store in (API_loader._sheet_store, API_loader._fetched_at, API_loader._fingerprints,
+                      API_loader._row_hash_store, API_loader._full_synced_at, API_loader._sync_deltas):
+            store.clear()
+    for cache in (typed_frames._typed_cache, typed_frames._partition_cache, typed_frames._digest_cache,
+                  sheet_query._query_cache, daily_totals._daily_cache):
+        cache.clear()
+    st.cache_data.clear()
+
+
+@pytest.fixture(scope="session")
+def fixture_dir() -> str:
+    """Directory the local data source reads the fixture sheets from"""
+    return DATA_DIR
@@ -0,0 +1,82 @@
+"""The client name resolver joins spellings of one client and keeps distinct clients apart"""
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from API_loader import get_sheet_data
+from client_identity import build_client_identities
+from similarity_loader import get_names_in_both_years
+from typed_frames import TEXT_DTYPE
+
+YEAR = datetime.now().year - 1
+
+# Spelling -> rows, "John Smith" is the most used spelling of its client
+SPELLINGS = {
+    "John Smith": 5,
+    "john smith": 2,
+    "John  Smith": 1,
+    "Jon Smith": 1,
+    "Smith, John": 1,
+    "Joan Smith": 1,
+    "Mary Jones": 3,
+    "Mark Jones": 2,
+    "Client 3496": 2,
+    "Client 31496": 1,
+    "Sara Malik": 1,
+}
+
+
+def _sheet(spellings: dict[str, int]) -> pd.DataFrame:
+    names = [name for name, rows in spellings.items() for _ in range(rows)]
+    return pd.DataFrame({"Name": pd.Series(names, dtype=TEXT_DTYPE)})
+
+
+@pytest.fixture(scope="module")
+def identities() -> pd.DataFrame:
+    return build_client_identities(_sheet(SPELLINGS))
+
+
+def test_spelling_variants_are_one_client(identities):
+    variants = ["John Smith", "john smith", "John  Smith", "Jon Smith", "Smith, John"]
+
+    assert identities.loc[variants, "Client ID"].nunique() == 1
+    assert set(identities.loc[variants, "Client"]) == {"John Smith"}
+
+
+@pytest.mark.parametrize("first, second", [
+    ("Joan Smith", "John Smith"),
+    ("Joan Smith", "Jon Smith"),
+    ("Mary Jones", "Mark Jones"),
+    ("Client 3496", "Client 31496"),
+    ("Sara Malik", "John Smith"),
+])
+def test_distinct_clients_stay_apart(identities, first, second):
+    assert identities.at[first, "Client ID"] != identities.at[second, "Client ID"]
+    assert identities.at[first, "Client"] == first
+
+
+def test_client_ids_do_not_depend_on_row_order_or_counts(identities):
+    shuffled = _sheet(SPELLINGS).sample(frac=1, random_state=3).reset_index(drop=True)
+    # "john smith" becomes the most used spelling, the shown name moves but the ID stays
+    recounted = _sheet({**SPELLINGS, "john smith": 9})
+
+    for data in (shuffled, recounted):
+        other = build_client_identities(data)
+        pd.testing.assert_series_equal(other["Client ID"].sort_index(), identities["Client ID"].sort_index())
+
+    assert build_client_identities(recounted).at["Jon Smith", "Client"] == "john smith"
+
+
+def test_similarity_report_counts_clients_not_spellings():
+    data = get_sheet_data("USA")
+    dates = pd.to_datetime(data["Publishing Date"], format="%d-%B-%Y", errors="coerce")
+    # The fixture's spellings of one client only differ in case
+    clients = data["Name"].str.lower()
+    expected = set(clients[dates.dt.year == YEAR - 1]) & set(clients[dates.dt.year == YEAR])
+
+    names, counts, total = get_names_in_both_years("USA", YEAR - 1, YEAR)
+
+    assert total == len(names) == len(expected)
+    assert {name.lower() for name in names} == expected
+    assert set(counts) == names
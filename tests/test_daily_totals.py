@@ -0,0 +1,47 @@
+"""range_total gives the row count a direct mask over the sheet gives"""
+from datetime import date, datetime
+
+import pandas as pd
+import pytest
+
+from API_loader import get_sheet_data
+from daily_totals import DAILY_METRICS, range_total
+
+YEAR = datetime.now().year - 1
+
+RANGES = [
+    (date(YEAR, 1, 1), date(YEAR, 12, 31)),
+    (date(YEAR, 3, 10), date(YEAR, 5, 20)),
+    (date(YEAR - 1, 11, 15), date(YEAR, 2, 3)),
+    (date(YEAR, 7, 4), date(YEAR, 7, 4)),
+    # Around and outside the sheet's first and last dates
+    (date(1990, 1, 1), date(YEAR + 5, 1, 1)),
+    (date(1990, 1, 1), date(1990, 12, 31)),
+    (date(YEAR + 3, 1, 1), date(YEAR + 4, 1, 1)),
+    # An empty range
+    (date(YEAR, 5, 20), date(YEAR, 3, 10)),
+]
+
+
+def _mask_count(sheet_name: str, metric: str, start: date, end: date) -> int:
+    """The metric's rows on start..end, counted on the sheet text"""
+    date_column, condition = DAILY_METRICS[metric]
+    data = get_sheet_data(sheet_name)
+    dates = pd.to_datetime(data[date_column], format="%d-%B-%Y", errors="coerce").dt.date
+
+    mask = dates.notna() & (dates >= start) & (dates <= end)
+    if condition is not None:
+        mask &= data[condition[0]] == condition[1]
+
+    return int(mask.sum())
+
+
+@pytest.mark.parametrize("sheet_name", ["USA", "UK"])
+@pytest.mark.parametrize("metric", list(DAILY_METRICS))
+@pytest.mark.parametrize("start, end", RANGES)
+def test_range_total_matches_mask_count(sheet_name, metric, start, end):
+    assert range_total(sheet_name, metric, start, end) == _mask_count(sheet_name, metric, start, end)
+
+
+def test_range_total_of_a_missing_metric():
+    assert range_total("Printing", "Attained", date(YEAR, 1, 1), date(YEAR, 12, 31)) == 0
@@ -0,0 +1,122 @@
+"""The typed frames and the sheet query loaders return the rows the original string path did"""
+from datetime import date, datetime
+
+import pandas as pd
+import pytest
+
+from API_loader import get_sheet_data
+from data_loader import load_data, load_data_year, load_data_search, load_data_filter, load_reviews_year, \
+    load_reviews_filter
+from sheet_query import REVIEW_BRANDS
+from typed_frames import get_typed_slice
+
+YEAR = datetime.now().year - 1
+
+# Columns compared as the sheet text, the date ones after formatting
+COLUMNS = ["Name", "Email", "Book Name & Link", "Brand", "Project Manager", "Platform", "Publishing Date", "Status",
+           "Trustpilot Review"]
+
+
+def _string_path(sheet_name: str, date_column: str = "Publishing Date") -> pd.DataFrame:
+    """The sheet as the loaders used to read it: every cell a string, dates parsed on each call"""
+    data = get_sheet_data(sheet_name)
+    return data.assign(**{date_column: pd.to_datetime(data[date_column], format="%d-%B-%Y", errors="coerce")})
+
+
+def _rows(data: pd.DataFrame) -> list[tuple]:
+    """The compared columns of every row in order, dates formatted like the sheet"""
+    if data.empty:
+        return []
+
+    data = data[COLUMNS].copy()
+    if pd.api.types.is_datetime64_any_dtype(data["Publishing Date"]):
+        data["Publishing Date"] = data["Publishing Date"].dt.strftime("%d-%B-%Y")
+
+    return list(data.astype(object).where(data.notna(), None).itertuples(index=False, name=None))
+
+
+def _published_between(sheet_name: str, start: date, end: date) -> pd.DataFrame:
+    data = _string_path(sheet_name)
+    dates = data["Publishing Date"].dt.date
+    return data[(dates >= start) & (dates <= end)].sort_values("Publishing Date", kind="stable")
+
+
+@pytest.mark.parametrize("sheet_name", ["USA", "UK"])
+def test_typed_slice_matches_string_path(sheet_name):
+    data = _string_path(sheet_name)
+    expected = data[data["Publishing Date"].dt.year == YEAR]
+
+    typed = get_typed_slice(sheet_name, "Publishing Date", YEAR)
+
+    assert sorted(_rows(typed), key=str) == sorted(_rows(expected), key=str)
+
+
+@pytest.mark.parametrize("sheet_name", ["USA", "UK"])
+@pytest.mark.parametrize("month", [1, 6, 12])
+def test_load_data_month(sheet_name, month):
+    data = _string_path(sheet_name)
+    expected = data[(data["Publishing Date"].dt.year == YEAR) & (data["Publishing Date"].dt.month == month)]
+
+    result = load_data(sheet_name, month, YEAR)
+
+    assert _rows(result) == _rows(expected.sort_values("Publishing Date", kind="stable"))
+    assert list(result.index) == list(range(1, len(result) + 1))
+
+
+@pytest.mark.parametrize("sheet_name", ["USA", "UK"])
+def test_load_data_year(sheet_name):
+    expected = _published_between(sheet_name, date(YEAR, 1, 1), date(YEAR, 12, 31))
+
+    assert _rows(load_data_year(sheet_name, YEAR)) == _rows(expected)
+
+
+def test_load_data_search():
+    expected = _published_between("USA", date(YEAR - 1, 1, 1), date(YEAR, 12, 31))
+
+    assert _rows(load_data_search("USA", YEAR, YEAR - 1)) == _rows(expected)
+
+
+@pytest.mark.parametrize("start, end", [
+    (date(YEAR, 3, 10), date(YEAR, 5, 20)),
+    (date(YEAR - 1, 11, 15), date(YEAR, 2, 3)),
+    (date(YEAR, 7, 4), date(YEAR, 7, 4)),
+])
+def test_load_data_filter(start, end):
+    expected = _published_between("USA", start, end)
+
+    assert _rows(load_data_filter("USA", start, end)) == _rows(expected)
+
+
+def test_load_data_filter_first_books():
+    start, end = date(YEAR, 3, 10), date(YEAR, 9, 20)
+    # Each client's first book of the years read, kept only if it falls in the range
+    first_books = _published_between("USA", date(YEAR, 1, 1), date(YEAR, 12, 31)).drop_duplicates("Name")
+    dates = first_books["Publishing Date"].dt.date
+    expected = first_books[(dates >= start) & (dates <= end)]
+
+    assert _rows(load_data_filter("USA", start, end, remove_duplicates=True)) == _rows(expected)
+
+
+def _pm_reviews(sheet_name: str, name: str, type_: str, start: date, end: date) -> pd.DataFrame:
+    data = _string_path(sheet_name, "Trustpilot Review Date")
+    dates = data["Trustpilot Review Date"].dt.date
+    data = data[(dates >= start) & (dates <= end) & (data["Project Manager"] == name) &
+                (data["Trustpilot Review"] == type_) & data["Brand"].isin(REVIEW_BRANDS)]
+
+    return data.sort_values("Trustpilot Review Date", kind="stable").drop_duplicates(subset=["Name"])
+
+
+@pytest.mark.parametrize("type_", ["Attained", "Negative", "Pending"])
+def test_load_reviews_year(type_):
+    pm = get_sheet_data("USA")["Project Manager"].mode()[0]
+    expected = _pm_reviews("USA", pm, type_, date(YEAR, 1, 1), date(YEAR, 12, 31))
+
+    assert _rows(load_reviews_year("USA", YEAR, pm, type_)) == _rows(expected)
+
+
+def test_load_reviews_filter():
+    pm = get_sheet_data("UK")["Project Manager"].mode()[0]
+    start, end = date(YEAR, 2, 14), date(YEAR, 10, 1)
+    expected = _pm_reviews("UK", pm, "Attained", start, end)
+
+    assert _rows(load_reviews_filter("UK", start, end, pm, "Attained")) == _rows(expected)
@@ -0,0 +1,88 @@
+"""An incremental tail sync leaves the same sheet and typed frame as reading the sheet again in full"""
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+import API_loader
+import snapshot_store
+from API_loader import SYNC_WINDOW, get_sheet_data, get_sheet_version, get_sync_delta, refresh_sheets
+from conftest import reset_sheet_store
+from data_sources import LocalDirectorySource
+from typed_frames import SHEET_SCHEMAS, build_typed_frame, get_typed_frame, get_typed_slice
+
+
+@pytest.fixture
+def sheet_dir(tmp_path, monkeypatch, fixture_dir):
+    """A copy of the USA and UK sheets that a test can edit, read by an empty sheet store"""
+    for sheet_name in ("USA", "UK"):
+        shutil.copy(os.path.join(fixture_dir, f"{sheet_name}.parquet"), tmp_path)
+
+    source = LocalDirectorySource(str(tmp_path))
+    monkeypatch.setattr(API_loader, "get_data_source", lambda: source)
+    monkeypatch.setattr(snapshot_store, "SNAPSHOT_DIR", str(tmp_path / "snapshots"))
+    reset_sheet_store()
+    yield tmp_path
+    reset_sheet_store()
+
+
+def _append_rows(data: pd.DataFrame) -> pd.DataFrame:
+    new_rows = data.iloc[:25].copy()
+    new_rows["Name"] = "New Client " + pd.Series(range(25)).astype(str).to_numpy()
+    return pd.concat([data, new_rows], ignore_index=True)
+
+
+def _edit_recent_row(data: pd.DataFrame) -> pd.DataFrame:
+    data = data.copy()
+    row = len(data) - SYNC_WINDOW // 2
+    data.loc[row, ["Trustpilot Review", "Publishing Date"]] = ["Attained", data.loc[0, "Publishing Date"]]
+    return data
+
+
+def _edit_and_append(data: pd.DataFrame) -> pd.DataFrame:
+    return _append_rows(_edit_recent_row(data))
+
+
+def _drop_last_row(data: pd.DataFrame) -> pd.DataFrame:
+    return data.iloc[:-1]
+
+
+def _unchanged(data: pd.DataFrame) -> pd.DataFrame:
+    return data
+
+
+@pytest.mark.parametrize("sheet_name", ["USA", "UK"])
+@pytest.mark.parametrize("change", [_append_rows, _edit_recent_row, _edit_and_append, _drop_last_row, _unchanged])
+def test_tail_sync_matches_full_rebuild(sheet_dir, sheet_name, change):
+    refresh_sheets([sheet_name])
+    first_version = get_sheet_version(sheet_name)
+    # Typed frame of the first version, the tail sync parses only the re-read rows on top of it
+    get_typed_frame(sheet_name)
+    get_typed_slice(sheet_name, "Publishing Date", pd.Timestamp.now().year - 1)
+
+    path = sheet_dir / f"{sheet_name}.parquet"
+    change(pd.read_parquet(path)).to_parquet(path, index=False)
+    refresh_sheets([sheet_name])
+
+    if change is _unchanged:
+        assert get_sheet_version(sheet_name) == first_version
+        assert get_sync_delta(sheet_name) is None
+    else:
+        assert get_sheet_version(sheet_name) != first_version
+        assert get_sync_delta(sheet_name) is not None
+
+    synced = get_sheet_data(sheet_name)
+    synced_typed = get_typed_frame(sheet_name)
+    synced_version = get_sheet_version(sheet_name)
+
+    full = LocalDirectorySource(str(sheet_dir)).fetch_sheet(sheet_name)
+    pd.testing.assert_frame_equal(synced, full)
+    pd.testing.assert_frame_equal(synced_typed, build_typed_frame(full, SHEET_SCHEMAS[sheet_name]))
+
+    # Reading the same sheet in full from an empty store gives the same version and typed frame
+    reset_sheet_store()
+    refresh_sheets([sheet_name])
+    assert get_sync_delta(sheet_name) is None
+    assert get_sheet_version(sheet_name) == synced_version
+    pd.testing.assert_frame_equal(get_typed_frame(sheet_name), synced_typed)
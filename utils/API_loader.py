@@ -1,66 +1,302 @@
 import streamlit as st
-import gspread
-from google.oauth2.service_account import Credentials
+import hashlib
+import json
 import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+import numpy as np
 import pandas as pd
+from data_sources import get_data_source
+from snapshot_store import read_snapshot, write_snapshot
 
-creds_dict = {
-    "type": st.secrets["connections"]["gsheets"]["type"],
-    "project_id": st.secrets["connections"]["gsheets"]["project_id"],
-    "private_key_id": st.secrets["connections"]["gsheets"]["private_key_id"],
-    "private_key": st.secrets["connections"]["gsheets"]["private_key"].replace("\\n", "\n"),
-    "client_email": st.secrets["connections"]["gsheets"]["client_email"],
-    "client_id": st.secrets["connections"]["gsheets"]["client_id"],
-    "auth_uri": st.secrets["connections"]["gsheets"]["auth_uri"],
-    "token_uri": st.secrets["connections"]["gsheets"]["token_uri"],
-    "auth_provider_x509_cert_url": st.secrets["connections"]["gsheets"]["auth_provider_x509_cert_url"],
-    "client_x509_cert_url": st.secrets["connections"]["gsheets"]["client_x509_cert_url"]
-}
-# Google Sheets setup
-SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
-# creds = Credentials.from_service_account_file("credentials.json", scopes=SCOPES)
-SPREADSHEET_ID = st.secrets["connections"]["gsheets"]["SPREADSHEET_ID"]
-
-@st.cache_resource
-def get_gsheets_client(creds_dict: dict, spreadsheet_id: str):
-    """Create and cache Google Sheets client + spreadsheet"""
-    creds = Credentials.from_service_account_info(
-        creds_dict,
-        scopes=SCOPES
-    )
-    client = gspread.authorize(creds)
-    spreadsheet = client.open_by_key(spreadsheet_id)
-    return spreadsheet
-
-spreadsheet = get_gsheets_client(creds_dict, SPREADSHEET_ID)
-
-
-def normalize_name(name):
-    """Normalize a name to consistent format (Title Case, stripped whitespace)"""
-    if pd.isna(name) or name == "":
-        return ""
-    return str(name).strip().title()
+# Stored sheets and the frames derived from them are shared by every session, and readers get
+# shallow copies of them. That is only safe with pandas copy-on-write, which the entry points
+# (App_Streamlit.py, ReviewManager.py) turn on before importing this module.
 
+# Every worksheet the dashboard reads, fetched together in one batch request
+SHEET_NAMES = ["USA", "UK", "AudioBook", "Printing", "Copyright", "A_plus", "Sales", "Nielsen ISBN"]
 
-@st.cache_data(ttl=1800)
-def get_sheet_data(sheet_name: str) -> pd.DataFrame:
-    """Get data from Google Sheets using gspread"""
+
+def _row_hashes(data: pd.DataFrame) -> np.ndarray:
+    """One 64-bit hash per sheet row"""
+    return pd.util.hash_pandas_object(data, index=False).to_numpy()
+
+
+def _fingerprint(columns: list[str], row_hashes: np.ndarray) -> str:
+    """Content hash of a sheet (headers + every row), equal fingerprints mean identical data"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps(columns).encode())
+    digest.update(row_hashes.tobytes())
+    return digest.hexdigest()
+
+
+def fetch_sheets(sheet_names: list[str] | None = None,
+                 tails: dict[str, tuple[int, int]] | None = None) -> dict[str, pd.DataFrame]:
+    """Get the given sheets (default: every registered sheet) from the data source in one request.
+
+    Sheets listed in tails as (first_row, width) are only read from that sheet row down,
+    the returned frame then holds the header and those rows.
+    """
+    return get_data_source().fetch_sheets(sheet_names or SHEET_NAMES, tails)
+
+
+SHEET_TTL = 1800
+# The background refresher re-fetches a sheet this many seconds before its TTL runs out
+REFRESH_MARGIN = 120
+REFRESH_RETRY = 60
+
+# USA and UK only grow at the bottom (plus edits to recent rows), so they are synced
+# incrementally: only the rows after the last synced one plus SYNC_WINDOW recent rows are re-read
+INCREMENTAL_SHEETS = ["USA", "UK"]
+SYNC_WINDOW = int(os.getenv("SYNC_WINDOW", "200"))
+# Incrementally synced sheets are still fully re-read this often, to pick up older edits and deletions
+FULL_SYNC_INTERVAL = 6 * 3600
+
+# Process-wide sheet store shared by every session, refreshed from the data source
+# and mirrored to Parquet snapshots so a restart can serve data straight away
+_sheet_store: dict[str, pd.DataFrame] = {}
+_fetched_at: dict[str, datetime] = {}
+_fingerprints: dict[str, str] = {}
+_row_hash_store: dict[str, np.ndarray] = {}
+_full_synced_at: dict[str, datetime] = {}
+# Incremental sync bookkeeping: sheet name -> (previous fingerprint, leading rows kept from it)
+_sync_deltas: dict[str, tuple[str, int]] = {}
+_store_lock = threading.Lock()
+_refresher_started = False
+
+# Single-flight bookkeeping: sheet name -> event set when its in-progress fetch ends
+_inflight: dict[str, threading.Event] = {}
+
+
+def _sync_sheets(sheet_names: list[str]) -> None:
+    """Fetch sheets (incrementally where possible) and swap the changed ones into the store"""
+    now = datetime.now(timezone.utc)
+    with _store_lock:
+        tails = {
+            sheet_name: (max(len(_sheet_store[sheet_name]) - SYNC_WINDOW, 0) + 2, _sheet_store[sheet_name].shape[1])
+            for sheet_name in sheet_names
+            if sheet_name in INCREMENTAL_SHEETS and sheet_name in _full_synced_at and
+            (now - _full_synced_at[sheet_name]).total_seconds() < FULL_SYNC_INTERVAL
+        }
+        stored = {sheet_name: (_sheet_store[sheet_name], _row_hash_store[sheet_name]) for sheet_name in tails}
+
+    fetched = fetch_sheets(sheet_names, tails)
+    fetched_at = datetime.now(timezone.utc)
+
+    # A changed header means the rows can no longer be lined up, so read those sheets in full
+    resync = [sheet_name for sheet_name in tails
+              if list(fetched[sheet_name].columns) != list(stored[sheet_name][0].columns)]
+    if resync:
+        fetched.update(fetch_sheets(resync))
+    for sheet_name in resync:
+        del tails[sheet_name]
+
+    sheets, row_hashes, kept_rows = {}, {}, {}
+    for sheet_name, data in fetched.items():
+        if sheet_name in tails:
+            # Rows above the re-read window are kept from the stored copy
+            kept_rows[sheet_name] = tails[sheet_name][0] - 2
+            base, base_hashes = stored[sheet_name]
+            sheets[sheet_name] = pd.concat([base.iloc[:kept_rows[sheet_name]], data], ignore_index=True)
+            row_hashes[sheet_name] = np.concatenate([base_hashes[:kept_rows[sheet_name]], _row_hashes(data)])
+        else:
+            sheets[sheet_name] = data
+            row_hashes[sheet_name] = _row_hashes(data)
+
+    fingerprints = {sheet_name: _fingerprint(list(data.columns), row_hashes[sheet_name])
+                    for sheet_name, data in sheets.items()}
+
+    with _store_lock:
+        changed = [sheet_name for sheet_name in sheets
+                   if _fingerprints.get(sheet_name) != fingerprints[sheet_name]]
+
+    # Unchanged sheets keep their stored frame (and every cache keyed on its
+    # fingerprint), only the fetch time moves forward
+    for sheet_name in changed:
+        write_snapshot(sheet_name, sheets[sheet_name], fetched_at)
+
+    with _store_lock:
+        for sheet_name in changed:
+            if sheet_name in kept_rows and sheet_name in _fingerprints:
+                _sync_deltas[sheet_name] = (_fingerprints[sheet_name], kept_rows[sheet_name])
+            else:
+                _sync_deltas.pop(sheet_name, None)
+
+            _sheet_store[sheet_name] = sheets[sheet_name]
+            _row_hash_store[sheet_name] = row_hashes[sheet_name]
+            _fingerprints[sheet_name] = fingerprints[sheet_name]
+
+        _fetched_at.update({sheet_name: fetched_at for sheet_name in sheets})
+        _full_synced_at.update({sheet_name: fetched_at for sheet_name in sheets if sheet_name not in tails})
+
+
+def refresh_sheets(sheet_names: list[str] | None = None) -> None:
+    """Re-fetch only the given sheets (default: all), joining any fetch already running for them"""
+    sheet_names = sheet_names or SHEET_NAMES
+
+    with _store_lock:
+        running = {_inflight[sheet_name] for sheet_name in sheet_names if sheet_name in _inflight}
+        to_fetch = [sheet_name for sheet_name in sheet_names if sheet_name not in _inflight]
+        done = threading.Event()
+        for sheet_name in to_fetch:
+            _inflight[sheet_name] = done
+
+    try:
+        if to_fetch:
+            _sync_sheets(to_fetch)
+    finally:
+        with _store_lock:
+            for sheet_name in to_fetch:
+                _inflight.pop(sheet_name, None)
+        done.set()
+
+    for event in running:
+        event.wait()
+
+
+def _seconds_until_due() -> float:
+    """Seconds until the next registered sheet should be re-fetched"""
+    now = datetime.now(timezone.utc)
+    with _store_lock:
+        ages = [(now - _fetched_at[sheet_name]).total_seconds() if sheet_name in _fetched_at else SHEET_TTL
+                for sheet_name in SHEET_NAMES]
+
+    return SHEET_TTL - REFRESH_MARGIN - max(ages)
+
+
+def _refresh_loop(revalidate: bool) -> None:
+    """Re-fetch sheets shortly before their TTL runs out so readers never wait on Google Sheets"""
+    while True:
+        try:
+            if revalidate:
+                refresh_sheets()
+                revalidate = False
+            else:
+                now = datetime.now(timezone.utc)
+                with _store_lock:
+                    due = [sheet_name for sheet_name in SHEET_NAMES
+                           if sheet_name not in _fetched_at or
+                           (now - _fetched_at[sheet_name]).total_seconds() >= SHEET_TTL - REFRESH_MARGIN]
+                if due:
+                    refresh_sheets(due)
+        except Exception as e:
+            print(f"Error refreshing sheets in background: {e}")
+            logging.error(f"Error refreshing sheets in background: {e}")
+            time.sleep(REFRESH_RETRY)
+            continue
+
+        time.sleep(min(max(_seconds_until_due(), 1), SHEET_TTL))
+
+
+def start_background_refresher(revalidate: bool = False) -> None:
+    """Start the process-wide refresher thread once, revalidate re-fetches everything first"""
+    global _refresher_started
+    with _store_lock:
+        if _refresher_started:
+            return
+        _refresher_started = True
+
+    threading.Thread(target=_refresh_loop, args=(revalidate,), name="sheet-refresher", daemon=True).start()
+
+
+def _load_snapshots() -> None:
+    """Fill the store from the on-disk snapshots (caller holds the store lock)"""
+    for sheet_name in SHEET_NAMES:
+        snapshot = read_snapshot(sheet_name)
+        if snapshot is not None:
+            data, _fetched_at[sheet_name] = snapshot
+            _sheet_store[sheet_name] = data
+            _row_hash_store[sheet_name] = _row_hashes(data)
+            _fingerprints[sheet_name] = _fingerprint(list(data.columns), _row_hash_store[sheet_name])
+
+
+def get_all_sheet_data() -> dict[str, pd.DataFrame]:
+    """Get every registered sheet, always served from the last good copy in memory or on disk"""
+    with _store_lock:
+        cold_start = not _sheet_store
+        if cold_start:
+            _load_snapshots()
+
+        has_data = bool(_sheet_store)
+
+    if not has_data:
+        # Nothing to serve yet, so this one caller waits for the first fetch
+        refresh_sheets()
+
+    # Snapshots loaded from disk are served straight away and revalidated in the background
+    start_background_refresher(revalidate=cold_start and has_data)
+
+    with _store_lock:
+        return dict(_sheet_store)
+
+
+def get_snapshot_time() -> datetime | None:
+    """Fetch time of the oldest sheet currently being served"""
     try:
-        worksheet = spreadsheet.worksheet(sheet_name)
-        raw_data = worksheet.get_all_values()
+        get_all_sheet_data()
+    except Exception as e:
+        logging.error(f"Error loading sheets: {e}")
+
+    with _store_lock:
+        return min(_fetched_at.values(), default=None)
+
+
+def get_sheet_version(sheet_name: str) -> str | None:
+    """Content fingerprint of the stored copy of a sheet, None for sheets outside the store"""
+    with _store_lock:
+        return _fingerprints.get(sheet_name)
 
-        if not raw_data:
-            return pd.DataFrame()
 
-        headers = raw_data[0]
-        rows = raw_data[1:]
+def get_row_hashes(sheet_name: str) -> tuple[str | None, np.ndarray | None]:
+    """(fingerprint, one hash per row) of the stored copy of a sheet, read together"""
+    with _store_lock:
+        return _fingerprints.get(sheet_name), _row_hash_store.get(sheet_name)
 
-        data = pd.DataFrame(rows, columns=headers)
-        if "Project Manager" in data.columns:
-            data["Project Manager"] = data["Project Manager"].apply(normalize_name)
 
-        return data
+def get_sync_delta(sheet_name: str) -> tuple[str, int] | None:
+    """(previous fingerprint, leading rows unchanged since it) when a sheet was last updated incrementally"""
+    with _store_lock:
+        return _sync_deltas.get(sheet_name)
+
+
+def get_data_version(sheet_names: list[str]) -> str | None:
+    """Combined fingerprint of several sheets, None if any of them is outside the store"""
+    try:
+        get_all_sheet_data()
+    except Exception as e:
+        logging.error(f"Error loading sheets: {e}")
+
+    versions = [get_sheet_version(sheet_name) for sheet_name in sheet_names]
+    if None in versions:
+        return None
+
+    return "-".join(versions)
+
+
+@st.cache_data(ttl=1800)
+def _get_single_sheet_data(sheet_name: str) -> pd.DataFrame:
+    """Get data for one sheet outside the batch (unregistered sheets or batch failure)"""
+    try:
+        return get_data_source().fetch_sheet(sheet_name)
     except Exception as e:
         print(f"Error getting data from sheet {sheet_name}: {e}")
         logging.error(f"Error getting data from sheet {sheet_name}: {e}")
-        return pd.DataFrame()
\ No newline at end of file
+        return pd.DataFrame()
+
+
+def get_sheet_data(sheet_name: str) -> pd.DataFrame:
+    """Get data from the configured data source, served from the shared batch cache"""
+    try:
+        sheets = get_all_sheet_data()
+    except Exception as e:
+        print(f"Error getting batch data from sheets: {e}")
+        logging.error(f"Error getting batch data from sheets: {e}")
+        sheets = {}
+
+    if sheet_name in sheets:
+        # Callers may modify the frame, the copy keeps those writes away from the stored one
+        return sheets[sheet_name].copy(deep=False)
+
+    return _get_single_sheet_data(sheet_name)
@@ -0,0 +1,163 @@
+import hashlib
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+from rapidfuzz import fuzz
+from rapidfuzz.process import cdist
+
+from API_loader import get_sheet_version
+from typed_frames import TEXT_DTYPE, get_typed_frame
+
+# Lowest fuzz.ratio (0-100) of two name keys that still counts as the same client. 92 joins
+# "jon smith" / "john smith" (95) but keeps "joan smith" / "john smith" (90) apart.
+MATCH_SCORE = int(os.getenv("CLIENT_MATCH_SCORE", "92"))
+# Threads rapidfuzz scores a block with, -1 for every core
+MATCH_WORKERS = int(os.getenv("CLIENT_MATCH_WORKERS", min(4, os.cpu_count() or 1)))
+
+# sheet name -> (version, client of every name spelling)
+_identity_cache: dict[str, tuple[str, pd.DataFrame]] = {}
+_identity_lock = threading.Lock()
+
+
+def name_keys(names: pd.Series) -> pd.Series:
+    """Match key of each name: lower case, punctuation dropped and the words in sorted order"""
+    words = names.astype(TEXT_DTYPE).str.lower().str.replace(r"[^\w\s]", " ", regex=True).str.split()
+    return words.map(lambda tokens: " ".join(sorted(tokens)), na_action="ignore")
+
+
+def _block_members(block: pd.Series) -> list[np.ndarray]:
+    """Key codes (the block's index) of every block label shared by more than one key"""
+    labels, _ = pd.factorize(block)
+    sizes = np.bincount(labels[labels >= 0])
+    shared = (labels >= 0) & (sizes[np.maximum(labels, 0)] > 1)
+
+    order = np.argsort(labels[shared], kind="stable")
+    members = block.index.to_numpy(dtype=np.int64)[shared][order]
+    return np.split(members, np.cumsum(sizes[sizes > 1])[:-1]) if len(members) else []
+
+
+def _block_pairs(keys: np.ndarray, members: np.ndarray) -> np.ndarray:
+    """Pairs of key codes in one block whose keys score at least MATCH_SCORE"""
+    scores = cdist(keys[members], keys[members], scorer=fuzz.ratio, score_cutoff=MATCH_SCORE,
+                   dtype=np.uint8, workers=MATCH_WORKERS)
+    first, second = np.nonzero(np.triu(scores, 1))
+    return np.column_stack([members[first], members[second]])
+
+
+def _cluster(pairs: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Cluster number of every key code: the heaviest key left starts a cluster and takes its unclustered matches.
+
+    Matches are not followed any further, so "joan smith" is not pulled in through "jon smith" into
+    "john smith" when it does not match "john smith" itself.
+    """
+    pairs = np.concatenate([pairs, pairs[:, ::-1]])
+    pairs = pairs[np.argsort(pairs[:, 0], kind="stable")]
+    starts = np.searchsorted(pairs[:, 0], np.arange(len(weights) + 1))
+
+    # Keys without a match are clusters of their own, only the matched ones are walked
+    clusters = np.where(starts[1:] > starts[:-1], -1, np.arange(len(weights)))
+    order = np.lexsort((np.arange(len(weights)), -weights))
+    for code in order[clusters[order] < 0]:
+        if clusters[code] >= 0:
+            continue
+        matches = pairs[starts[code]:starts[code + 1], 1]
+        clusters[code] = code
+        clusters[matches[clusters[matches] < 0]] = code
+
+    return clusters
+
+
+def build_client_identities(data: pd.DataFrame) -> pd.DataFrame:
+    """Client of every Name spelling in a typed sheet, indexed by the spelling.
+
+    Spellings with the same key (see name_keys) are one client. Keys are then only compared within
+    blocks (the keys sharing the initials of their first and last word and their digits, and the
+    keys sharing an Email), and keys scoring at least MATCH_SCORE are clustered around the most
+    used key (see _cluster). Each client gets an ID hashed from its smallest key, so it does not
+    depend on the row order, and is shown under its most used spelling.
+    """
+    if data.empty or "Name" not in data.columns:
+        return pd.DataFrame(columns=["Client ID", "Client"])
+
+    named = data["Name"].notna() & (data["Name"] != "")
+    spellings = data["Name"][named].value_counts(sort=False)
+    if spellings.empty:
+        return pd.DataFrame(columns=["Client ID", "Client"])
+
+    key_codes, keys = pd.factorize(name_keys(spellings.index.to_series()), sort=True)
+    keys = np.asarray(keys, dtype=object)
+
+    # Digits are part of the block, "client 3496" is never a typo of "client 31496"
+    key_series = pd.Series(keys, dtype=TEXT_DTYPE)
+    blocks = [key_series.str[:1] + key_series.str.split().str[-1].str[:1] + " "
+              + key_series.str.replace(r"\D", "", regex=True)]
+    if "Email" in data.columns:
+        emails = data["Email"][named].astype(TEXT_DTYPE).str.strip().str.lower()
+        has_email = emails.str.contains("@", regex=False).fillna(False).to_numpy(dtype=bool)
+        codes_by_row = key_codes[spellings.index.get_indexer(data["Name"][named])]
+        by_email = pd.DataFrame({"Email": emails[has_email].to_numpy(), "Key": codes_by_row[has_email]})
+        blocks.append(by_email.drop_duplicates().set_index("Key")["Email"])
+
+    pairs = [np.empty((0, 2), dtype=np.int64)]
+    for block in blocks:
+        pairs += [_block_pairs(keys, members) for members in _block_members(block)]
+
+    weights = np.bincount(key_codes, weights=spellings.to_numpy(), minlength=len(keys))
+    groups = _cluster(np.unique(np.concatenate(pairs), axis=0), weights)
+    table = pd.DataFrame({
+        "Name": spellings.index.to_numpy(dtype=object),
+        "Rows": spellings.to_numpy(),
+        "Group": groups[key_codes],
+        "Code": key_codes,
+    })
+
+    # Key codes are in key order, so the smallest code is the smallest key
+    smallest_code = table.groupby("Group")["Code"].min()
+    client_ids = pd.Series([hashlib.blake2b(key.encode(), digest_size=6).hexdigest() for key in keys[smallest_code]],
+                           index=smallest_code.index)
+    most_used = table.sort_values(["Rows", "Name"], ascending=[False, True]).drop_duplicates("Group")
+    shown = most_used.set_index("Group")["Name"]
+
+    return pd.DataFrame({
+        "Client ID": client_ids.reindex(table["Group"]).to_numpy(),
+        "Client": shown.reindex(table["Group"]).to_numpy(),
+    }, index=pd.Index(table["Name"], name="Name"))
+
+
+def get_client_identities(sheet_name: str) -> pd.DataFrame:
+    """Client of every Name spelling of a sheet, resolved once per sheet version"""
+    version = get_sheet_version(sheet_name)
+
+    with _identity_lock:
+        cached = _identity_cache.get(sheet_name)
+    if version is not None and cached is not None and cached[0] == version:
+        return cached[1]
+
+    identities = build_client_identities(get_typed_frame(sheet_name))
+    if version is not None:
+        with _identity_lock:
+            _identity_cache[sheet_name] = (version, identities)
+
+    return identities
+
+
+def resolve_clients(sheet_name: str, names: pd.Series, column: str = "Client") -> pd.Series:
+    """The client name (or "Client ID" with column) of each name, names the sheet lacks kept as they are"""
+    identities = get_client_identities(sheet_name)
+    positions = identities.index.get_indexer(names)
+    resolved = identities[column].to_numpy(dtype=object)[positions]
+
+    return pd.Series(np.where(positions >= 0, resolved, names.to_numpy(dtype=object)),
+                     index=names.index, name=names.name, dtype=names.dtype)
+
+
+def client_names(sheet_name: str, client_ids) -> np.ndarray:
+    """The shown name of each client ID, values that are not client IDs of the sheet kept as they are"""
+    identities = get_client_identities(sheet_name)
+    shown = identities.drop_duplicates("Client ID").set_index("Client ID")["Client"]
+    client_ids = np.asarray(client_ids, dtype=object)
+    positions = shown.index.get_indexer(client_ids)
+
+    return np.where(positions >= 0, shown.to_numpy(dtype=object)[positions], client_ids)
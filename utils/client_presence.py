@@ -0,0 +1,142 @@
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from API_loader import get_sheet_version
+from client_identity import client_names, resolve_clients
+from typed_frames import get_typed_frame
+
+# Number of set bits in every byte value, to count a client's active months in a packed row
+_BIT_COUNTS = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.uint8)
+
+
+@dataclass(frozen=True)
+class ClientPresence:
+    """Which months each client was published in, one packed bit row per client.
+
+    Bit p of a row (little-endian inside each byte) is set when the client has a row dated in
+    period first_period + p, periods counting months since year 0 like the summary rollup.
+    """
+    names: np.ndarray
+    first_period: int
+    bits: np.ndarray
+
+    @property
+    def periods(self) -> int:
+        """Number of periods a row has room for"""
+        return self.bits.shape[1] * 8
+
+
+# sheet name -> (version, presence of its clients)
+_presence_cache: dict[str, tuple[str, ClientPresence]] = {}
+_presence_lock = threading.Lock()
+
+
+def period_bounds(year: int, month: int | None = None) -> tuple[int, int]:
+    """First and last period of a month, or of a whole year without one"""
+    if month:
+        return year * 12 + month - 1, year * 12 + month - 1
+    return year * 12, year * 12 + 11
+
+
+def build_client_presence(data: pd.DataFrame, date_column: str = "Publishing Date") -> ClientPresence:
+    """Client x month presence of a typed sheet, clients in name order"""
+    if data.empty or "Name" not in data.columns or date_column not in data.columns:
+        return ClientPresence(np.array([], dtype=object), 0, np.zeros((0, 1), dtype=np.uint8))
+
+    rows = (data[date_column].notna() & data["Name"].notna()).to_numpy()
+    dates = data[date_column][rows]
+    periods = (dates.dt.year * 12 + dates.dt.month - 1).to_numpy().astype(np.int64)
+    codes, names = pd.factorize(data["Name"][rows], sort=True)
+    if len(periods) == 0:
+        return ClientPresence(np.array([], dtype=object), 0, np.zeros((0, 1), dtype=np.uint8))
+
+    first_period = int(periods.min())
+    presence = np.zeros((len(names), int(periods.max()) - first_period + 1), dtype=bool)
+    presence[codes, periods - first_period] = True
+
+    return ClientPresence(np.asarray(names, dtype=object), first_period,
+                          np.packbits(presence, axis=1, bitorder="little"))
+
+
+def get_client_presence(sheet_name: str) -> ClientPresence:
+    """Client x month presence of a sheet, built once per sheet version"""
+    version = get_sheet_version(sheet_name)
+
+    with _presence_lock:
+        cached = _presence_cache.get(sheet_name)
+    if version is not None and cached is not None and cached[0] == version:
+        return cached[1]
+
+    # Spellings of one client (see client_identity) share a row, keyed by the client ID
+    data = get_typed_frame(sheet_name)
+    if "Name" in data.columns:
+        data = data.assign(Name=resolve_clients(sheet_name, data["Name"], column="Client ID"))
+    presence = build_client_presence(data)
+    if version is not None:
+        with _presence_lock:
+            _presence_cache[sheet_name] = (version, presence)
+
+    return presence
+
+
+def window_mask(presence: ClientPresence, first: int, last: int) -> np.ndarray:
+    """Packed row with the bits of periods first..last set (periods outside the index are left out)"""
+    offsets = np.arange(first, last + 1) - presence.first_period
+    flags = np.zeros(presence.periods, dtype=bool)
+    flags[offsets[(offsets >= 0) & (offsets < presence.periods)]] = True
+
+    return np.packbits(flags, bitorder="little")
+
+
+def active_in(presence: ClientPresence, first: int, last: int) -> np.ndarray:
+    """Whether each client was published in any period of first..last"""
+    return (presence.bits & window_mask(presence, first, last)).any(axis=1)
+
+
+def active_month_counts(presence: ClientPresence, first: int, last: int) -> np.ndarray:
+    """How many months of first..last each client was published in"""
+    return _BIT_COUNTS[presence.bits & window_mask(presence, first, last)].sum(axis=1, dtype=np.int64)
+
+
+def clients_in_periods(sheet_name: str, periods: list[tuple[int, int | None]]) -> list[str]:
+    """IDs of the clients published in every one of the periods, each a (year, month) or a whole year as (year, None)"""
+    presence = get_client_presence(sheet_name)
+    found = np.ones(len(presence.names), dtype=bool)
+    for year, month in periods:
+        found &= active_in(presence, *period_bounds(year, month))
+
+    return presence.names[found].tolist()
+
+
+def active_clients(sheet_name: str, min_months: int, last_months: int, end_year: int,
+                   end_month: int) -> pd.DataFrame:
+    """Clients published in at least min_months of the last_months months up to end_month of end_year.
+
+    One row per client (most active first, then by name) with its active month count and a
+    True / False column per month of the window, oldest first.
+    """
+    presence = get_client_presence(sheet_name)
+    last = end_year * 12 + end_month - 1
+    first = last - last_months + 1
+
+    counts = active_month_counts(presence, first, last)
+    found = np.flatnonzero(counts >= max(min_months, 1))
+
+    # Only the found clients' rows are unpacked, into one column per month of the window
+    offsets = np.arange(first, last + 1) - presence.first_period
+    in_index = (offsets >= 0) & (offsets < presence.periods)
+    unpacked = np.unpackbits(presence.bits[found], axis=1, bitorder="little").astype(bool)
+    months = np.zeros((len(found), last_months), dtype=bool)
+    months[:, in_index] = unpacked[:, offsets[in_index]]
+
+    labels = pd.to_datetime(pd.DataFrame({"year": np.arange(first, last + 1) // 12,
+                                          "month": np.arange(first, last + 1) % 12 + 1, "day": 1}))
+    table = pd.DataFrame(months, columns=labels.dt.strftime("%B %Y").tolist())
+    table.insert(0, "Active Months", counts[found])
+    table.insert(0, "Name", client_names(sheet_name, presence.names[found]))
+    table = table.sort_values(["Active Months", "Name"], ascending=[False, True], kind="stable")
+    table.index = range(1, len(table) + 1)
+
+    return table
@@ -0,0 +1,84 @@
+import threading
+from datetime import date
+
+import numpy as np
+import pandas as pd
+from API_loader import get_sheet_version
+from typed_frames import get_typed_frame
+
+# Metrics kept as running daily totals: metric -> (date column, the (column, value) a row must have
+# to count, None for every dated row). They answer "is there anything in this date range" for the
+# summary pages and the custom-range loaders, whose own counts dedupe clients and filter brands.
+DAILY_METRICS = {
+    "Published": ("Publishing Date", None),
+    "Attained": ("Trustpilot Review Date", ("Trustpilot Review", "Attained")),
+    "Negative": ("Trustpilot Review Date", ("Trustpilot Review", "Negative")),
+}
+
+# sheet name -> (version, {metric: (first day, running total)})
+_daily_cache: dict[str, tuple[str, dict[str, tuple[int, np.ndarray]]]] = {}
+_daily_lock = threading.Lock()
+
+
+def _day_number(day: date) -> int:
+    """Days since 1970-01-01"""
+    return int(np.datetime64(day, "D").astype(np.int64))
+
+
+def build_daily_totals(data: pd.DataFrame) -> dict[str, tuple[int, np.ndarray]]:
+    """Running daily row counts of every metric the sheet has the columns for.
+
+    running[i] is the metric's rows on the days before first day + i, so any day range is
+    the difference of two entries.
+    """
+    totals = {}
+    for metric, (date_column, condition) in DAILY_METRICS.items():
+        if date_column not in data.columns:
+            continue
+
+        rows = data[date_column].notna()
+        if condition is not None:
+            if condition[0] not in data.columns:
+                continue
+            rows &= data[condition[0]].eq(condition[1]).fillna(False)
+
+        days = data.loc[rows, date_column].to_numpy().astype("datetime64[D]").astype(np.int64)
+        if len(days) == 0:
+            totals[metric] = (0, np.zeros(1, dtype=np.int64))
+            continue
+
+        first_day = int(days.min())
+        daily = np.bincount(days - first_day)
+        totals[metric] = (first_day, np.concatenate([np.zeros(1, dtype=daily.dtype), np.cumsum(daily)]))
+
+    return totals
+
+
+def get_daily_totals(sheet_name: str) -> dict[str, tuple[int, np.ndarray]]:
+    """Running daily totals of a sheet, built once per sheet version"""
+    version = get_sheet_version(sheet_name)
+
+    with _daily_lock:
+        cached = _daily_cache.get(sheet_name)
+    if version is not None and cached is not None and cached[0] == version:
+        return cached[1]
+
+    totals = build_daily_totals(get_typed_frame(sheet_name))
+    if version is not None:
+        with _daily_lock:
+            _daily_cache[sheet_name] = (version, totals)
+
+    return totals
+
+
+def range_total(sheet_name: str, metric: str, start_date: date, end_date: date):
+    """A metric's rows on start_date..end_date (both included), 0 for metrics the sheet does not have"""
+    totals = get_daily_totals(sheet_name)
+    if metric not in totals:
+        return 0
+
+    first_day, running = totals[metric]
+    first = min(max(_day_number(start_date) - first_day, 0), len(running) - 1)
+    last = min(max(_day_number(end_date) - first_day + 1, 0), len(running) - 1)
+
+    return running[last] - running[first] if last > first else running[0]
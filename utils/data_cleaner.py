@@ -1,6 +1,6 @@
 import streamlit as st
 import pandas as pd
-from API_loader import get_sheet_data
+from typed_frames import get_typed_frame
 
 
 def get_min_year() -> int:
@@ -17,44 +17,22 @@ def get_min_year() -> int:
     return 2025
 
 def clean_data(data: pd.DataFrame) -> pd.DataFrame:
-    """Clean and prepare the dataframe"""
+    """Prepare a typed sheet frame (see typed_frames.get_typed_frame) for display"""
     if data.empty:
         return pd.DataFrame()
 
-    columns = list(data.columns)
-    if "Issues" in columns:
-        end_col_index = columns.index("Issues")
-        data = data.iloc[:, :end_col_index + 1]
-    date_columns = ["Publishing Date", "Last Edit (Revision)", "Trustpilot Review Date"]
-    for col in date_columns:
-        if col in data.columns:
-            data[col] = pd.to_datetime(data[col], format="%d-%B-%Y", errors="coerce")
-
-    data[["Copyright", "Issues", "Last Edit (Revision)", "Trustpilot Review Date"]] = data[
-        ["Copyright", "Issues", "Last Edit (Revision)", "Trustpilot Review Date"]].astype(str)
-
-    data[["Copyright", "Issues", "Last Edit (Revision)", "Trustpilot Review Date"]] = data[
-        ["Copyright", "Issues", "Last Edit (Revision)", "Trustpilot Review Date"]].fillna("N/A")
-
+    # Column dtypes come from SHEET_SCHEMAS and date columns stay typed, the loaders format
+    # them when they hand the frame to the UI
     return data
 
 
 def clean_data_reviews(sheet_name: str) -> pd.DataFrame:
     """Clean the data from Google Sheets"""
-    data = get_sheet_data(sheet_name)
+    data = get_typed_frame(sheet_name)
 
     if data.empty:
         return data
 
-    columns = list(data.columns)
-    if "Issues" in columns:
-        end_col_index = columns.index("Issues")
-        data = data.iloc[:, :end_col_index + 1]
-
-    for col in ["Publishing Date", "Last Edit (Revision)", "Trustpilot Review Date"]:
-        if col in data.columns:
-            data[col] = pd.to_datetime(data[col], format="%d-%B-%Y", errors="coerce")
-
     data = data.sort_values(by="Publishing Date", ascending=True)
     data.index = range(1, len(data) + 1)
 
@@ -62,4 +40,4 @@ def clean_data_reviews(sheet_name: str) -> pd.DataFrame:
 
 def safe_concat(dfs):
     dfs = [df for df in dfs if not df.empty]
-    return pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
\ No newline at end of file
+    return pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
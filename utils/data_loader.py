@@ -1,7 +1,7 @@
-from data_cleaner import get_sheet_data, clean_data, get_min_year
+from data_cleaner import get_min_year
+from daily_totals import DAILY_METRICS, range_total
+from sheet_query import SheetQuery, REVIEW_BRANDS, run_query
 import pandas as pd
-import streamlit as st
-import logging
 from datetime import datetime
 
 sheet_usa = "USA"
@@ -12,357 +12,91 @@ sheet_copyright = "Copyright"
 sheet_a_plus = "A_plus"
 sheet_sales = "Sales"
 
-def load_data(sheet_name: str, month_number: int, year: int) -> pd.DataFrame:
-    """Load data from Google Sheets with optional month filtering"""
-    try:
-        data = get_sheet_data(sheet_name)
-        data = clean_data(data)
-
-        if "Publishing Date" in data.columns:
-            data = data[(data["Publishing Date"].dt.month == month_number) & (data["Publishing Date"].dt.year == year)]
-
-        if data.empty:
-            return pd.DataFrame()
-
-        data = data.sort_values(by="Publishing Date", ascending=True)
+REVIEW_TYPES = ("Attained", "Negative", "Pending")
 
-        for col in ["Publishing Date", "Last Edit (Revision)", "Trustpilot Review Date"]:
-            if col in data.columns:
-                data[col] = pd.to_datetime(data[col], errors="coerce").dt.strftime("%d-%B-%Y")
-        # if "Name" in data.columns:
-        #     data = data.drop_duplicates(subset=["Name"])
-        data.index = range(1, len(data) + 1)
-        return data
-
-    except Exception as e:
-        st.error(f"Error loading data: {e}")
-        logging.error(f"An Error Occurred: {e}")
-        return pd.DataFrame()
+def load_data(sheet_name: str, month_number: int, year: int) -> pd.DataFrame:
+    """Load one month of a sheet by publishing date"""
+    return run_query(SheetQuery(sheet_name, "Publishing Date", year, month=month_number))
 
 
 def load_data_year(sheet_name: str, year: int) -> pd.DataFrame:
-    """Load data from Google Sheets with optional month filtering"""
-    try:
-        data = get_sheet_data(sheet_name)
-        data = clean_data(data)
+    """Load one year of a sheet by publishing date"""
+    return run_query(SheetQuery(sheet_name, "Publishing Date", year))
 
-        if "Publishing Date" in data.columns:
-            data = data[data["Publishing Date"].dt.year == year]
-
-        if data.empty:
-            return pd.DataFrame()
-
-        data = data.sort_values(by="Publishing Date", ascending=True)
-
-        for col in ["Publishing Date", "Last Edit (Revision)", "Trustpilot Review Date"]:
-            if col in data.columns:
-                data[col] = pd.to_datetime(data[col], errors="coerce").dt.strftime("%d-%B-%Y")
-        data.index = range(1, len(data) + 1)
-        return data
-
-    except Exception as e:
-        st.error(f"Error loading data: {e}")
-        logging.error(f"An Error Occurred: {e}")
-        return pd.DataFrame()
 
 def load_data_search(sheet_name: str, end_year: int, start_year: int = get_min_year()) -> pd.DataFrame:
-    """Load data from Google Sheets with optional month filtering"""
-    try:
-        data = get_sheet_data(sheet_name)
-        data = clean_data(data)
-
-        if "Publishing Date" in data.columns:
-            data = data[
-                (data["Publishing Date"].dt.year >= start_year) &
-                (data["Publishing Date"].dt.year <= end_year)
-            ]
-
-        if data.empty:
-            return pd.DataFrame()
+    """Load every year of a sheet up to end_year by publishing date"""
+    return run_query(SheetQuery(sheet_name, "Publishing Date", start_year, end_year))
 
-        data = data.sort_values(by="Publishing Date", ascending=True)
 
-        for col in ["Publishing Date", "Last Edit (Revision)", "Trustpilot Review Date"]:
-            if col in data.columns:
-                data[col] = pd.to_datetime(data[col], errors="coerce").dt.strftime("%d-%B-%Y")
-        data.index = range(1, len(data) + 1)
-        return data
-
-    except Exception as e:
-        st.error(f"Error loading data: {e}")
-        logging.error(f"An Error Occurred: {e}")
+def load_data_filter(sheet_name: str, start_date: datetime, end_date: datetime,
+                     remove_duplicates: bool = False) -> pd.DataFrame:
+    """Load a custom date range of a sheet, remove_duplicates keeps only each client's first book"""
+    # Ranges without a single publishing date are answered from the daily totals, without a query
+    if range_total(sheet_name, "Published", start_date, end_date) == 0:
         return pd.DataFrame()
 
-def load_data_filter(sheet_name: str, start_date: datetime, end_date: datetime, remove_duplicates: bool = False) -> pd.DataFrame:
-    """Load data from Google Sheets with optional month filtering"""
-    try:
-        data = get_sheet_data(sheet_name)
-        data = clean_data(data)
-        if remove_duplicates:
-            data = load_data_search(sheet_name, end_date.year, start_date.year)
-            data = data.drop_duplicates(subset=["Name"], keep="first")
-            for col in ["Publishing Date", "Last Edit (Revision)", "Trustpilot Review Date"]:
-                if col in data.columns:
-                    data[col] = pd.to_datetime(data[col], errors="coerce")
-        if "Publishing Date" in data.columns:
-            data = data[
-                (data["Publishing Date"].dt.date >= start_date) &
-                (data["Publishing Date"].dt.date <= end_date)
-            ]
-
-        if data.empty:
-            return pd.DataFrame()
+    return run_query(SheetQuery(sheet_name, "Publishing Date", start_date=start_date, end_date=end_date,
+                                dedupe="first_in_years" if remove_duplicates else None))
 
-        data = data.sort_values(by="Publishing Date", ascending=True)
-
-        for col in ["Publishing Date", "Last Edit (Revision)", "Trustpilot Review Date"]:
-            if col in data.columns:
-                data[col] = pd.to_datetime(data[col], errors="coerce").dt.strftime("%d-%B-%Y")
-        data.index = range(1, len(data) + 1)
-        return data
-
-    except Exception as e:
-        st.error(f"Error loading data: {e}")
-        logging.error(f"An Error Occurred: {e}")
-        return pd.DataFrame()
 
 def load_reviews(sheet_name: str, year: int, month_number=None) -> pd.DataFrame:
-    data = get_sheet_data(sheet_name)
-    if data.empty:
-        return pd.DataFrame()
+    """One review row per client for a month (or year) by review date"""
+    return run_query(SheetQuery(sheet_name, "Trustpilot Review Date", year, month=month_number,
+                                dedupe="review_status", date_output="reviews"))
 
-    columns = list(data.columns)
-    if "Issues" in columns:
-        end_col_index = columns.index("Issues")
-        data = data.iloc[:, :end_col_index + 1]
-    date_columns = ["Publishing Date", "Last Edit (Revision)", "Trustpilot Review Date"]
-    for col in date_columns:
-        if col in data.columns:
-            data[col] = pd.to_datetime(data[col], format="%d-%B-%Y", errors="coerce")
 
-    data[["Copyright", "Issues", "Last Edit (Revision)"]] = data[
-        ["Copyright", "Issues", "Last Edit (Revision)"]].astype(str)
-
-    data[["Copyright", "Issues", "Last Edit (Revision)"]] = data[
-        ["Copyright", "Issues", "Last Edit (Revision)"]].fillna("N/A")
-    try:
-        if "Trustpilot Review Date" in data.columns and month_number:
-            data = data[(data["Trustpilot Review Date"].dt.month == month_number) & (
-                    data["Trustpilot Review Date"].dt.year == year)]
-        else:
-            data = data[(data["Trustpilot Review Date"].dt.year == year)]
-
-        if data.empty:
-            return pd.DataFrame()
-
-        data = data.sort_values(by="Trustpilot Review Date", ascending=True)
-
-        if "Name" in data.columns:
-            if "Trustpilot Review" in data.columns and "Trustpilot Review Date" in data.columns:
-                data = (
-                    data.sort_values(
-                        by=["Trustpilot Review", "Trustpilot Review Date"],
-                        key=lambda col: col.eq("Attained") if col.name == "Trustpilot Review" else col,
-                        ascending=[False, False]
-                    )
-                    .drop_duplicates(subset=["Name"], keep="last")
-                )
-            else:
-                data = data.drop_duplicates(subset=["Name"])
-        data.index = range(1, len(data) + 1)
-        return data
-    except Exception as e:
-        st.error(f"Error loading data: {e}")
-        logging.error(f"An Error Occurred: {e}")
-        return pd.DataFrame()
+def _pm_reviews(sheet_name: str, name: str, type_: str, **dates) -> pd.DataFrame:
+    """A project manager's reviews of one type on the counted brands, one row per client"""
+    return run_query(SheetQuery(sheet_name, "Trustpilot Review Date", project_managers=(name,), review_types=(type_,),
+                                brands=REVIEW_BRANDS, dedupe="first", date_output="reviews", **dates))
 
 
 def load_reviews_year(sheet_name: str, year: int, name: str, type_: str = "Attained") -> pd.DataFrame:
-    data = get_sheet_data(sheet_name)
-    if data.empty:
-        return pd.DataFrame()
-
-    columns = list(data.columns)
-    if "Issues" in columns:
-        end_col_index = columns.index("Issues")
-        data = data.iloc[:, :end_col_index + 1]
-    date_columns = ["Publishing Date", "Last Edit (Revision)", "Trustpilot Review Date"]
-    for col in date_columns:
-        if col in data.columns:
-            data[col] = pd.to_datetime(data[col], format="%d-%B-%Y", errors="coerce")
-
-    data[["Copyright", "Issues", "Last Edit (Revision)"]] = data[
-        ["Copyright", "Issues", "Last Edit (Revision)"]].astype(str)
-
-    data[["Copyright", "Issues", "Last Edit (Revision)"]] = data[
-        ["Copyright", "Issues", "Last Edit (Revision)"]].fillna("N/A")
-    try:
-        if "Trustpilot Review Date" in data.columns:
-            data = data[(data["Trustpilot Review Date"].dt.year == year)]
+    return _pm_reviews(sheet_name, name, type_, start_year=year)
 
-        else:
-            return pd.DataFrame()
-
-        data = data.sort_values(by="Trustpilot Review Date", ascending=True)
-
-        data_original = data.copy()
-        data = data_original[
-            (data_original["Project Manager"] == name) &
-            (data_original["Trustpilot Review"] == type_) &
-            (data_original["Brand"].isin(
-                ["BookMarketeers", "Writers Clique", "Authors Solution", "Book Publication", "Aurora Writers"]))
-            ]
-
-        data = data.sort_values(by="Trustpilot Review Date", ascending=True)
-        data = data.drop_duplicates(subset=["Name"])
-        data.index = range(1, len(data) + 1)
-        return data
-    except Exception as e:
-        st.error(f"Error loading data: {e}")
-        logging.error(f"An Error Occurred: {e}")
-        return pd.DataFrame()
 
 def load_reviews_year_to_date(sheet_name: str, year: int, name: str, type_: str = "Attained") -> pd.DataFrame:
-    data = get_sheet_data(sheet_name)
-    if data.empty:
-        return pd.DataFrame()
-
-    columns = list(data.columns)
-    if "Issues" in columns:
-        end_col_index = columns.index("Issues")
-        data = data.iloc[:, :end_col_index + 1]
-    date_columns = ["Publishing Date", "Last Edit (Revision)", "Trustpilot Review Date"]
-    for col in date_columns:
-        if col in data.columns:
-            data[col] = pd.to_datetime(data[col], format="%d-%B-%Y", errors="coerce")
-
-    data[["Copyright", "Issues", "Last Edit (Revision)"]] = data[
-        ["Copyright", "Issues", "Last Edit (Revision)"]].astype(str)
-
-    data[["Copyright", "Issues", "Last Edit (Revision)"]] = data[
-        ["Copyright", "Issues", "Last Edit (Revision)"]].fillna("N/A")
-    try:
-        if "Trustpilot Review Date" in data.columns:
-            data = data[
-                (data["Trustpilot Review Date"].dt.year >= get_min_year()) &
-                (data["Trustpilot Review Date"].dt.year <= year)
-            ]
+    return _pm_reviews(sheet_name, name, type_, start_year=get_min_year(), end_year=year)
 
-        else:
-            return pd.DataFrame()
 
-        data = data.sort_values(by="Trustpilot Review Date", ascending=True)
-
-        data_original = data.copy()
-        data = data_original[
-            (data_original["Project Manager"] == name) &
-            (data_original["Trustpilot Review"] == type_) &
-            (data_original["Brand"].isin(
-                ["BookMarketeers", "Writers Clique", "Authors Solution", "Book Publication", "Aurora Writers"]))
-            ]
-
-        data = data.sort_values(by="Trustpilot Review Date", ascending=True)
-        data = data.drop_duplicates(subset=["Name"])
-        data.index = range(1, len(data) + 1)
-        return data
-    except Exception as e:
-        st.error(f"Error loading data: {e}")
-        logging.error(f"An Error Occurred: {e}")
+def load_reviews_filter(sheet_name: str, start_date: datetime, end_date: datetime, name: str,
+                        type_: str = "Attained") -> pd.DataFrame:
+    if type_ in DAILY_METRICS and range_total(sheet_name, type_, start_date, end_date) == 0:
         return pd.DataFrame()
 
-def load_reviews_filter(sheet_name: str, start_date: datetime, end_date: datetime, name: str, type_: str = "Attained") -> pd.DataFrame:
-    data = get_sheet_data(sheet_name)
-    if data.empty:
-        return pd.DataFrame()
+    return _pm_reviews(sheet_name, name, type_, start_date=start_date, end_date=end_date)
 
-    columns = list(data.columns)
-    if "Issues" in columns:
-        end_col_index = columns.index("Issues")
-        data = data.iloc[:, :end_col_index + 1]
-    date_columns = ["Publishing Date", "Last Edit (Revision)", "Trustpilot Review Date"]
-    for col in date_columns:
-        if col in data.columns:
-            data[col] = pd.to_datetime(data[col], format="%d-%B-%Y", errors="coerce")
 
-    data[["Copyright", "Issues", "Last Edit (Revision)"]] = data[
-        ["Copyright", "Issues", "Last Edit (Revision)"]].astype(str)
+def load_reviews_year_multiple(sheet_name: str, start_year: int, end_year: int, name: str,
+                               type_: str = "Attained") -> pd.DataFrame:
+    return _pm_reviews(sheet_name, name, type_, start_year=start_year, end_year=end_year)
 
-    data[["Copyright", "Issues", "Last Edit (Revision)"]] = data[
-        ["Copyright", "Issues", "Last Edit (Revision)"]].fillna("N/A")
-    try:
-        if "Trustpilot Review Date" in data.columns:
-            data = data[
-                (data["Trustpilot Review Date"].dt.date >= start_date) &
-                (data["Trustpilot Review Date"].dt.date <= end_date)
-            ]
 
-        else:
-            return pd.DataFrame()
+def load_pm_reviews(sheet_name: str, pm_list: list[str], review_types: tuple[str, ...] = REVIEW_TYPES,
+                    **dates) -> tuple[dict[str, pd.DataFrame], pd.DataFrame]:
+    """Reviews of every project manager in pm_list in one pass over the sheet.
 
-        data = data.sort_values(by="Trustpilot Review Date", ascending=True)
-
-        data_original = data.copy()
-        data = data_original[
-            (data_original["Project Manager"] == name) &
-            (data_original["Trustpilot Review"] == type_) &
-            (data_original["Brand"].isin(
-                ["BookMarketeers", "Writers Clique", "Authors Solution", "Book Publication", "Aurora Writers"]))
-            ]
-
-        data = data.sort_values(by="Trustpilot Review Date", ascending=True)
-        data = data.drop_duplicates(subset=["Name"])
-        data.index = range(1, len(data) + 1)
-        return data
-    except Exception as e:
-        st.error(f"Error loading data: {e}")
-        logging.error(f"An Error Occurred: {e}")
-        return pd.DataFrame()
+    dates takes the same range arguments as SheetQuery (start_year / end_year or start_date / end_date).
+    Returns {review type: rows}, each holding the rows the load_reviews_year* loaders would return
+    for every PM together, and a table of review counts with a row per PM and a column per type.
+    """
+    data = run_query(SheetQuery(sheet_name, "Trustpilot Review Date", project_managers=tuple(pm_list),
+                                review_types=tuple(review_types), brands=REVIEW_BRANDS, dedupe="first",
+                                dedupe_within=("Project Manager", "Trustpilot Review"), date_output="reviews",
+                                **dates))
 
-def load_reviews_year_multiple(sheet_name: str, start_year: int, end_year: int, name: str, type_: str = "Attained") -> pd.DataFrame:
-    data = get_sheet_data(sheet_name)
+    reviews = {type_: pd.DataFrame() for type_ in review_types}
     if data.empty:
-        return pd.DataFrame()
-
-    columns = list(data.columns)
-    if "Issues" in columns:
-        end_col_index = columns.index("Issues")
-        data = data.iloc[:, :end_col_index + 1]
-    date_columns = ["Publishing Date", "Last Edit (Revision)", "Trustpilot Review Date"]
-    for col in date_columns:
-        if col in data.columns:
-            data[col] = pd.to_datetime(data[col], format="%d-%B-%Y", errors="coerce")
-
-    data[["Copyright", "Issues", "Last Edit (Revision)"]] = data[
-        ["Copyright", "Issues", "Last Edit (Revision)"]].astype(str)
-
-    data[["Copyright", "Issues", "Last Edit (Revision)"]] = data[
-        ["Copyright", "Issues", "Last Edit (Revision)"]].fillna("N/A")
-    try:
-        if "Trustpilot Review Date" in data.columns:
-            data = data[
-                (data["Trustpilot Review Date"].dt.year >= start_year) &
-                (data["Trustpilot Review Date"].dt.year <= end_year)
-
-            ]
-
-        else:
-            return pd.DataFrame()
+        return reviews, pd.DataFrame(columns=list(review_types), dtype=int)
 
-        data = data.sort_values(by="Trustpilot Review Date", ascending=True)
+    for type_, rows in data.groupby("Trustpilot Review", sort=False):
+        reviews[type_] = rows.reset_index(drop=True)
 
-        data_original = data.copy()
-        data = data_original[
-            (data_original["Project Manager"] == name) &
-            (data_original["Trustpilot Review"] == type_) &
-            (data_original["Brand"].isin(
-                ["BookMarketeers", "Writers Clique", "Authors Solution", "Book Publication", "Aurora Writers"]))
-            ]
+    counts = (
+        data.groupby(["Project Manager", "Trustpilot Review"]).size()
+        .unstack(fill_value=0)
+        .reindex(columns=list(review_types), fill_value=0)
+    )
 
-        data = data.sort_values(by="Trustpilot Review Date", ascending=True)
-        data = data.drop_duplicates(subset=["Name"])
-        data.index = range(1, len(data) + 1)
-        return data
-    except Exception as e:
-        st.error(f"Error loading data: {e}")
-        logging.error(f"An Error Occurred: {e}")
-        return pd.DataFrame()
\ No newline at end of file
+    return reviews, counts
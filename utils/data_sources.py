@@ -0,0 +1,199 @@
+import logging
+import os
+
+import gspread
+import numpy as np
+import pandas as pd
+import streamlit as st
+from google.oauth2.service_account import Credentials
+from gspread.utils import rowcol_to_a1
+
+# Where sheet data comes from: "gsheets" (default) or "local" for a directory of
+# CSV / XLSX / Parquet files named after the sheets (e.g. "USA.csv", "Nielsen ISBN.parquet")
+DATA_SOURCE = os.getenv("DATA_SOURCE", "gsheets")
+DATA_DIR = os.getenv("DATA_DIR", "data")
+
+SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
+LOCAL_EXTENSIONS = [".parquet", ".csv", ".xlsx"]
+
+
+def normalize_name(name):
+    """Normalize a name to consistent format (Title Case, stripped whitespace)"""
+    if pd.isna(name) or name == "":
+        return ""
+    return str(name).strip().title()
+
+
+def normalize_names(names: pd.Series, title_case: bool = True) -> pd.Series:
+    """Vectorized normalize_name: each distinct value is cleaned once and mapped back to the rows"""
+    codes, uniques = pd.factorize(names)
+    cleaned = pd.Series(uniques, dtype=object).astype(str).str.strip()
+    if title_case:
+        cleaned = cleaned.str.title()
+
+    # Missing values get code -1, which picks the trailing ""
+    lookup = np.append(cleaned.to_numpy(dtype=object), "")
+    return pd.Series(lookup[codes], index=names.index, name=names.name)
+
+
+def _prepare_frame(data: pd.DataFrame) -> pd.DataFrame:
+    """Clean-ups every source applies to a freshly read sheet"""
+    if "Project Manager" in data.columns:
+        data["Project Manager"] = normalize_names(data["Project Manager"])
+    # Client names keep their casing, only stray whitespace is removed
+    if "Name" in data.columns:
+        data["Name"] = normalize_names(data["Name"], title_case=False)
+
+    return data
+
+
+def _frame_from_values(raw_data: list[list[str]], width: int = 0) -> pd.DataFrame:
+    """Build a DataFrame from raw sheet values (first row is the header)"""
+    if not raw_data:
+        return pd.DataFrame()
+
+    # The values API drops trailing empty cells, so pad every row to the sheet width
+    width = max([width] + [len(row) for row in raw_data])
+    raw_data = [row + [""] * (width - len(row)) for row in raw_data]
+
+    headers = raw_data[0]
+    rows = raw_data[1:]
+
+    return _prepare_frame(pd.DataFrame(rows, columns=headers))
+
+
+class DataSource:
+    """Where the dashboard reads its sheets from.
+
+    Every source returns string frames with the sheet header as columns, exactly as
+    the Google Sheets values API would give them.
+    """
+
+    def fetch_sheets(self, sheet_names: list[str],
+                     tails: dict[str, tuple[int, int]] | None = None) -> dict[str, pd.DataFrame]:
+        """Get several sheets at once, sheets in tails as (first_row, width) only from that sheet row down"""
+        raise NotImplementedError
+
+    def fetch_sheet(self, sheet_name: str) -> pd.DataFrame:
+        """Get a single sheet"""
+        return self.fetch_sheets([sheet_name])[sheet_name]
+
+
+class GoogleSheetsSource(DataSource):
+    """Reads the production spreadsheet through the Sheets API"""
+
+    def __init__(self, creds_dict: dict, spreadsheet_id: str):
+        creds = Credentials.from_service_account_info(
+            creds_dict,
+            scopes=SCOPES
+        )
+        client = gspread.authorize(creds)
+        self.spreadsheet = client.open_by_key(spreadsheet_id)
+
+    def fetch_sheets(self, sheet_names, tails=None):
+        """Get the sheets in a single values_batch_get call"""
+        tails = tails or {}
+
+        ranges = []
+        for sheet_name in sheet_names:
+            if sheet_name in tails:
+                first_row, width = tails[sheet_name]
+                last_column = rowcol_to_a1(1, width).rstrip("0123456789")
+                ranges += [f"'{sheet_name}'!1:1", f"'{sheet_name}'!A{first_row}:{last_column}"]
+            else:
+                ranges.append(f"'{sheet_name}'")
+
+        response = self.spreadsheet.values_batch_get(ranges)
+        value_ranges = iter(response.get("valueRanges", []))
+
+        sheets = {}
+        for sheet_name in sheet_names:
+            values = next(value_ranges, {}).get("values", [])
+            if sheet_name in tails:
+                tail = next(value_ranges, {}).get("values", [])
+                sheets[sheet_name] = _frame_from_values(values[:1] + tail, tails[sheet_name][1])
+            else:
+                sheets[sheet_name] = _frame_from_values(values)
+
+        return sheets
+
+    def fetch_sheet(self, sheet_name):
+        """Get one worksheet outside the batch"""
+        return _frame_from_values(self.spreadsheet.worksheet(sheet_name).get_all_values())
+
+
+class LocalDirectorySource(DataSource):
+    """Reads sheets from local files, for offline profiling and load tests against copies of the data"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _read(self, sheet_name: str) -> pd.DataFrame:
+        """Read one sheet file as strings, an empty frame when there is no file for it"""
+        for extension in LOCAL_EXTENSIONS:
+            path = os.path.join(self.directory, f"{sheet_name}{extension}")
+            if not os.path.exists(path):
+                continue
+
+            if extension == ".parquet":
+                data = pd.read_parquet(path)
+                data = data.astype(str).mask(data.isna(), "")
+                return _prepare_frame(data)
+
+            # Read the header as a plain row so blank and repeated headers stay as in the sheet
+            if extension == ".csv":
+                values = pd.read_csv(path, header=None, dtype=str, keep_default_na=False)
+            else:
+                values = pd.read_excel(path, header=None, dtype=str).fillna("")
+
+            data = values.iloc[1:].reset_index(drop=True)
+            data.columns = list(values.iloc[0]) if not values.empty else []
+            return _prepare_frame(data)
+
+        logging.error(f"No file for sheet {sheet_name} in {self.directory}")
+        return pd.DataFrame()
+
+    def fetch_sheets(self, sheet_names, tails=None):
+        """Read each sheet's file, tails are cut from the full file"""
+        tails = tails or {}
+
+        sheets = {}
+        for sheet_name in sheet_names:
+            data = self._read(sheet_name)
+            if sheet_name in tails:
+                # A real copy of the tail, a lazy one would keep the whole file read alive
+                data = data.iloc[tails[sheet_name][0] - 2:].reset_index(drop=True).copy()
+            sheets[sheet_name] = data
+
+        return sheets
+
+
+def _google_credentials() -> tuple[dict, str]:
+    """Service account info and spreadsheet id from the Streamlit secrets"""
+    gsheets = st.secrets["connections"]["gsheets"]
+    creds_dict = {
+        "type": gsheets["type"],
+        "project_id": gsheets["project_id"],
+        "private_key_id": gsheets["private_key_id"],
+        "private_key": gsheets["private_key"].replace("\\n", "\n"),
+        "client_email": gsheets["client_email"],
+        "client_id": gsheets["client_id"],
+        "auth_uri": gsheets["auth_uri"],
+        "token_uri": gsheets["token_uri"],
+        "auth_provider_x509_cert_url": gsheets["auth_provider_x509_cert_url"],
+        "client_x509_cert_url": gsheets["client_x509_cert_url"]
+    }
+    spreadsheet_id = os.getenv("SPREADSHEET_ID") or gsheets["SPREADSHEET_ID"]
+
+    return creds_dict, spreadsheet_id
+
+
+@st.cache_resource
+def get_data_source() -> DataSource:
+    """Create the configured data source once, Google credentials are only read when it is used"""
+    if DATA_SOURCE == "local":
+        return LocalDirectorySource(DATA_DIR)
+    if DATA_SOURCE == "gsheets":
+        return GoogleSheetsSource(*_google_credentials())
+
+    raise ValueError(f"Unknown DATA_SOURCE {DATA_SOURCE!r}, expected 'gsheets' or 'local'")
@@ -0,0 +1,146 @@
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from API_loader import get_sheet_version
+from typed_frames import SHEET_SCHEMAS, get_typed_slice, format_dates
+
+# Brands whose reviews count towards a project manager's totals
+REVIEW_BRANDS = ("BookMarketeers", "Writers Clique", "Authors Solution", "Book Publication", "Aurora Writers",
+                 "Books Publisher")
+
+# Results kept in memory, least recently used queries are dropped first
+QUERY_CACHE_SIZE = 256
+
+# query -> (sheet version, result)
+_query_cache: OrderedDict["SheetQuery", tuple[str, pd.DataFrame]] = OrderedDict()
+_query_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class SheetQuery:
+    """Which rows of a sheet to load, and how to hand them back.
+
+    start_year..end_year (or one month of start_year) picks the partitions to read, start_date /
+    end_date narrow them to whole days (their years are used when no start_year is given).
+
+    project_managers / review_types / brands keep the rows whose value is one of the given ones.
+
+    dedupe keeps one row per client (Name), or per client within each dedupe_within group:
+      - "first": the earliest matching row
+      - "first_in_years": the earliest row in the years read, before the day range is applied,
+        so a client only shows up if their first row of those years falls in the range
+      - "review_status": the row the monthly review table shows (rows not attained win over
+        attained ones, then the earliest)
+
+    date_output "sheet" formats every date column like the sheet ("%d-%B-%Y"), "reviews" keeps
+    the dates typed and only renders "Last Edit (Revision)" as "%Y-%m-%d".
+    """
+    sheet: str
+    date_column: str
+    start_year: int | None = None
+    end_year: int | None = None
+    month: int | None = None
+    start_date: date | None = None
+    end_date: date | None = None
+    project_managers: tuple[str, ...] | None = None
+    review_types: tuple[str, ...] | None = None
+    brands: tuple[str, ...] | None = None
+    dedupe: str | None = None
+    dedupe_within: tuple[str, ...] = ()
+    date_output: str = "sheet"
+
+
+def _execute(query: SheetQuery) -> pd.DataFrame:
+    """Read the query's partitions from the typed frame, then filter, dedupe and format them"""
+    start_year = query.start_year if query.start_year is not None else query.start_date.year
+    end_year = query.end_year if query.end_year is not None else \
+        query.end_date.year if query.end_date is not None else start_year
+
+    data = get_typed_slice(query.sheet, query.date_column, start_year, end_year, month=query.month)
+    if data.empty or query.date_column not in data.columns:
+        return pd.DataFrame()
+
+    # The rows are picked as positions and the frame is taken once at the end, since every take
+    # copies each Arrow text column on its own. NumPy's stable sort puts NaT last like sort_values.
+    rows = np.argsort(data[query.date_column].to_numpy(), kind="stable")
+
+    if query.dedupe == "first_in_years":
+        rows = rows[~data["Name"].take(rows).duplicated(keep="first").to_numpy()]
+
+    # Every predicate goes into one mask over the slice
+    mask = np.ones(len(data), dtype=bool)
+    if query.start_date is not None:
+        dates = data[query.date_column]
+        mask &= (dates >= pd.Timestamp(query.start_date)).to_numpy()
+    if query.end_date is not None:
+        dates = data[query.date_column]
+        mask &= (dates < pd.Timestamp(query.end_date) + pd.Timedelta(days=1)).to_numpy()
+    if query.project_managers is not None:
+        mask &= data["Project Manager"].isin(query.project_managers).to_numpy()
+    if query.review_types is not None:
+        mask &= data["Trustpilot Review"].isin(query.review_types).to_numpy()
+    if query.brands is not None:
+        mask &= data["Brand"].isin(query.brands).to_numpy()
+    rows = rows[mask[rows]]
+
+    if query.dedupe == "first":
+        subset = [*query.dedupe_within, "Name"]
+        rows = rows[~data[subset].take(rows).duplicated(keep="first").to_numpy()]
+
+    data = data.take(rows)
+    if query.dedupe == "review_status":
+        data = (
+            data.sort_values(
+                by=["Trustpilot Review", query.date_column],
+                key=lambda col: col.eq("Attained") if col.name == "Trustpilot Review" else col,
+                ascending=[False, False]
+            )
+            .drop_duplicates(subset=["Name"], keep="last")
+        )
+
+    if data.empty:
+        return pd.DataFrame()
+
+    if query.date_output == "reviews":
+        data["Last Edit (Revision)"] = format_dates(data["Last Edit (Revision)"], "%Y-%m-%d", "NaT")
+    else:
+        for col in SHEET_SCHEMAS.get(query.sheet, {}).get("date_columns", [query.date_column]):
+            if col in data.columns:
+                data[col] = format_dates(data[col])
+
+    data.index = range(1, len(data) + 1)
+    return data
+
+
+def run_query(query: SheetQuery) -> pd.DataFrame:
+    """Load a query's rows, memoized per query and sheet version (an empty frame when nothing matches)"""
+    version = get_sheet_version(query.sheet)
+
+    with _query_lock:
+        cached = _query_cache.get(query)
+        if version is not None and cached is not None and cached[0] == version:
+            _query_cache.move_to_end(query)
+            return cached[1].copy()
+
+    try:
+        data = _execute(query)
+    except Exception as e:
+        st.error(f"Error loading data: {e}")
+        logging.error(f"An Error Occurred: {e}")
+        return pd.DataFrame()
+
+    if version is not None:
+        with _query_lock:
+            _query_cache[query] = (version, data)
+            _query_cache.move_to_end(query)
+            while len(_query_cache) > QUERY_CACHE_SIZE:
+                _query_cache.popitem(last=False)
+
+    # Callers modify the result in place, so never hand out the cached object
+    return data.copy()
@@ -1,8 +1,53 @@
+import calendar
 import logging
 
+import numpy as np
 import pandas as pd
 
-from API_loader import get_sheet_data
+from client_identity import client_names, resolve_clients
+from client_presence import active_clients, clients_in_periods
+from typed_frames import get_typed_frame, get_typed_slice, format_dates
+
+
+def _month_number(month: str) -> int | None:
+    """1-12 for a month name, None for anything else"""
+    return list(calendar.month_name).index(month) if month in calendar.month_name[1:] else None
+
+
+def _period_rows(sheet_name: str, year: int, month: int | None = None) -> pd.DataFrame:
+    """Client ID (as Name) and Publishing Date of the named rows published in a year (or one month of it), in sheet order"""
+    data = get_typed_slice(sheet_name, "Publishing Date", year, month=month)[["Name", "Publishing Date"]]
+    data = data[data["Name"].notna()]
+    return data.assign(Name=resolve_clients(sheet_name, data["Name"], column="Client ID"))
+
+
+def _overlap(sheet_name: str, periods: list[tuple[int, int | None]]) -> tuple[set, dict]:
+    """Clients found in every period, with their formatted publishing dates per period ({name: {position: dates}}).
+
+    The client presence index tells whether any client is shared before a row is read. The rows of
+    the shared clients are then picked and grouped by (client ID, period) (a group-by is cheaper than
+    an isin over thousands of IDs), with the dates of each group cut out of one stably sorted array.
+    Clients are only named by their shown spelling at the end.
+    """
+    if not clients_in_periods(sheet_name, periods):
+        return set(), {}
+
+    rows = pd.concat([_period_rows(sheet_name, year, month) for year, month in periods],
+                     keys=range(len(periods)), names=["Period", None]).reset_index(level="Period")
+    in_every_period = rows.groupby("Name", sort=False)["Period"].transform("nunique") == len(periods)
+    rows = rows[in_every_period.to_numpy()]
+
+    grouped = rows.groupby(["Name", "Period"], sort=False)
+    sizes = grouped.size()
+    order = np.argsort(grouped.ngroup().to_numpy(), kind="stable")
+    dates = np.split(format_dates(rows["Publishing Date"]).to_numpy()[order], np.cumsum(sizes.to_numpy())[:-1])
+
+    per_client = {}
+    for (client_id, period), client_dates in zip(sizes.index, dates):
+        per_client.setdefault(client_id, {})[period] = client_dates.tolist()
+
+    per_name = dict(zip(client_names(sheet_name, list(per_client)), per_client.values()))
+    return set(per_name), per_name
 
 
 def get_names_in_both_months(sheet_name: str, month_1: str, year1: int, month_2: str, year2: int) -> tuple:
@@ -12,103 +57,57 @@ def get_names_in_both_months(sheet_name: str, month_1: str, year1: int, month_2:
         - A set of matching names
         - A dictionary with individual counts for June and July
     """
-    df = get_sheet_data(sheet_name)
+    df = get_typed_frame(sheet_name)
 
     if df.empty or "Name" not in df.columns or "Publishing Date" not in df.columns:
         logging.warning("Missing 'Name' or 'Date' columns or data is empty.")
         return set(), {}, 0
 
-    df['Publishing Date'] = pd.to_datetime(df['Publishing Date'], format="%d-%B-%Y", errors='coerce')
-    df = df.dropna(subset=['Publishing Date', 'Name'])
-
-    df['Month'] = df['Publishing Date'].dt.month_name()
-    df['Year'] = df['Publishing Date'].dt.year
+    month_1_number, month_2_number = _month_number(month_1), _month_number(month_2)
+    if month_1_number is None or month_2_number is None:
+        return set(), {}, 0
 
-    month_1_names = set(
-        df[(df['Month'] == month_1) & (df['Year'] == year1)]['Name'].str.strip()
-    )
+    names_in_both, per_name = _overlap(sheet_name, [(year1, month_1_number), (year2, month_2_number)])
+    if not names_in_both:
+        return set(), {}, 0
 
-    month_2_names = set(
-        df[(df['Month'] == month_2) & (df['Year'] == year2)]['Name'].str.strip()
-    )
+    counts = {
+        name: {
+            f"{month_1}-{year1}": len(dates[0]),
+            f"{month_2}-{year2}": len(dates[1]),
+        }
+        for name, dates in per_name.items()
+    }
 
-    if month_1_names & month_2_names:
-        names_in_both = month_1_names.intersection(month_2_names)
-
-        counts = {}
-        for name in names_in_both:
-            month_1_count = df[
-                (df['Month'] == month_1) &
-                (df['Year'] == year1) &
-                (df['Name'].str.strip() == name)
-                ].shape[0]
-
-            month_2_count = df[
-                (df['Month'] == month_2) &
-                (df['Year'] == year2) &
-                (df['Name'].str.strip() == name)
-                ].shape[0]
-
-            counts[name] = {
-                f"{month_1}-{year1}": month_1_count,
-                f"{month_2}-{year2}": month_2_count,
-            }
-
-        return names_in_both, counts, len(names_in_both)
-    else:
-        return set(), {}, 0
+    return names_in_both, counts, len(names_in_both)
 
 def get_names_in_both_years(sheet_name: str, year1: int, year2: int) -> tuple:
     """
     Identifies names that appear in both years from a Google Sheet.
     """
-    df = get_sheet_data(sheet_name)
+    df = get_typed_frame(sheet_name)
 
     if df.empty or "Name" not in df.columns or "Publishing Date" not in df.columns:
         logging.warning("Missing 'Name' or 'Publishing Date' columns or data is empty.")
         return set(), {}, 0
 
-    df['Publishing Date'] = pd.to_datetime(
-        df['Publishing Date'], format="%d-%B-%Y", errors='coerce'
-    )
-    df = df.dropna(subset=['Publishing Date', 'Name'])
-
-    df['Year'] = df['Publishing Date'].dt.year
-    df['Name'] = df['Name'].str.strip()
-
-    year_1_names = set(df[df['Year'] == year1]['Name'])
-    year_2_names = set(df[df['Year'] == year2]['Name'])
-
-    names_in_both = year_1_names & year_2_names
-
-    counts = {}
-
-    for name in names_in_both:
-        year1_df = df[(df['Year'] == year1) & (df['Name'] == name)]
-        year2_df = df[(df['Year'] == year2) & (df['Name'] == name)]
-
-        counts[name] = {
-            str(year1): {
-                "count": year1_df.shape[0],
-                "publishing_dates": year1_df['Publishing Date']
-                .dt.strftime("%d-%B-%Y")
-                .tolist()
-            },
-            str(year2): {
-                "count": year2_df.shape[0],
-                "publishing_dates": year2_df['Publishing Date']
-                .dt.strftime("%d-%B-%Y")
-                .tolist()
-            }
+    names_in_both, per_name = _overlap(sheet_name, [(year1, None), (year2, None)])
+
+    counts = {
+        name: {
+            str(year1): {"count": len(dates[0]), "publishing_dates": dates[0]},
+            str(year2): {"count": len(dates[1]), "publishing_dates": dates[1]}
         }
+        for name, dates in per_name.items()
+    }
 
     return names_in_both, counts, len(names_in_both)
 
 def get_clients_returning_in_month(
-    sheet_name: str,
-    start_year: int,
-    target_month: str,
-    target_year: int
+        sheet_name: str,
+        start_year: int,
+        target_month: str,
+        target_year: int
 ) -> tuple:
     """
     Identifies clients who were published starting from `start_year`
@@ -116,54 +115,25 @@ def get_clients_returning_in_month(
 
     Returns clients that are "duplicates" — same client, different books.
     """
-    df = get_sheet_data(sheet_name)
+    df = get_typed_frame(sheet_name)
 
     if df.empty or "Name" not in df.columns or "Publishing Date" not in df.columns:
         logging.warning("Missing 'Name' or 'Publishing Date' columns or data is empty.")
         return set(), {}, 0
 
-    df['Publishing Date'] = pd.to_datetime(
-        df['Publishing Date'], format="%d-%B-%Y", errors='coerce'
-    )
-    df = df.dropna(subset=['Publishing Date', 'Name'])
+    target_month_number = _month_number(target_month)
+    if target_month_number is None:
+        return set(), {}, 0
 
-    df['Year'] = df['Publishing Date'].dt.year
-    df['Month'] = df['Publishing Date'].dt.month_name()
-    df['Name'] = df['Name'].str.strip()
-
-    baseline_df = df[
-        (df['Year'] == start_year)
-    ]
-
-    target_df = df[
-        (df['Year'] == target_year) &
-        (df['Month'] == target_month)
-    ]
-
-    baseline_clients = set(baseline_df['Name'])
-    target_clients = set(target_df['Name'])
-
-    returning_clients = baseline_clients & target_clients
-
-    counts = {}
-    for name in returning_clients:
-        client_baseline = baseline_df[baseline_df['Name'] == name]
-        client_target = target_df[target_df['Name'] == name]
-
-        counts[name] = {
-            f"from_{start_year}_baseline": {
-                "count": client_baseline.shape[0],
-                "publishing_dates": client_baseline['Publishing Date']
-                    .dt.strftime("%d-%B-%Y")
-                    .tolist()
-            },
-            f"{target_year}_{target_month}": {
-                "count": client_target.shape[0],
-                "publishing_dates": client_target['Publishing Date']
-                    .dt.strftime("%d-%B-%Y")
-                    .tolist()
-            }
+    returning_clients, per_name = _overlap(sheet_name, [(start_year, None), (target_year, target_month_number)])
+
+    counts = {
+        name: {
+            f"from_{start_year}_baseline": {"count": len(dates[0]), "publishing_dates": dates[0]},
+            f"{target_year}_{target_month}": {"count": len(dates[1]), "publishing_dates": dates[1]}
         }
+        for name, dates in per_name.items()
+    }
 
     return returning_clients, counts, len(returning_clients)
 
@@ -176,23 +146,20 @@ def get_names_in_year(sheet_name: str, year: int):
         - A dictionary summary of names with their total appearances and months active
         - Total count of such names
     """
-    df = get_sheet_data(sheet_name)
+    df = get_typed_frame(sheet_name)
 
     if df.empty or "Name" not in df.columns or "Publishing Date" not in df.columns:
         logging.warning("Missing 'Name' or 'Publishing Date' columns, or data is empty.")
         return pd.DataFrame(), {}, 0
 
-    df['Publishing Date'] = pd.to_datetime(df['Publishing Date'], format="%d-%B-%Y", errors='coerce')
-    df = df.dropna(subset=['Publishing Date', 'Name'])
-    df['Month'] = df['Publishing Date'].dt.month_name()
-    df['Year'] = df['Publishing Date'].dt.year
-
-    df = df[df['Year'] == year]
+    df = _period_rows(sheet_name, year)
 
     if df.empty:
         logging.warning(f"No records found for year {year}.")
         return pd.DataFrame(), {}, 0
 
+    df['Month'] = df['Publishing Date'].dt.month_name()
+
     monthly_counts = (
         df.groupby(['Name', 'Month'])
         .size()
@@ -203,19 +170,37 @@ def get_names_in_year(sheet_name: str, year: int):
         ], fill_value=0)
     )
 
+    # Grouped by client ID, shown under each client's name in name order
+    monthly_counts.index = pd.Index(client_names(sheet_name, monthly_counts.index), name="Name")
+    monthly_counts = monthly_counts.sort_index()
+
     monthly_counts['Active Months'] = (monthly_counts > 0).sum(axis=1)
     multi_month_names = monthly_counts[monthly_counts['Active Months'] > 1].copy()
 
     month_cols = multi_month_names.columns[:-2]
-    summary = {}
-    for name in multi_month_names.index:
-        active_months = [month for month in month_cols if multi_month_names.at[name, month] > 0]
+    active = multi_month_names[month_cols].to_numpy() > 0
+    month_names = month_cols.to_numpy()
+    summary = {
+        name: {
+            "Months Active": {i + 1: month for i, month in enumerate(month_names[months].tolist())},
+            "Month Count": int(month_count),
+        }
+        for name, months, month_count in zip(multi_month_names.index, active, multi_month_names["Active Months"])
+    }
 
-        indexed_months = {i + 1: month for i, month in enumerate(active_months)}
+    return multi_month_names, summary, len(multi_month_names)
 
-        summary[name] = {
-            "Months Active": indexed_months,
-            "Month Count": int(multi_month_names.at[name, "Active Months"]),
-        }
+def get_active_clients(sheet_name: str, min_months: int, last_months: int, end_month: str, end_year: int) -> tuple:
+    """
+    Finds clients published in at least `min_months` of the `last_months` months up to `end_month` `end_year`.
+
+    Returns:
+        - A DataFrame of those clients with their active month count and one True / False column per month
+        - Total count of such clients
+    """
+    end_month_number = _month_number(end_month)
+    if end_month_number is None or last_months < 1:
+        return pd.DataFrame(), 0
 
-    return multi_month_names, summary, len(multi_month_names)
\ No newline at end of file
+    clients = active_clients(sheet_name, min_months, last_months, end_year, end_month_number)
+    return clients, len(clients)
@@ -0,0 +1,94 @@
+import json
+import logging
+import os
+from datetime import datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+SNAPSHOT_DIR = os.getenv(
+    "SNAPSHOT_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".snapshots")
+)
+
+
+def _snapshot_path(sheet_name: str) -> str:
+    """Parquet file used for a sheet's snapshot"""
+    return os.path.join(SNAPSHOT_DIR, f"{sheet_name.replace(' ', '_')}.parquet")
+
+
+def write_snapshot(sheet_name: str, data: pd.DataFrame, fetched_at: datetime) -> None:
+    """Persist a fetched sheet to a local Parquet file together with its fetch timestamp"""
+    try:
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+
+        # Sheet headers can repeat (blank columns), so store columns by position
+        # and keep the real headers in the file metadata
+        table = pa.Table.from_pandas(
+            data.set_axis([str(i) for i in range(data.shape[1])], axis=1),
+            preserve_index=False
+        )
+        table = table.replace_schema_metadata({
+            b"sheet_name": sheet_name.encode(),
+            b"columns": json.dumps(list(data.columns)).encode(),
+            b"fetched_at": fetched_at.isoformat().encode(),
+        })
+
+        path = _snapshot_path(sheet_name)
+        temp_path = f"{path}.tmp"
+        pq.write_table(table, temp_path)
+        os.replace(temp_path, path)
+    except Exception as e:
+        logging.error(f"Error writing snapshot for sheet {sheet_name}: {e}")
+
+
+def read_snapshot(sheet_name: str) -> tuple[pd.DataFrame, datetime] | None:
+    """Load a sheet snapshot from disk, returns None when there is no usable snapshot"""
+    path = _snapshot_path(sheet_name)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        table = pq.read_table(path)
+        metadata = table.schema.metadata or {}
+
+        data = table.to_pandas()
+        data.columns = json.loads(metadata[b"columns"])
+        fetched_at = datetime.fromisoformat(metadata[b"fetched_at"].decode())
+
+        return data, fetched_at
+    except Exception as e:
+        logging.error(f"Error reading snapshot for sheet {sheet_name}: {e}")
+        return None
+
+
+def _partials_path(name: str) -> str:
+    """Parquet file used for a set of derived partials, kept apart from the sheet snapshots"""
+    return os.path.join(SNAPSHOT_DIR, "partials", f"{name.replace(' ', '_')}.parquet")
+
+
+def write_partials(name: str, data: pd.DataFrame) -> None:
+    """Persist partial results derived from the sheets (e.g. closed months of the summary rollup)"""
+    try:
+        path = _partials_path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        temp_path = f"{path}.tmp"
+        data.to_parquet(temp_path, index=False)
+        os.replace(temp_path, path)
+    except Exception as e:
+        logging.error(f"Error writing partials {name}: {e}")
+
+
+def read_partials(name: str) -> pd.DataFrame | None:
+    """Load persisted partials, returns None when there are none usable"""
+    path = _partials_path(name)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        return pd.read_parquet(path)
+    except Exception as e:
+        logging.error(f"Error reading partials {name}: {e}")
+        return None
@@ -0,0 +1,296 @@
+import hashlib
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytz
+from API_loader import get_data_version
+from snapshot_store import read_partials, write_partials
+from task_pool import run_parallel
+from typed_frames import TEXT_DTYPE, get_typed_frame
+
+# Publishing sheets are rolled up by month and these columns
+PUBLISHING_DIMENSIONS = ["Brand", "Platform", "Status", "Trustpilot Review", "Project Manager", "Issues"]
+
+# Which sheet each rollup reads, the date column it is bucketed by and its extra dimensions
+CUBE_SHEETS = {
+    "USA": ("Publishing Date", PUBLISHING_DIMENSIONS),
+    "UK": ("Publishing Date", PUBLISHING_DIMENSIONS),
+    "Printing": ("Order Date", []),
+    "Copyright": ("Submission Date", ["Country", "Result"]),
+    "A_plus": ("A+ Content Date", ["Status"]),
+}
+
+# (data version, {sheet name: cells})
+_cube_cache: tuple[str, dict[str, pd.DataFrame]] | None = None
+# Cells of closed months, reused across data versions and restarts while the month's rows hash
+# the same: (sheet name, period) -> (digest of the month's input rows, cells). A month keeps only
+# its latest digest and months without rows are dropped, so this holds one entry per sheet month.
+_month_cells: dict[tuple[str, int], tuple[str, pd.DataFrame]] = {}
+# Sheets whose persisted closed months were read back in this process
+_loaded_sheets: set[str] = set()
+_cube_lock = threading.Lock()
+
+
+def _periods(dates: pd.Series) -> pd.Series:
+    """Months since year 0, so (year, month) ranges become integer ranges"""
+    return dates.dt.year * 12 + dates.dt.month - 1
+
+
+def _publishing_rows(data: pd.DataFrame, date_column: str, dimensions: list[str]) -> pd.DataFrame:
+    """One cube input row per dated row of a publishing sheet, plus the flags the summaries take one row per client from.
+
+    "Month Clients" marks each client's last row of a month (the monthly summary), "Year Clients"
+    each client's first row of a year (the yearly summaries), split by "Previous Year", the last
+    earlier year the client published in (0 if none), so a client's first row of a range of years
+    is the "Year Clients" row with a "Previous Year" before the range.
+    """
+    data = data[data[date_column].notna()].sort_values(by=date_column, kind="stable")
+    rows = data.reindex(columns=dimensions)
+    rows["Period"] = _periods(data[date_column])
+    rows["Year"] = data[date_column].dt.year
+
+    clients = pd.DataFrame({"Name": data["Name"], "Period": rows["Period"], "Year": rows["Year"]})
+    rows["Month Clients"] = (~clients.duplicated(subset=["Name", "Period"], keep="last")).astype(int)
+    rows["Year Clients"] = (~clients.duplicated(subset=["Name", "Year"], keep="first")).astype(int)
+
+    firsts = clients[rows["Year Clients"] == 1].sort_values(by=["Name", "Year"], kind="stable")
+    rows["Previous Year"] = 0
+    rows.loc[firsts.index, "Previous Year"] = firsts.groupby("Name")["Year"].shift(1).fillna(0).astype(int)
+
+    return rows
+
+
+def _printing_rows(data: pd.DataFrame, date_column: str) -> pd.DataFrame:
+    """One cube input row per dated order of the printing sheet"""
+    data = data[data[date_column].notna()]
+    copies = data["No of Copies"].fillna(0) if "No of Copies" in data.columns else pd.Series(0, index=data.index)
+    cost = data["Order Cost"].fillna(0) if "Order Cost" in data.columns else pd.Series(0, index=data.index)
+
+    # Plain NumPy measures, so the min / max of a month without orders stay NaN rather than <NA>
+    return pd.DataFrame({"Period": _periods(data[date_column]), "Year": data[date_column].dt.year,
+                         "Copies": copies.to_numpy(), "Cost": cost.to_numpy()}, index=data.index)
+
+
+def _count_rows(data: pd.DataFrame, date_column: str, dimensions: list[str]) -> pd.DataFrame:
+    """One cube input row per dated row, with the columns it is counted by"""
+    data = data[data[date_column].notna()]
+    rows = data.reindex(columns=dimensions)
+    rows["Period"] = _periods(data[date_column])
+    rows["Year"] = data[date_column].dt.year
+
+    return rows
+
+
+def _cube_layout(sheet_name: str, by_client: bool) -> tuple[list[str], dict]:
+    """(group columns, aggregations) of a sheet's rollup, by_client for publishing sheets with a Name column"""
+    date_column, dimensions = CUBE_SHEETS[sheet_name]
+
+    if sheet_name == "Printing":
+        return ["Period", "Year"], {
+            "Rows": ("Copies", "size"), "Copies": ("Copies", "sum"), "Cost": ("Cost", "sum"),
+            "Max Copies": ("Copies", "max"), "Min Copies": ("Copies", "min"),
+            "Max Cost": ("Cost", "max"), "Min Cost": ("Cost", "min")}
+    if by_client and dimensions == PUBLISHING_DIMENSIONS:
+        return ["Period", "Year", "Previous Year", *dimensions], {
+            "Rows": ("Year", "size"), "Month Clients": ("Month Clients", "sum"),
+            "Year Clients": ("Year Clients", "sum")}
+
+    return ["Period", "Year", *dimensions], {"Rows": ("Year", "size")}
+
+
+def _cube_input(sheet_name: str, data: pd.DataFrame) -> tuple[pd.DataFrame, list[str], dict]:
+    """(input rows, group columns, aggregations) of a sheet's rollup, a month's cells only depend on its rows"""
+    date_column, dimensions = CUBE_SHEETS[sheet_name]
+    keys, aggregations = _cube_layout(sheet_name, "Name" in data.columns)
+
+    if sheet_name == "Printing":
+        return _printing_rows(data, date_column), keys, aggregations
+    if "Previous Year" in keys:
+        return _publishing_rows(data, date_column, dimensions), keys, aggregations
+
+    return _count_rows(data, date_column, dimensions), keys, aggregations
+
+
+def _current_period() -> int:
+    """Period of the month still open for new rows"""
+    now = datetime.now(pytz.timezone("Asia/Karachi"))
+    return now.year * 12 + now.month - 1
+
+
+def _load_month_cells(sheet_name: str, columns: list[str]) -> None:
+    """Read the closed months an earlier process persisted for a sheet into _month_cells, once per process"""
+    with _cube_lock:
+        if sheet_name in _loaded_sheets:
+            return
+        _loaded_sheets.add(sheet_name)
+
+    stored = read_partials(f"cube_{sheet_name}")
+    # Cells of an older rollup layout are not reused
+    if stored is None or list(stored.columns) != [*columns, "Digest"]:
+        return
+
+    # Parquet gives the text dimensions back as object columns
+    stored = stored.astype({column: TEXT_DTYPE for column in columns if stored[column].dtype == object})
+    periods = stored["Period"].to_numpy()
+    months, starts = np.unique(periods, return_index=True)
+    ends = np.append(starts[1:], len(periods))
+
+    with _cube_lock:
+        for period, start, end in zip(months.tolist(), starts, ends):
+            cells = stored.iloc[start:end]
+            _month_cells.setdefault((sheet_name, period),
+                                    (cells["Digest"].iat[0], cells.drop(columns="Digest").reset_index(drop=True)))
+
+
+def _store_month_cells(sheet_name: str) -> None:
+    """Persist a sheet's closed months next to the sheet snapshots, so a restart regroups only the open month"""
+    with _cube_lock:
+        months = sorted((key[1], cached) for key, cached in _month_cells.items() if key[0] == sheet_name)
+    if not months:
+        return
+
+    write_partials(f"cube_{sheet_name}",
+                   pd.concat([cells.assign(Digest=digest) for _, (digest, cells) in months], ignore_index=True))
+
+
+def build_cube(sheet_name: str, data: pd.DataFrame) -> pd.DataFrame:
+    """Roll a typed sheet up into monthly cells, sorted by period.
+
+    The rows of each month are hashed, closed months whose rows hash the same as last time
+    reuse their cached cells and only the current month and changed months are grouped again.
+    """
+    date_column, dimensions = CUBE_SHEETS[sheet_name]
+    if data.empty or date_column not in data.columns:
+        # Every cell column, so the summaries can filter on the client flags of an empty sheet
+        keys, aggregations = _cube_layout(sheet_name, by_client=True)
+        return pd.DataFrame(columns=[*keys, *aggregations])
+
+    rows, keys, aggregations = _cube_input(sheet_name, data)
+    _load_month_cells(sheet_name, [*keys, *aggregations])
+    if not rows["Period"].is_monotonic_increasing:
+        rows = rows.sort_values(by="Period", kind="stable")
+    periods = rows["Period"].to_numpy()
+    hashes = pd.util.hash_pandas_object(rows, index=False).to_numpy()
+    months, starts = np.unique(periods, return_index=True)
+    ends = np.append(starts[1:], len(periods))
+    current = _current_period()
+
+    parts = {}
+    stale_digests = {}
+    stale = np.zeros(len(rows), dtype=bool)
+    with _cube_lock:
+        for period, start, end in zip(months.tolist(), starts, ends):
+            digest = hashlib.blake2b(hashes[start:end].tobytes(), digest_size=16).hexdigest()
+            cached = _month_cells.get((sheet_name, period))
+            if period < current and cached is not None and cached[0] == digest:
+                parts[period] = cached[1]
+            else:
+                stale_digests[period] = digest
+                stale[start:end] = True
+
+    if stale_digests:
+        fresh = rows[stale].groupby(keys, dropna=False).agg(**aggregations).reset_index()
+        fresh_periods = fresh["Period"].to_numpy()
+        for period in stale_digests:
+            parts[period] = fresh.iloc[np.searchsorted(fresh_periods, period, side="left"):
+                                       np.searchsorted(fresh_periods, period, side="right")]
+
+    with _cube_lock:
+        closed = [period for period in stale_digests if period < current]
+        for period in closed:
+            _month_cells[(sheet_name, period)] = (stale_digests[period], parts[period])
+        # Months that no longer have rows are dropped
+        dropped = [key for key in _month_cells if key[0] == sheet_name and key[1] not in parts]
+        for key in dropped:
+            del _month_cells[key]
+    if closed or dropped:
+        _store_month_cells(sheet_name)
+
+    if not parts:
+        return rows.groupby(keys, dropna=False).agg(**aggregations).reset_index()
+    if len(stale_digests) == len(parts):
+        return fresh
+
+    return pd.concat([parts[period] for period in sorted(parts)], ignore_index=True)
+
+
+def get_summary_cube() -> dict[str, pd.DataFrame]:
+    """Monthly rollups of every summary sheet, built once per data version"""
+    global _cube_cache
+    version = get_data_version(list(CUBE_SHEETS))
+
+    with _cube_lock:
+        cached = _cube_cache
+    if version is not None and cached is not None and cached[0] == version:
+        return cached[1]
+
+    # Each sheet is parsed and rolled up on its own section thread
+    cells = run_parallel(*(lambda sheet_name=sheet_name: build_cube(sheet_name, get_typed_frame(sheet_name))
+                           for sheet_name in CUBE_SHEETS))
+    cube = dict(zip(CUBE_SHEETS, cells))
+    if version is not None:
+        with _cube_lock:
+            _cube_cache = (version, cube)
+
+    return cube
+
+
+def cube_cells(cells: pd.DataFrame, start_year: int, end_year: int | None = None,
+               month: int | None = None) -> pd.DataFrame:
+    """Cells of start_year..end_year (or one month of start_year), found by binary search on the period"""
+    end_year = start_year if end_year is None else end_year
+    first = start_year * 12 + (month - 1 if month else 0)
+    last = end_year * 12 + (month - 1 if month else 11)
+
+    periods = cells["Period"].to_numpy()
+    return cells.iloc[np.searchsorted(periods, first, side="left"):np.searchsorted(periods, last, side="right")]
+
+
+def cube_totals(cells: pd.DataFrame, dimension: str, measure: str = "Rows") -> pd.Series:
+    """A measure summed per value of a dimension, largest first like value_counts"""
+    if cells.empty or dimension not in cells.columns:
+        return pd.Series(dtype=int, name="count", index=pd.Index([], name=dimension))
+
+    totals = cells.groupby(dimension, sort=False)[measure].sum()
+    totals = totals[totals > 0].sort_values(ascending=False, kind="stable")
+    totals.name = "count"
+
+    return totals
+
+
+def _month_starts(periods: pd.Index) -> pd.Series:
+    """First day of each period's month"""
+    return pd.to_datetime(pd.DataFrame({"year": periods // 12, "month": periods % 12 + 1, "day": 1}))
+
+
+def cube_monthly(cells: pd.DataFrame, measure: str, label: str) -> pd.DataFrame:
+    """A measure per month as [Month ("%B %Y"), Month_Sort, label], oldest month first"""
+    monthly = cells.groupby("Period")[measure].sum()
+    monthly = monthly[monthly > 0]
+
+    month_sort = _month_starts(monthly.index)
+    return pd.DataFrame({
+        "Month": month_sort.dt.strftime("%B %Y").to_numpy(),
+        "Month_Sort": month_sort.to_numpy(),
+        label: monthly.to_numpy(),
+    })
+
+
+def cube_printing_months(cells: pd.DataFrame) -> pd.DataFrame:
+    """Printing totals per month, highest cost first, as printing_data_year returns them"""
+    if cells.empty or "Copies" not in cells.columns:
+        return pd.DataFrame()
+
+    totals = cells.groupby("Period")[["Copies", "Cost"]].sum()
+    month_totals = pd.DataFrame({
+        "Month": _month_starts(totals.index).dt.strftime("%B %Y").to_numpy(),
+        "Total Copies": totals["Copies"].to_numpy(),
+        "Total Cost ($)": totals["Cost"].to_numpy(),
+    })
+    month_totals = month_totals.sort_values(by="Total Cost ($)", ascending=False)
+    month_totals.index = range(1, len(month_totals) + 1)
+    month_totals["Total Cost ($)"] = month_totals["Total Cost ($)"].map("${:,.2f}".format)
+
+    return month_totals
@@ -1,1131 +1,512 @@
+from datetime import datetime
+
 import pandas as pd
+import pytz
 import streamlit as st
-from data_cleaner import clean_data_reviews, safe_concat
-from data_loader import load_reviews, sheet_uk, sheet_usa, load_reviews_year_multiple, load_reviews_year
-
-from diff_sheets_loader import get_A_plus_year, get_copyright_month, get_printing_data_month, get_A_plus_month, \
-     printing_data_year, copyright_year, get_A_plus_year_multiple, printing_data_year_multiple, \
-    copyright_year_multiple
+from data_cleaner import get_min_year, safe_concat
+from typed_frames import get_typed_slice, format_dates, get_partition_version
+from API_loader import get_data_version
+from data_loader import load_reviews, sheet_uk, sheet_usa, load_pm_reviews, sheet_printing, sheet_copyright, \
+    sheet_a_plus
+from summary_cube import get_summary_cube, cube_cells, cube_totals, cube_monthly, cube_printing_months
+from task_pool import run_parallel
+
+current_year = datetime.now(pytz.timezone("Asia/Karachi")).year
+
+# Sheets the summaries read, their combined fingerprint keys the cached results
+summary_sheets = [sheet_usa, sheet_uk, sheet_printing, sheet_copyright, sheet_a_plus]
+
+# (sheet, date column) of every month partition a monthly summary reads, nothing outside them
+month_partitions = [(sheet_usa, "Publishing Date"), (sheet_uk, "Publishing Date"),
+                    (sheet_usa, "Trustpilot Review Date"), (sheet_uk, "Trustpilot Review Date"),
+                    (sheet_printing, "Order Date"), (sheet_copyright, "Submission Date"),
+                    (sheet_a_plus, "A+ Content Date")]
+
+# Brands whose clients' Sent / Pending / Negative review states are counted, the multi-year
+# summary also counts Books Publisher
+review_state_brands = ("BookMarketeers", "Writers Clique", "Aurora Writers", "Authors Solution", "Book Publication")
+
+usa_brand_names = ["BookMarketeers", "Writers Clique", "KDP", "Aurora Writers"]
+uk_brand_names = ["Authors Solution", "Book Publication", "Books Publisher"]
+platform_names = ["Amazon", "Barnes & Noble", "Ingram Spark", "Draft2Digital", "Kobo", "LULU", "FAV", "ACX"]
+
+client_columns = ["Name", "Brand", "Project Manager", "Email"]
+pending_sent_columns = ["Name", "Brand", "Project Manager", "Trustpilot Review", "Status"]
+review_detail_columns = ["Project Manager", "Name", "Brand", "Trustpilot Review Date", "Trustpilot Review Links",
+                         "Status"]
+
+# Detail tables of a summary per section, a section's tables are built together on first access
+detail_sections = {
+    "clients": ("combined", "pending_sent_details"),
+    "reviews": ("attained_reviews_per_pm", "attained_details", "merged_attained", "attained_reviews_per_month",
+                "negative_reviews_per_pm", "negative_details", "negative_reviews_per_month"),
+}
+
+# Field order of the tuples the summaries used to return
+month_fields = ("usa_review", "uk_review", "usa_brands", "uk_brands", "usa_platforms", "uk_platforms",
+                "printing_stats", "copyright_stats", "a_plus", "total_unique_clients", "combined",
+                "attained_reviews_per_pm", "attained_details", "pending_sent_details", "negative_reviews_per_pm",
+                "negative_details", "issues_usa", "issues_uk")
+years_fields = ("usa_review", "uk_review", "usa_brands", "uk_brands", "usa_platforms", "uk_platforms",
+                "printing_stats", "monthly_printing", "copyright_stats", "a_plus", "total_unique_clients", "combined",
+                "attained_reviews_per_pm", "attained_details", "merged_attained", "attained_reviews_per_month",
+                "pending_sent_details", "negative_reviews_per_pm", "negative_details", "negative_reviews_per_month",
+                "publishing_per_month", "issues_usa", "issues_uk")
+
+
+def _detail_property(name: str) -> property:
+    return property(lambda self: self._detail(name), doc=f"{name} (built on first access)")
+
+
+class SummaryResult:
+    """A summary report. The KPIs are computed with it, the detail tables are built one section at a
+    time (see detail_sections) when first read and then kept, so views that only show KPIs never build them.
+
+    period is ("month", month, year) or ("years", start_year, end_year, review state brands).
+    """
+
+    __slots__ = ("period", "data_version", "usa_review", "uk_review", "usa_brands", "uk_brands", "usa_platforms",
+                 "uk_platforms", "printing_stats", "monthly_printing", "copyright_stats", "a_plus",
+                 "total_unique_clients", "publishing_per_month", "issues_usa", "issues_uk", "_details")
+
+    def __init__(self, period: tuple, data_version: str | None, **kpis):
+        self.period = period
+        self.data_version = data_version
+        self.monthly_printing = None
+        self.publishing_per_month = None
+        for name, value in kpis.items():
+            setattr(self, name, value)
+        self._details = {}
+
+    def _detail(self, name: str):
+        """A detail table, building its section if it is not built yet"""
+        if name not in self._details:
+            builder = _section_builders[next(section for section, names in detail_sections.items() if name in names)]
+            if self.data_version is None:
+                self._details.update(builder.__wrapped__(self.period, self.data_version))
+            else:
+                self._details.update(builder(self.period, self.data_version))
+
+        return self._details[name]
+
+    combined = _detail_property("combined")
+    pending_sent_details = _detail_property("pending_sent_details")
+    attained_reviews_per_pm = _detail_property("attained_reviews_per_pm")
+    attained_details = _detail_property("attained_details")
+    merged_attained = _detail_property("merged_attained")
+    attained_reviews_per_month = _detail_property("attained_reviews_per_month")
+    negative_reviews_per_pm = _detail_property("negative_reviews_per_pm")
+    negative_details = _detail_property("negative_details")
+    negative_reviews_per_month = _detail_property("negative_reviews_per_month")
+
+    def as_tuple(self) -> tuple:
+        """Every field in the order the summaries used to return them (builds every section)"""
+        fields = month_fields if self.period[0] == "month" else years_fields
+        return tuple(getattr(self, name) for name in fields)
+
+
+def _publishing_rows(sheet_name: str, start_year: int, end_year: int | None = None,
+                     month: int | None = None) -> pd.DataFrame:
+    """A publishing sheet's rows of a period in publishing date order"""
+    data = get_typed_slice(sheet_name, "Publishing Date", start_year, end_year, month=month)
+    if "Publishing Date" not in data.columns:
+        return data
+
+    return data.sort_values(by="Publishing Date", ascending=True, kind="stable")
+
+
+def _client_kpis(usa_cells: pd.DataFrame, uk_cells: pd.DataFrame, usa_client_cells: pd.DataFrame,
+                 uk_client_cells: pd.DataFrame, clients: str) -> dict:
+    """Clients per brand and issue, and titles per platform, of both publishing sheets"""
+    usa_brands = cube_totals(usa_client_cells, "Brand", clients)
+    uk_brands = cube_totals(uk_client_cells, "Brand", clients)
+    usa_platforms = cube_totals(usa_cells, "Platform")
+    uk_platforms = cube_totals(uk_cells, "Platform")
+
+    return {
+        "usa_brands": {brand: usa_brands.get(brand, 0) for brand in usa_brand_names},
+        "uk_brands": {brand: uk_brands.get(brand, 0) for brand in uk_brand_names},
+        "usa_platforms": {platform: usa_platforms.get(platform, 0) for platform in platform_names},
+        "uk_platforms": {platform: uk_platforms.get(platform, 0) for platform in platform_names},
+        "issues_usa": cube_totals(usa_client_cells, "Issues", clients),
+        "issues_uk": cube_totals(uk_client_cells, "Issues", clients),
+        "total_unique_clients": usa_client_cells[clients].sum() + uk_client_cells[clients].sum(),
+    }
 
 
-def summary(month: int, year: int):
-    uk_clean = clean_data_reviews(sheet_uk)
-    usa_clean = clean_data_reviews(sheet_usa)
+def _review_states(client_cells: pd.DataFrame, clients: str, brands: tuple[str, ...]) -> pd.Series:
+    """Clients per review state on the given brands"""
+    return cube_totals(client_cells[client_cells["Brand"].isin(brands)], "Trustpilot Review", clients)
 
-    usa_clean = usa_clean[
-        (usa_clean["Publishing Date"].dt.month == month) &
-        (usa_clean["Publishing Date"].dt.year == year)
-        ]
-    uk_clean = uk_clean[
-        (uk_clean["Publishing Date"].dt.month == month) &
-        (uk_clean["Publishing Date"].dt.year == year)
-        ]
-
-    usa_clean_platforms = usa_clean[
-        (usa_clean["Publishing Date"].dt.month == month) &
-        (usa_clean["Publishing Date"].dt.year == year)
-        ]
-    uk_clean_platforms = uk_clean[
-        (uk_clean["Publishing Date"].dt.month == month) &
-        (uk_clean["Publishing Date"].dt.year == year)
-        ]
 
-    if usa_clean.empty:
-        print("No values found in USA sheet.")
-        return
-    if uk_clean.empty:
-        print("No values found in UK sheet.")
-        return
-    if usa_clean.empty and uk_clean.empty:
-        return
-    usa_clean = usa_clean.drop_duplicates(subset=["Name"], keep="last")
-    uk_clean = uk_clean.drop_duplicates(subset=["Name"], keep="last")
-    Issues_usa = usa_clean["Issues"].value_counts()
-    Issues_uk = uk_clean["Issues"].value_counts()
-    total_usa = usa_clean["Name"].nunique()
-    total_uk = uk_clean["Name"].nunique()
-    total_unique_clients = total_usa + total_uk
-
-    combined = pd.concat([usa_clean[["Name", "Brand", "Project Manager", "Email"]],
-                          uk_clean[["Name", "Brand", "Project Manager", "Email"]]])
-    combined.index = range(1, len(combined) + 1)
+def _other_sheet_kpis(cube: dict[str, pd.DataFrame], start_year: int, end_year: int | None = None,
+                      month: int | None = None) -> dict:
+    """Printing, copyright and A+ KPIs of a period"""
+    printing_cells = cube_cells(cube[sheet_printing], start_year, end_year, month=month)
+    # A month without orders keeps its empty min / max, a range without orders reports 0
+    has_orders = "Copies" in printing_cells.columns if month else not printing_cells.empty
+    total_copies = printing_cells["Copies"].sum() if has_orders else 0
+    total_cost = printing_cells["Cost"].sum() if has_orders else 0
 
-    brands = usa_clean["Brand"].value_counts()
-    writers_clique = brands.get("Writers Clique", 0)
-    bookmarketeers = brands.get("BookMarketeers", 0)
-    aurora_writers = brands.get("Aurora Writers", 0)
-    kdp = brands.get("KDP", 0)
-
-    uk_brand = uk_clean["Brand"].value_counts()
-    authors_solution = uk_brand.get("Authors Solution", 0)
-    book_publication = uk_brand.get("Book Publication", 0)
-
-    usa_platforms = usa_clean_platforms["Platform"].value_counts()
-    usa_amazon = usa_platforms.get("Amazon", 0)
-    usa_bn = usa_platforms.get("Barnes & Noble", 0)
-    usa_ingram = usa_platforms.get("Ingram Spark", 0)
-    usa_d2d = usa_platforms.get("Draft2Digital", 0)
-    usa_lulu = usa_platforms.get("LULU", 0)
-    usa_kobo = usa_platforms.get("Kobo", 0)
-    usa_fav = usa_platforms.get("FAV", 0)
-    usa_acx = usa_platforms.get("ACX", 0)
-
-    uk_platforms = uk_clean_platforms["Platform"].value_counts()
-    uk_amazon = uk_platforms.get("Amazon", 0)
-    uk_bn = uk_platforms.get("Barnes & Noble", 0)
-    uk_ingram = uk_platforms.get("Ingram Spark", 0)
-    uk_d2d = uk_platforms.get("Draft2Digital", 0)
-    uk_lulu = uk_platforms.get("LULU", 0)
-    uk_fav = uk_platforms.get("FAV", 0)
-    uk_kobo = uk_platforms.get("Kobo", 0)
-    uk_acx = uk_platforms.get("ACX", 0)
-
-    allowed_brands = ["BookMarketeers", "Writers Clique", "Aurora Writers", "Authors Solution", "Book Publication"]
-
-    if "Trustpilot Review" in usa_clean.columns and "Brand" in usa_clean.columns:
-        usa_filtered = usa_clean[usa_clean["Brand"].isin(allowed_brands)]
-        usa_review_sent = usa_filtered["Trustpilot Review"].value_counts().get("Sent", 0)
-        usa_review_pending = usa_filtered["Trustpilot Review"].value_counts().get("Pending", 0)
-        usa_review_na = usa_filtered["Trustpilot Review"].value_counts().get("Negative", 0)
-    else:
-        usa_review_sent = usa_review_pending = usa_review_na = 0
+    copyright_cells = cube_cells(cube[sheet_copyright], start_year, end_year, month=month)
+    country = cube_totals(copyright_cells, "Country")
+    usa = country.get("USA", 0)
+    canada = country.get("Canada", 0)
+    uk = country.get("UK", 0)
 
-    if "Trustpilot Review" in uk_clean.columns and "Brand" in uk_clean.columns:
-        uk_filtered = uk_clean[uk_clean["Brand"].isin(allowed_brands)]
-        uk_review_sent = uk_filtered["Trustpilot Review"].value_counts().get("Sent", 0)
-        uk_review_pending = uk_filtered["Trustpilot Review"].value_counts().get("Pending", 0)
-        uk_review_na = uk_filtered["Trustpilot Review"].value_counts().get("Negative", 0)
-    else:
-        uk_review_sent = uk_review_pending = uk_review_na = 0
-    combined_pending_sent = pd.concat([usa_clean, uk_clean], ignore_index=True)
-    pending_sent_details = combined_pending_sent[
-        ((combined_pending_sent["Trustpilot Review"] == "Sent") |
-         (combined_pending_sent["Trustpilot Review"] == "Pending")) &
-        (combined_pending_sent["Brand"].isin(allowed_brands))
-        ]
-    pending_sent_details = pending_sent_details[["Name", "Brand", "Project Manager", "Trustpilot Review", "Status"]]
-    pending_sent_details.index = range(1, len(pending_sent_details) + 1)
+    a_plus_cells = cube_cells(cube[sheet_a_plus], start_year, end_year, month=month)
+
+    return {
+        "printing_stats": {
+            'Total_copies': total_copies,
+            'Total_cost': total_cost,
+            'Highest_cost': printing_cells["Max Cost"].max() if has_orders else 0,
+            'Lowest_cost': printing_cells["Min Cost"].min() if has_orders else 0,
+            'Highest_copies': printing_cells["Max Copies"].max() if has_orders else 0,
+            'Lowest_copies': printing_cells["Min Copies"].min() if has_orders else 0,
+            'Average': total_cost / total_copies if total_copies > 0 else 0
+        },
+        "copyright_stats": {
+            'Total_copyrights': copyright_cells["Rows"].sum(),
+            'Total_cost_copyright': (usa * 65) + (canada * 46) + (uk * 42),
+            'result_count': copyright_cells.loc[copyright_cells["Result"] == "Yes", "Rows"].sum(),
+            'result_count_no': copyright_cells.loc[copyright_cells["Result"] == "No", "Rows"].sum(),
+            'usa_copyrights': usa,
+            'canada_copyrights': canada,
+            'uk': uk
+        },
+        "a_plus": a_plus_cells.loc[a_plus_cells["Status"] == "Published", "Rows"].sum(),
+    }
 
-    usa_reviews_df = load_reviews(sheet_usa, year, month)
-    uk_reviews_df = load_reviews(sheet_uk, year, month)
-    combined_data = safe_concat([usa_reviews_df, uk_reviews_df])
 
-    if not usa_reviews_df.empty:
-        usa_attained_pm = (
-            usa_reviews_df[usa_reviews_df["Trustpilot Review"] == "Attained"]
-            .groupby("Project Manager")["Trustpilot Review"]
-            .count()
-            .reset_index()
-        )
-        usa_attained_pm.columns = ["Project Manager", "Attained Reviews"]
-        usa_attained_pm.index = range(1, len(usa_attained_pm) + 1)
-        usa_total_attained = usa_attained_pm["Attained Reviews"].sum()
+def _pm_review_count(reviews: pd.DataFrame, review_type: str):
+    """Reviews of one type that have a project manager"""
+    if reviews.empty:
+        return 0
+    return (reviews["Project Manager"].notna() & (reviews["Trustpilot Review"] == review_type)).sum()
 
-        usa_negative_pm = (
-            usa_reviews_df[usa_reviews_df["Trustpilot Review"] == "Negative"]
-            .groupby("Project Manager")["Trustpilot Review"]
-            .count()
-            .reset_index()
-        )
-        usa_negative_pm.columns = ["Project Manager", "Negative Reviews"]
-        usa_negative_pm.index = range(1, len(usa_negative_pm) + 1)
-        usa_total_negative = usa_negative_pm["Negative Reviews"].sum()
-    else:
-        usa_attained_pm = pd.DataFrame(columns=["Project Manager", "Attained Reviews"])
-        usa_negative_pm = pd.DataFrame(columns=["Project Manager", "Negative Reviews"])
-        usa_total_attained = 0
-        usa_total_negative = 0
-
-    if not uk_reviews_df.empty:
-        uk_attained_pm = (
-            uk_reviews_df[uk_reviews_df["Trustpilot Review"] == "Attained"]
-            .groupby("Project Manager")["Trustpilot Review"]
-            .count()
-            .reset_index()
-        )
-        uk_attained_pm.columns = ["Project Manager", "Attained Reviews"]
-        uk_attained_pm.index = range(1, len(uk_attained_pm) + 1)
-        uk_total_attained = uk_attained_pm["Attained Reviews"].sum()
 
-        uk_negative_pm = (
-            uk_reviews_df[uk_reviews_df["Trustpilot Review"] == "Negative"]
-            .groupby("Project Manager")["Trustpilot Review"]
-            .count()
-            .reset_index()
-        )
-        uk_negative_pm.columns = ["Project Manager", "Negative Reviews"]
-        uk_negative_pm.index = range(1, len(uk_negative_pm) + 1)
-        uk_total_negative = uk_negative_pm["Negative Reviews"].sum()
-    else:
-        uk_attained_pm = pd.DataFrame(columns=["Project Manager", "Attained Reviews"])
-        uk_negative_pm = pd.DataFrame(columns=["Project Manager", "Negative Reviews"])
-        uk_total_attained = 0
-        uk_total_negative = 0
-
-    if not combined_data.empty:
-        attained_reviews_per_pm = (
-            combined_data[combined_data["Trustpilot Review"] == "Attained"]
-            .groupby("Project Manager")["Trustpilot Review"]
-            .count()
-            .reset_index(name="Attained Reviews")
-        )
-        attained_reviews_per_pm = attained_reviews_per_pm.sort_values(by="Attained Reviews", ascending=False)
-        attained_reviews_per_pm.index = range(1, len(attained_reviews_per_pm) + 1)
+def _range_pm_reviews(cube: dict[str, pd.DataFrame], start_year: int, end_year: int) -> list:
+    """Attained and negative reviews of every PM, one pass per sheet (the KPIs and the review
+    tables ask with the same sorted PM lists, so the second ask is answered from the query memo)"""
+    pms_usa = cube_cells(cube[sheet_usa], get_min_year(), current_year)
+    pms_uk = cube_cells(cube[sheet_uk], get_min_year(), current_year)
+    pm_list_usa = sorted(set(pms_usa["Project Manager"].dropna().unique().tolist() + ["Unknown"]))
+    pm_list_uk = sorted(set(pms_uk["Project Manager"].dropna().unique().tolist() + ["Unknown"]))
 
-        negative_reviews_per_pm = (
-            combined_data[combined_data["Trustpilot Review"] == "Negative"]
-            .groupby("Project Manager")["Trustpilot Review"]
-            .count()
-            .reset_index(name="Negative Reviews")
-        )
-        negative_reviews_per_pm = negative_reviews_per_pm.sort_values(by="Negative Reviews", ascending=False)
-        negative_reviews_per_pm.index = range(1, len(negative_reviews_per_pm) + 1)
+    return run_parallel(
+        lambda: load_pm_reviews(sheet_usa, pm_list_usa, ("Attained", "Negative"),
+                                start_year=start_year, end_year=end_year),
+        lambda: load_pm_reviews(sheet_uk, pm_list_uk, ("Attained", "Negative"),
+                                start_year=start_year, end_year=end_year),
+    )
 
-        review_details_df = combined_data.sort_values(by="Project Manager", ascending=True)
-        review_details_df["Trustpilot Review Date"] = pd.to_datetime(
-            review_details_df["Trustpilot Review Date"], errors="coerce"
-        ).dt.strftime("%d-%B-%Y")
 
-        attained_details = review_details_df[
-            review_details_df["Trustpilot Review"] == "Attained"
-            ][["Project Manager", "Name", "Brand", "Trustpilot Review Date", "Trustpilot Review Links", "Status"]]
-        attained_details.index = range(1, len(attained_details) + 1)
+@st.cache_data(show_spinner=False, max_entries=64)
+def _summary(month: int, year: int, data_version: str):
+    # The sections read different sheets, so they run side by side on the section pool.
+    # Every count comes from the monthly rollup, the review rows are only needed for the review totals
+    usa_reviews_df, uk_reviews_df, cube = run_parallel(
+        lambda: load_reviews(sheet_usa, year, month),
+        lambda: load_reviews(sheet_uk, year, month),
+        get_summary_cube,
+    )
+    usa_cells = cube_cells(cube[sheet_usa], year, month=month)
+    uk_cells = cube_cells(cube[sheet_uk], year, month=month)
 
-        negative_details = review_details_df[
-            review_details_df["Trustpilot Review"] == "Negative"
-            ][["Project Manager", "Name", "Brand", "Trustpilot Review Date", "Trustpilot Review Links", "Status"]]
-        negative_details.index = range(1, len(negative_details) + 1)
+    if usa_cells["Rows"].sum() == 0:
+        print("No values found in USA sheet.")
+        return
+    if uk_cells["Rows"].sum() == 0:
+        print("No values found in UK sheet.")
+        return
 
-    else:
-        attained_reviews_per_pm = pd.DataFrame(columns=["Project Manager", "Attained Reviews"])
-        negative_reviews_per_pm = pd.DataFrame(columns=["Project Manager", "Negative Reviews"])
-        attained_details = pd.DataFrame(
-            columns=["Project Manager", "Name", "Brand", "Trustpilot Review Date", "Trustpilot Review Links", "Status"])
-        negative_details = attained_details.copy()
+    usa_review_states = _review_states(usa_cells, "Month Clients", review_state_brands)
+    uk_review_states = _review_states(uk_cells, "Month Clients", review_state_brands)
 
     usa_review = {
-        "Attained": usa_total_attained,
-        "Sent": usa_review_sent,
-        "Pending": usa_review_pending,
-        "Negative": usa_review_na + usa_total_negative
+        "Attained": _pm_review_count(usa_reviews_df, "Attained"),
+        "Sent": usa_review_states.get("Sent", 0),
+        "Pending": usa_review_states.get("Pending", 0),
+        "Negative": usa_review_states.get("Negative", 0) + _pm_review_count(usa_reviews_df, "Negative")
     }
 
     uk_review = {
-        "Attained": uk_total_attained,
-        "Sent": uk_review_sent,
-        "Pending": uk_review_pending,
-        "Negative": uk_review_na + uk_total_negative
+        "Attained": _pm_review_count(uk_reviews_df, "Attained"),
+        "Sent": uk_review_states.get("Sent", 0),
+        "Pending": uk_review_states.get("Pending", 0),
+        "Negative": uk_review_states.get("Negative", 0) + _pm_review_count(uk_reviews_df, "Negative")
     }
 
-    printing_data = get_printing_data_month(month, year)
-    Total_copies = printing_data["No of Copies"].sum() if "No of Copies" in printing_data.columns else 0
-    Total_cost = printing_data["Order Cost"].sum() if "Order Cost" in printing_data.columns else 0
-    Highest_cost = printing_data["Order Cost"].max() if "Order Cost" in printing_data.columns else 0
-    Highest_copies = printing_data["No of Copies"].max() if "No of Copies" in printing_data.columns else 0
-    Lowest_cost = printing_data["Order Cost"].min() if "Order Cost" in printing_data.columns else 0
-    Lowest_copies = printing_data["No of Copies"].min() if "No of Copies" in printing_data.columns else 0
+    return SummaryResult(("month", month, year), data_version, usa_review=usa_review, uk_review=uk_review,
+                         **_client_kpis(usa_cells, uk_cells, usa_cells, uk_cells, "Month Clients"),
+                         **_other_sheet_kpis(cube, year, month=month))
 
-    Average = Total_cost / Total_copies if Total_copies > 0 else 0
-    if all(col in printing_data.columns for col in ["Order Cost", "No of Copies"]):
-        printing_data['Cost_Per_Copy'] = printing_data['Order Cost'] / printing_data['No of Copies']
 
-    copyright_data, result_count, result_count_no = get_copyright_month(month, year)
-    Total_copyrights = len(copyright_data)
+def _years_summary(start_year: int, end_year: int, data_version: str, review_brands: tuple[str, ...]):
+    """Summary of start_year..end_year, every client counted once in the first month of the range they published in"""
+    cube = get_summary_cube()
+    usa_cells = cube_cells(cube[sheet_usa], start_year, end_year)
+    uk_cells = cube_cells(cube[sheet_uk], start_year, end_year)
 
-    country = copyright_data["Country"].value_counts()
-    usa = country.get("USA", 0)
-    canada = country.get("Canada", 0)
-    uk = country.get("UK", 0)
-    Total_cost_copyright = (usa * 65) + (canada * 46) + (uk * 42)
-    a_plus, a_plus_count = get_A_plus_month(month, year)
-
-    usa_brands = {'BookMarketeers': bookmarketeers, 'Writers Clique': writers_clique, 'KDP': kdp,
-                  'Aurora Writers': aurora_writers}
-
-    uk_brands = {'Authors Solution': authors_solution, 'Book Publication': book_publication}
-
-    usa_platforms = {'Amazon': usa_amazon, 'Barnes & Noble': usa_bn, 'Ingram Spark': usa_ingram,"Draft2Digital":usa_d2d,"Kobo": usa_kobo, "LULU":usa_lulu, "FAV": usa_fav, "ACX": usa_acx}
-    uk_platforms = {'Amazon': uk_amazon, 'Barnes & Noble': uk_bn, 'Ingram Spark': uk_ingram, "Draft2Digital":uk_d2d,"Kobo": uk_kobo,"LULU":uk_lulu, "FAV": uk_fav,
-                     "ACX": uk_acx}
-
-    printing_stats = {
-        'Total_copies': Total_copies,
-        'Total_cost': Total_cost,
-        'Highest_cost': Highest_cost,
-        'Lowest_cost': Lowest_cost,
-        'Highest_copies': Highest_copies,
-        'Lowest_copies': Lowest_copies,
-        'Average': Average
-    }
-
-    copyright_stats = {
-        'Total_copyrights': Total_copyrights,
-        'Total_cost_copyright': Total_cost_copyright,
-        'result_count': result_count,
-        'result_count_no': result_count_no,
-        'usa_copyrights': usa,
-        'canada_copyrights': canada,
-        'uk': uk
-    }
-
-    return usa_review, uk_review, usa_brands, uk_brands, usa_platforms, uk_platforms, printing_stats, copyright_stats, a_plus_count, total_unique_clients, combined, attained_reviews_per_pm, attained_details, pending_sent_details, negative_reviews_per_pm, negative_details, Issues_usa, Issues_uk
-
-
-def generate_year_summary(year: int):
-    uk_clean = clean_data_reviews(sheet_uk)
-    usa_clean = clean_data_reviews(sheet_usa)
-
-    usa_clean = usa_clean[
-        (usa_clean["Publishing Date"].dt.year == year)
-    ]
-    uk_clean = uk_clean[
-        (uk_clean["Publishing Date"].dt.year == year)
-    ]
-
-    usa_clean_platforms = usa_clean[
-        (usa_clean["Publishing Date"].dt.year == year)
-    ]
-    uk_clean_platforms = uk_clean[
-        (uk_clean["Publishing Date"].dt.year == year)
-    ]
-
-    if usa_clean.empty:
+    if usa_cells["Rows"].sum() == 0:
         print("No values found in USA sheet.")
-    if uk_clean.empty:
+    if uk_cells["Rows"].sum() == 0:
         print("No values found in UK sheet.")
         return
-    if usa_clean.empty and uk_clean.empty:
-        return
-
-    usa_clean = usa_clean.drop_duplicates(subset=["Name"], keep="first")
-    uk_clean = uk_clean.drop_duplicates(subset=["Name"], keep="first")
-    Issues_usa = usa_clean["Issues"].value_counts()
-    Issues_uk = uk_clean["Issues"].value_counts()
-    total_usa = usa_clean["Name"].nunique()
-    total_uk = uk_clean["Name"].nunique()
-    total_unique_clients = total_usa + total_uk
-
-    combined = pd.concat([usa_clean[["Name", "Brand", "Project Manager", "Email"]],
-                          uk_clean[["Name", "Brand", "Project Manager", "Email"]]])
-    combined.index = range(1, len(combined) + 1)
-
-    brands = usa_clean["Brand"].value_counts()
-    writers_clique = brands.get("Writers Clique", 0)
-    bookmarketeers = brands.get("BookMarketeers", 0)
-    aurora_writers = brands.get("Aurora Writers", 0)
-    kdp = brands.get("KDP", 0)
-
-    uk_brand = uk_clean["Brand"].value_counts()
-    authors_solution = uk_brand.get("Authors Solution", 0)
-    book_publication = uk_brand.get("Book Publication", 0)
-
-    usa_platforms = usa_clean_platforms["Platform"].value_counts()
-    usa_amazon = usa_platforms.get("Amazon", 0)
-    usa_bn = usa_platforms.get("Barnes & Noble", 0)
-    usa_ingram = usa_platforms.get("Ingram Spark", 0)
-    usa_d2d = usa_platforms.get("Draft2Digital", 0)
-    usa_lulu = usa_platforms.get("LULU", 0)
-    usa_kobo = usa_platforms.get("Kobo", 0)
-    usa_fav = usa_platforms.get("FAV", 0)
-    usa_acx = usa_platforms.get("ACX", 0)
-
-    uk_platforms = uk_clean_platforms["Platform"].value_counts()
-    uk_amazon = uk_platforms.get("Amazon", 0)
-    uk_bn = uk_platforms.get("Barnes & Noble", 0)
-    uk_ingram = uk_platforms.get("Ingram Spark", 0)
-    uk_d2d = uk_platforms.get("Draft2Digital", 0)
-    uk_lulu = uk_platforms.get("LULU", 0)
-    uk_fav = uk_platforms.get("FAV", 0)
-    uk_kobo = uk_platforms.get("Kobo", 0)
-    uk_acx = uk_platforms.get("ACX", 0)
-
-    allowed_brands = ["BookMarketeers", "Writers Clique", "Aurora Writers", "Authors Solution", "Book Publication"]
-
-    if "Trustpilot Review" in usa_clean.columns and "Brand" in usa_clean.columns:
-        usa_filtered = usa_clean[usa_clean["Brand"].isin(allowed_brands)]
-        usa_review_sent = usa_filtered["Trustpilot Review"].value_counts().get("Sent", 0)
-        usa_review_pending = usa_filtered["Trustpilot Review"].value_counts().get("Pending", 0)
-        usa_review_na = usa_filtered["Trustpilot Review"].value_counts().get("Negative", 0)
-    else:
-        usa_review_sent = usa_review_pending = usa_review_na = 0
 
-    if "Trustpilot Review" in uk_clean.columns and "Brand" in uk_clean.columns:
-        uk_filtered = uk_clean[uk_clean["Brand"].isin(allowed_brands)]
-        uk_review_sent = uk_filtered["Trustpilot Review"].value_counts().get("Sent", 0)
-        uk_review_pending = uk_filtered["Trustpilot Review"].value_counts().get("Pending", 0)
-        uk_review_na = uk_filtered["Trustpilot Review"].value_counts().get("Negative", 0)
-    else:
-        uk_review_sent = uk_review_pending = uk_review_na = 0
+    # A client's first row of the range is their first of a year they had not published in since before start_year
+    usa_first_cells = usa_cells[usa_cells["Previous Year"] < start_year]
+    uk_first_cells = uk_cells[uk_cells["Previous Year"] < start_year]
 
-    combined_pending_sent = pd.concat([usa_clean, uk_clean], ignore_index=True)
-    pending_sent_details = combined_pending_sent[
-        ((combined_pending_sent["Trustpilot Review"] == "Sent") |
-         (combined_pending_sent["Trustpilot Review"] == "Pending")) &
-        (combined_pending_sent["Brand"].isin(allowed_brands))
-        ]
-    pending_sent_details = pending_sent_details[["Name", "Brand", "Project Manager", "Trustpilot Review", "Status"]]
-    pending_sent_details.index = range(1, len(pending_sent_details) + 1)
+    (_, usa_pm_counts), (_, uk_pm_counts) = _range_pm_reviews(cube, start_year, end_year)
+    usa_review_states = _review_states(usa_first_cells, "Year Clients", review_brands)
+    uk_review_states = _review_states(uk_first_cells, "Year Clients", review_brands)
 
-    pm_list_usa = list(set((usa_clean["Project Manager"].dropna().unique().tolist() + ["Unknown"])))
-    pm_list_uk = list(set((uk_clean["Project Manager"].dropna().unique().tolist() + ["Unknown"])))
+    usa_review = {
+        "Attained": usa_pm_counts["Attained"].sum(),
+        "Sent": usa_review_states.get("Sent", 0),
+        "Pending": usa_review_states.get("Pending", 0),
+        "Negative": usa_pm_counts["Negative"].sum()
+    }
 
-    usa_reviews_per_pm = safe_concat([load_reviews_year(sheet_usa, year, pm, "Attained") for pm in pm_list_usa])
-    uk_reviews_per_pm = safe_concat([load_reviews_year(sheet_uk, year, pm, "Attained") for pm in pm_list_uk])
-    combined_data = safe_concat([usa_reviews_per_pm, uk_reviews_per_pm])
+    uk_review = {
+        "Attained": uk_pm_counts["Attained"].sum(),
+        "Sent": uk_review_states.get("Sent", 0),
+        "Pending": uk_review_states.get("Pending", 0),
+        "Negative": uk_pm_counts["Negative"].sum()
+    }
 
-    usa_monthly = (
-        usa_clean.groupby(usa_clean["Publishing Date"].dt.to_period("M"))
-        .size()
-        .reset_index(name="USA Published")
-    )
-    usa_monthly["Month"] = usa_monthly["Publishing Date"].dt.strftime("%B %Y")
-    usa_monthly = usa_monthly[["Month", "USA Published"]]
+    usa_monthly = cube_monthly(usa_first_cells, "Year Clients", "USA Published")
 
-    uk_monthly = (
-        uk_clean.groupby(uk_clean["Publishing Date"].dt.to_period("M"))
-        .size()
-        .reset_index(name="UK Published")
-    )
-    uk_monthly["Month"] = uk_monthly["Publishing Date"].dt.strftime("%B %Y")
-    uk_monthly = uk_monthly[["Month", "UK Published"]]
+    uk_monthly = cube_monthly(uk_first_cells, "Year Clients", "UK Published")
 
     combined_monthly = pd.merge(
         usa_monthly,
         uk_monthly,
-        on="Month",
+        on=["Month", "Month_Sort"],
         how="outer"
     ).fillna(0)
 
-    combined_monthly["Total Published"] = combined_monthly["USA Published"] + combined_monthly["UK Published"]
+    combined_monthly["Total Published"] = (
+            combined_monthly["USA Published"] +
+            combined_monthly["UK Published"]
+    )
 
-    combined_monthly["Month_Num"] = pd.to_datetime(combined_monthly["Month"], format="%B %Y")
-    combined_monthly = combined_monthly.sort_values("Total Published", ascending=False).drop(columns="Month_Num")
+    combined_monthly = (
+        combined_monthly
+        .sort_values("Month_Sort")
+        .drop(columns="Month_Sort")
+    )
 
     combined_monthly.index = range(1, len(combined_monthly) + 1)
 
-    if not usa_reviews_per_pm.empty:
-        usa_attained_pm = (
-            usa_reviews_per_pm
-            .groupby("Project Manager")["Trustpilot Review"]
-            .count()
-            .reset_index()
-        )
-        usa_attained_pm.columns = ["Project Manager", "Attained Reviews"]
-        usa_attained_pm.index = range(1, len(usa_attained_pm) + 1)
-        usa_total_attained = usa_attained_pm["Attained Reviews"].sum()
-    else:
-        usa_attained_pm = pd.DataFrame(columns=["Project Manager", "Attained Reviews"])
-        usa_total_attained = 0
+    return SummaryResult(("years", start_year, end_year, review_brands), data_version,
+                         usa_review=usa_review, uk_review=uk_review,
+                         monthly_printing=cube_printing_months(cube_cells(cube[sheet_printing], start_year, end_year)),
+                         publishing_per_month=combined_monthly,
+                         **_client_kpis(usa_cells, uk_cells, usa_first_cells, uk_first_cells, "Year Clients"),
+                         **_other_sheet_kpis(cube, start_year, end_year))
 
-    if not uk_reviews_per_pm.empty:
-        uk_attained_pm = (
-            uk_reviews_per_pm
-            .groupby("Project Manager")["Trustpilot Review"]
-            .count()
-            .reset_index()
-        )
-        uk_attained_pm.columns = ["Project Manager", "Attained Reviews"]
-        uk_attained_pm.index = range(1, len(uk_attained_pm) + 1)
-        uk_total_attained = uk_attained_pm["Attained Reviews"].sum()
-    else:
-        uk_attained_pm = pd.DataFrame(columns=["Project Manager", "Attained Reviews"])
-        uk_total_attained = 0
 
-    if not combined_data.empty:
-        attained_reviews_per_pm = (
-            combined_data
-            .groupby("Project Manager")["Trustpilot Review"]
-            .count()
-            .reset_index()
-        )
-        attained_reviews_per_pm.columns = ["Project Manager", "Attained Reviews"]
-        attained_reviews_per_pm = attained_reviews_per_pm.sort_values(by="Attained Reviews", ascending=False)
-        attained_reviews_per_pm.index = range(1, len(attained_reviews_per_pm) + 1)
+@st.cache_data(show_spinner=False, max_entries=64)
+def _year_summary(year: int, data_version: str):
+    return _years_summary(year, year, data_version, review_state_brands)
 
-        review_details_df = combined_data.sort_values(by="Project Manager", ascending=True)
-        review_details_df["Trustpilot Review Date"] = pd.to_datetime(
-            review_details_df["Trustpilot Review Date"], errors="coerce"
-        ).dt.strftime("%d-%B-%Y")
 
-        attained_details = review_details_df[
-            ["Project Manager", "Name", "Brand", "Trustpilot Review Date", "Trustpilot Review Links", "Status"]
-        ]
-        attained_details.index = range(1, len(attained_details) + 1)
-
-        attained_details["Trustpilot Review Date"] = pd.to_datetime(
-            attained_details["Trustpilot Review Date"], errors="coerce"
-        )
-        attained_count = (
-            attained_details
-            .groupby("Project Manager")
-            .size()
-            .reset_index(name="Count")
-        )
-        attained_clients = (
-            attained_details
-            .groupby("Project Manager")
-            ["Name"].apply(list)
-            .reset_index(name="Clients")
-        )
-        merged_attained = attained_count.merge(attained_clients, on="Project Manager", how="left")
-        merged_attained = merged_attained.sort_values(by="Count", ascending=False)
-        merged_attained.index = range(1, len(merged_attained) + 1)
-        if not usa_reviews_per_pm.empty:
-            usa_attained_monthly = (
-                usa_reviews_per_pm.groupby(usa_reviews_per_pm["Trustpilot Review Date"].dt.to_period("M"))
-                .size()
-                .reset_index(name="USA Attained Reviews")
-            )
-            usa_attained_monthly["Month"] = usa_attained_monthly["Trustpilot Review Date"].dt.strftime("%B %Y")
-            usa_attained_monthly = usa_attained_monthly[["Month", "USA Attained Reviews"]]
-        else:
-            usa_attained_monthly = pd.DataFrame(columns=["Month", "USA Attained Reviews"])
-
-        if not uk_reviews_per_pm.empty:
-            uk_attained_monthly = (
-                uk_reviews_per_pm.groupby(uk_reviews_per_pm["Trustpilot Review Date"].dt.to_period("M"))
-                .size()
-                .reset_index(name="UK Attained Reviews")
-            )
-            uk_attained_monthly["Month"] = uk_attained_monthly["Trustpilot Review Date"].dt.strftime("%B %Y")
-            uk_attained_monthly = uk_attained_monthly[["Month", "UK Attained Reviews"]]
-        else:
-            uk_attained_monthly = pd.DataFrame(columns=["Month", "UK Attained Reviews"])
-        attained_reviews_per_month = pd.merge(
-            usa_attained_monthly,
-            uk_attained_monthly,
-            on="Month",
-            how="outer"
-        ).fillna(0)
-
-        attained_reviews_per_month["Total Attained Reviews"] = (
-                attained_reviews_per_month["USA Attained Reviews"] + attained_reviews_per_month["UK Attained Reviews"]
-        )
-
-        attained_reviews_per_month["Month_Num"] = pd.to_datetime(attained_reviews_per_month["Month"], format="%B %Y")
-        attained_reviews_per_month = attained_reviews_per_month.sort_values(by="Total Attained Reviews",
-                                                                            ascending=False)
-        attained_reviews_per_month.index = range(1, len(attained_reviews_per_month) + 1)
-        attained_reviews_per_month = attained_reviews_per_month.drop(columns="Month_Num")
-
-        attained_details["Trustpilot Review Date"] = pd.to_datetime(
-            attained_details["Trustpilot Review Date"], errors="coerce"
-        ).dt.strftime("%d-%B-%Y")
-
-    else:
-        attained_reviews_per_pm = pd.DataFrame(columns=["Project Manager", "Attained Reviews"])
-        attained_details = pd.DataFrame(
-            columns=["Project Manager", "Name", "Brand", "Trustpilot Review Date", "Trustpilot Review Links", "Status"])
-        attained_reviews_per_month = pd.DataFrame(columns=["Month", "Total Attained Reviews"])
+@st.cache_data(show_spinner=False, max_entries=64)
+def _year_summary_multiple(start_year: int, end_year: int, data_version: str):
+    return _years_summary(start_year, end_year, data_version, review_state_brands + ("Books Publisher",))
 
-    usa_negative_per_pm = [load_reviews_year(sheet_usa, year, pm, "Negative") for pm in pm_list_usa]
-    usa_negative_per_pm = safe_concat([df for df in usa_negative_per_pm if not df.empty])
 
-    uk_negative_per_pm = [load_reviews_year(sheet_uk, year, pm, "Negative") for pm in pm_list_uk]
-    uk_negative_per_pm = safe_concat([df for df in uk_negative_per_pm if not df.empty])
-
-    combined_negative_data = safe_concat([usa_negative_per_pm, uk_negative_per_pm])
-
-    if not usa_negative_per_pm.empty:
-        usa_negative_pm = (
-            usa_negative_per_pm
-            .groupby("Project Manager")["Trustpilot Review"]
-            .count()
-            .reset_index()
-        )
-        usa_negative_pm.columns = ["Project Manager", "Negative Reviews"]
-        usa_negative_pm.index = range(1, len(usa_negative_pm) + 1)
-        usa_total_negative = usa_negative_pm["Negative Reviews"].sum()
-    else:
-        usa_negative_pm = pd.DataFrame(columns=["Project Manager", "Negative Reviews"])
-        usa_total_negative = 0
-
-    if not uk_negative_per_pm.empty:
-        uk_negative_pm = (
-            uk_negative_per_pm
-            .groupby("Project Manager")["Trustpilot Review"]
-            .count()
-            .reset_index()
+@st.cache_data(show_spinner=False, max_entries=64)
+def _client_details(period: tuple, data_version: str) -> dict[str, pd.DataFrame]:
+    """Clients list (a month keeps each client's last row, a range their first) and pending / sent reviews"""
+    if period[0] == "month":
+        _, month, year = period
+        keep, review_brands = "last", review_state_brands
+        uk_clean, usa_clean = run_parallel(
+            lambda: _publishing_rows(sheet_uk, year, month=month),
+            lambda: _publishing_rows(sheet_usa, year, month=month),
         )
-        uk_negative_pm.columns = ["Project Manager", "Negative Reviews"]
-        uk_negative_pm.index = range(1, len(uk_negative_pm) + 1)
-        uk_total_negative = uk_negative_pm["Negative Reviews"].sum()
     else:
-        uk_negative_pm = pd.DataFrame(columns=["Project Manager", "Negative Reviews"])
-        uk_total_negative = 0
-
-    if not combined_negative_data.empty:
-
-        negative_reviews_per_pm = (
-            combined_negative_data
-            .groupby("Project Manager")["Trustpilot Review"]
-            .count()
-            .reset_index()
-        )
-        negative_reviews_per_pm.columns = ["Project Manager", "Negative Reviews"]
-        negative_reviews_per_pm = negative_reviews_per_pm.sort_values(by="Negative Reviews", ascending=False)
-        negative_reviews_per_pm.index = range(1, len(negative_reviews_per_pm) + 1)
-
-        negative_details_df = combined_negative_data.sort_values(by="Project Manager", ascending=True)
-        negative_details_df["Trustpilot Review Date"] = pd.to_datetime(
-            negative_details_df["Trustpilot Review Date"], errors="coerce"
-        ).dt.strftime("%d-%B-%Y")
-
-        negative_details = negative_details_df[
-            ["Project Manager", "Name", "Brand", "Trustpilot Review Date", "Trustpilot Review Links", "Status"]
-        ]
-        negative_details.index = range(1, len(negative_details) + 1)
-
-        negative_details["Trustpilot Review Date"] = pd.to_datetime(
-            negative_details["Trustpilot Review Date"], errors="coerce"
+        _, start_year, end_year, review_brands = period
+        keep = "first"
+        uk_clean, usa_clean = run_parallel(
+            lambda: _publishing_rows(sheet_uk, start_year, end_year),
+            lambda: _publishing_rows(sheet_usa, start_year, end_year),
         )
 
-        if not usa_negative_per_pm.empty:
-            usa_negative_monthly = (
-                usa_negative_per_pm.groupby(usa_negative_per_pm["Trustpilot Review Date"].dt.to_period("M"))
-                .size()
-                .reset_index(name="USA Negative Reviews")
-            )
-            usa_negative_monthly["Month"] = usa_negative_monthly["Trustpilot Review Date"].dt.strftime("%B %Y")
-            usa_negative_monthly = usa_negative_monthly[["Month", "USA Negative Reviews"]]
-        else:
-            usa_negative_monthly = pd.DataFrame(columns=["Month", "USA Negative Reviews"])
-
-        # UK monthly negative reviews
-        if not uk_negative_per_pm.empty:
-            uk_negative_monthly = (
-                uk_negative_per_pm.groupby(uk_negative_per_pm["Trustpilot Review Date"].dt.to_period("M"))
-                .size()
-                .reset_index(name="UK Negative Reviews")
-            )
-            uk_negative_monthly["Month"] = uk_negative_monthly["Trustpilot Review Date"].dt.strftime("%B %Y")
-            uk_negative_monthly = uk_negative_monthly[["Month", "UK Negative Reviews"]]
-        else:
-            uk_negative_monthly = pd.DataFrame(columns=["Month", "UK Negative Reviews"])
-
-        # Merge USA and UK negative trends
-        negative_reviews_per_month = pd.merge(
-            usa_negative_monthly,
-            uk_negative_monthly,
-            on="Month",
-            how="outer"
-        ).fillna(0)
-
-        negative_reviews_per_month["Total Negative Reviews"] = (
-                negative_reviews_per_month["USA Negative Reviews"] + negative_reviews_per_month["UK Negative Reviews"]
-        )
-
-        # Sort by month
-        negative_reviews_per_month["Month_Num"] = pd.to_datetime(negative_reviews_per_month["Month"], format="%B %Y")
-        negative_reviews_per_month = negative_reviews_per_month.sort_values(by="Total Negative Reviews",
-                                                                            ascending=False)
-        negative_reviews_per_month.index = range(1, len(negative_reviews_per_month) + 1)
-        negative_reviews_per_month = negative_reviews_per_month.drop(columns="Month_Num")
-        negative_details["Trustpilot Review Date"] = pd.to_datetime(
-            negative_details["Trustpilot Review Date"], errors="coerce"
-        ).dt.strftime("%d-%B-%Y")
-
-    else:
-        negative_reviews_per_pm = pd.DataFrame(columns=["Project Manager", "Negative Reviews"])
-        negative_details = pd.DataFrame(
-            columns=["Project Manager", "Name", "Brand", "Trustpilot Review Date", "Trustpilot Review Links", "Status"])
-        negative_reviews_per_month = pd.DataFrame(columns=["Month", "Total Negative Reviews"])
-
-    usa_review = {
-        "Attained": usa_total_attained,
-        "Sent": usa_review_sent,
-        "Pending": usa_review_pending,
-        "Negative": usa_total_negative
-    }
-
-    uk_review = {
-        "Attained": uk_total_attained,
-        "Sent": uk_review_sent,
-        "Pending": uk_review_pending,
-        "Negative": uk_total_negative
-    }
+    usa_clean = usa_clean.drop_duplicates(subset=["Name"], keep=keep)
+    uk_clean = uk_clean.drop_duplicates(subset=["Name"], keep=keep)
 
-    printing_data, monthly_printing = printing_data_year(year)
-    Total_copies = printing_data["No of Copies"].sum() if "No of Copies" in printing_data.columns else 0
-    Total_cost = printing_data["Order Cost"].sum() if "Order Cost" in printing_data.columns else 0
-    Highest_cost = printing_data["Order Cost"].max() if "Order Cost" in printing_data.columns else 0
-    Highest_copies = printing_data["No of Copies"].max() if "No of Copies" in printing_data.columns else 0
-    Lowest_cost = printing_data["Order Cost"].min() if "Order Cost" in printing_data.columns else 0
-    Lowest_copies = printing_data["No of Copies"].min() if "No of Copies" in printing_data.columns else 0
-
-    Average = Total_cost / Total_copies if Total_copies > 0 else 0
-    if all(col in printing_data.columns for col in ["Order Cost", "No of Copies"]):
-        printing_data['Cost_Per_Copy'] = printing_data['Order Cost'] / printing_data['No of Copies']
-
-    copyright_data, result_count, result_count_no = copyright_year(year)
-    Total_copyrights = len(copyright_data)
-    country = copyright_data["Country"].value_counts()
-    usa = country.get("USA", 0)
-    canada = country.get("Canada", 0)
-    uk = country.get("UK", 0)
-    Total_cost_copyright = (usa * 65) + (canada * 46) + (uk * 42)
-
-    a_plus, a_plus_count = get_A_plus_year(year)
-
-    usa_brands = {'BookMarketeers': bookmarketeers, 'Writers Clique': writers_clique, 'KDP': kdp,
-                  'Aurora Writers': aurora_writers}
-    uk_brands = {'Authors Solution': authors_solution, 'Book Publication': book_publication}
-
-    usa_platforms = {'Amazon': usa_amazon, 'Barnes & Noble': usa_bn, 'Ingram Spark': usa_ingram,"Draft2Digital":usa_d2d,"Kobo": usa_kobo, "LULU":usa_lulu, "FAV": usa_fav, "ACX": usa_acx}
-    uk_platforms = {'Amazon': uk_amazon, 'Barnes & Noble': uk_bn, 'Ingram Spark': uk_ingram, "Draft2Digital":uk_d2d,"Kobo": uk_kobo,"LULU":uk_lulu, "FAV": uk_fav,
-                     "ACX": uk_acx}
-
-    printing_stats = {
-        'Total_copies': Total_copies,
-        'Total_cost': Total_cost,
-        'Highest_cost': Highest_cost,
-        'Lowest_cost': Lowest_cost,
-        'Highest_copies': Highest_copies,
-        'Lowest_copies': Lowest_copies,
-        'Average': Average
-    }
-
-    copyright_stats = {
-        'Total_copyrights': Total_copyrights,
-        'Total_cost_copyright': Total_cost_copyright,
-        'result_count': result_count,
-        'result_count_no': result_count_no,
-        'usa_copyrights': usa,
-        'canada_copyrights': canada,
-        'uk': uk
-    }
-
-    return usa_review, uk_review, usa_brands, uk_brands, usa_platforms, uk_platforms, printing_stats, monthly_printing, copyright_stats, a_plus_count, total_unique_clients, combined, attained_reviews_per_pm, attained_details, merged_attained,  attained_reviews_per_month, pending_sent_details, negative_reviews_per_pm, negative_details, negative_reviews_per_month, combined_monthly, Issues_usa, Issues_uk
-
-
-def generate_year_summary_multiple(start_year: int, end_year: int):
-    uk_clean = clean_data_reviews(sheet_uk)
-    usa_clean = clean_data_reviews(sheet_usa)
-
-    usa_clean = usa_clean[
-        (usa_clean["Publishing Date"].dt.year >= start_year) &
-        (usa_clean["Publishing Date"].dt.year <= end_year)
-
-    ]
-    uk_clean = uk_clean[
-        (uk_clean["Publishing Date"].dt.year >= start_year) &
-        (uk_clean["Publishing Date"].dt.year <= end_year)
-    ]
-
-    usa_clean_platforms = usa_clean[
-        (usa_clean["Publishing Date"].dt.year >= start_year) &
-        (usa_clean["Publishing Date"].dt.year <= end_year)
-        ]
-    uk_clean_platforms = uk_clean[
-        (uk_clean["Publishing Date"].dt.year >= start_year) &
-        (uk_clean["Publishing Date"].dt.year <= end_year)
-    ]
-
-    if usa_clean.empty:
-        print("No values found in USA sheet.")
-    if uk_clean.empty:
-        print("No values found in UK sheet.")
-        return
-    if usa_clean.empty and uk_clean.empty:
-        return
-
-    usa_clean = usa_clean.drop_duplicates(subset=["Name"], keep="first")
-    uk_clean = uk_clean.drop_duplicates(subset=["Name"], keep="first")
-    Issues_usa = usa_clean["Issues"].value_counts()
-    Issues_uk = uk_clean["Issues"].value_counts()
-    total_usa = usa_clean["Name"].nunique()
-    total_uk = uk_clean["Name"].nunique()
-    total_unique_clients = total_usa + total_uk
-
-    combined = pd.concat([usa_clean[["Name", "Brand", "Project Manager", "Email"]],
-                          uk_clean[["Name", "Brand", "Project Manager", "Email"]]])
+    combined = pd.concat([usa_clean[client_columns], uk_clean[client_columns]])
     combined.index = range(1, len(combined) + 1)
 
-    brands = usa_clean["Brand"].value_counts()
-    writers_clique = brands.get("Writers Clique", 0)
-    bookmarketeers = brands.get("BookMarketeers", 0)
-    aurora_writers = brands.get("Aurora Writers", 0)
-    kdp = brands.get("KDP", 0)
-
-    uk_brand = uk_clean["Brand"].value_counts()
-    authors_solution = uk_brand.get("Authors Solution", 0)
-    book_publication = uk_brand.get("Book Publication", 0)
-
-    usa_platforms = usa_clean_platforms["Platform"].value_counts()
-    usa_amazon = usa_platforms.get("Amazon", 0)
-    usa_bn = usa_platforms.get("Barnes & Noble", 0)
-    usa_ingram = usa_platforms.get("Ingram Spark", 0)
-    usa_d2d = usa_platforms.get("Draft2Digital", 0)
-    usa_lulu = usa_platforms.get("LULU", 0)
-    usa_fav = usa_platforms.get("FAV", 0)
-    usa_kobo = usa_platforms.get("Kobo", 0)
-    usa_acx = usa_platforms.get("ACX", 0)
-
-    uk_platforms = uk_clean_platforms["Platform"].value_counts()
-    uk_amazon = uk_platforms.get("Amazon", 0)
-    uk_bn = uk_platforms.get("Barnes & Noble", 0)
-    uk_ingram = uk_platforms.get("Ingram Spark", 0)
-    uk_d2d = uk_platforms.get("Draft2Digital", 0)
-    uk_lulu = uk_platforms.get("LULU", 0)
-    uk_fav = uk_platforms.get("FAV", 0)
-    uk_kobo = uk_platforms.get("Kobo", 0)
-    uk_acx = uk_platforms.get("ACX", 0)
-
-    allowed_brands = ["BookMarketeers", "Writers Clique", "Aurora Writers", "Authors Solution", "Book Publication"]
-
-    if "Trustpilot Review" in usa_clean.columns and "Brand" in usa_clean.columns:
-        usa_filtered = usa_clean[usa_clean["Brand"].isin(allowed_brands)]
-        usa_review_sent = usa_filtered["Trustpilot Review"].value_counts().get("Sent", 0)
-        usa_review_pending = usa_filtered["Trustpilot Review"].value_counts().get("Pending", 0)
-        usa_review_na = usa_filtered["Trustpilot Review"].value_counts().get("Negative", 0)
-    else:
-        usa_review_sent = usa_review_pending = usa_review_na = 0
-
-    if "Trustpilot Review" in uk_clean.columns and "Brand" in uk_clean.columns:
-        uk_filtered = uk_clean[uk_clean["Brand"].isin(allowed_brands)]
-        uk_review_sent = uk_filtered["Trustpilot Review"].value_counts().get("Sent", 0)
-        uk_review_pending = uk_filtered["Trustpilot Review"].value_counts().get("Pending", 0)
-        uk_review_na = uk_filtered["Trustpilot Review"].value_counts().get("Negative", 0)
-    else:
-        uk_review_sent = uk_review_pending = uk_review_na = 0
-
     combined_pending_sent = pd.concat([usa_clean, uk_clean], ignore_index=True)
     pending_sent_details = combined_pending_sent[
         ((combined_pending_sent["Trustpilot Review"] == "Sent") |
          (combined_pending_sent["Trustpilot Review"] == "Pending")) &
-        (combined_pending_sent["Brand"].isin(allowed_brands))
+        (combined_pending_sent["Brand"].isin(review_brands))
         ]
-    pending_sent_details = pending_sent_details[["Name", "Brand", "Project Manager", "Trustpilot Review", "Status"]]
+    pending_sent_details = pending_sent_details[pending_sent_columns]
     pending_sent_details.index = range(1, len(pending_sent_details) + 1)
 
-    pm_list_usa = list(set((usa_clean["Project Manager"].dropna().unique().tolist() + ["Unknown"])))
-    pm_list_uk = list(set((uk_clean["Project Manager"].dropna().unique().tolist() + ["Unknown"])))
-
-    usa_reviews_per_pm = safe_concat([load_reviews_year_multiple(sheet_usa, start_year, end_year, pm, "Attained") for pm in pm_list_usa])
-    uk_reviews_per_pm = safe_concat([load_reviews_year_multiple(sheet_uk, start_year, end_year, pm, "Attained") for pm in pm_list_uk])
-    combined_data = safe_concat([usa_reviews_per_pm, uk_reviews_per_pm])
-
-    usa_monthly = (
-        usa_clean.groupby(usa_clean["Publishing Date"].dt.to_period("M"))
-        .size()
-        .reset_index(name="USA Published")
-    )
-    usa_monthly["Month"] = usa_monthly["Publishing Date"].dt.strftime("%B %Y")
-    usa_monthly = usa_monthly[["Month", "USA Published"]]
-
-    uk_monthly = (
-        uk_clean.groupby(uk_clean["Publishing Date"].dt.to_period("M"))
-        .size()
-        .reset_index(name="UK Published")
-    )
-    uk_monthly["Month"] = uk_monthly["Publishing Date"].dt.strftime("%B %Y")
-    uk_monthly = uk_monthly[["Month", "UK Published"]]
-
-    combined_monthly = pd.merge(
-        usa_monthly,
-        uk_monthly,
-        on="Month",
-        how="outer"
-    ).fillna(0)
-
-    combined_monthly["Total Published"] = combined_monthly["USA Published"] + combined_monthly["UK Published"]
+    return {"combined": combined, "pending_sent_details": pending_sent_details}
 
-    combined_monthly["Month_Num"] = pd.to_datetime(combined_monthly["Month"], format="%B %Y")
-    combined_monthly = combined_monthly.sort_values("Total Published", ascending=False).drop(columns="Month_Num")
-
-    combined_monthly.index = range(1, len(combined_monthly) + 1)
 
-    if not usa_reviews_per_pm.empty:
-        usa_attained_pm = (
-            usa_reviews_per_pm
-            .groupby("Project Manager")["Trustpilot Review"]
-            .count()
-            .reset_index()
-        )
-        usa_attained_pm.columns = ["Project Manager", "Attained Reviews"]
-        usa_attained_pm.index = range(1, len(usa_attained_pm) + 1)
-        usa_total_attained = usa_attained_pm["Attained Reviews"].sum()
-    else:
-        usa_attained_pm = pd.DataFrame(columns=["Project Manager", "Attained Reviews"])
-        usa_total_attained = 0
+def _month_review_tables(combined_data: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """Attained and negative reviews per PM and their details, from a month's review rows"""
+    if combined_data.empty:
+        attained_details = pd.DataFrame(columns=review_detail_columns)
+        return {
+            "attained_reviews_per_pm": pd.DataFrame(columns=["Project Manager", "Attained Reviews"]),
+            "attained_details": attained_details,
+            "negative_reviews_per_pm": pd.DataFrame(columns=["Project Manager", "Negative Reviews"]),
+            "negative_details": attained_details.copy(),
+        }
 
-    if not uk_reviews_per_pm.empty:
-        uk_attained_pm = (
-            uk_reviews_per_pm
-            .groupby("Project Manager")["Trustpilot Review"]
-            .count()
-            .reset_index()
-        )
-        uk_attained_pm.columns = ["Project Manager", "Attained Reviews"]
-        uk_attained_pm.index = range(1, len(uk_attained_pm) + 1)
-        uk_total_attained = uk_attained_pm["Attained Reviews"].sum()
-    else:
-        uk_attained_pm = pd.DataFrame(columns=["Project Manager", "Attained Reviews"])
-        uk_total_attained = 0
+    review_details_df = combined_data.sort_values(by="Project Manager", ascending=True)
+    review_details_df["Trustpilot Review Date"] = format_dates(review_details_df["Trustpilot Review Date"])
 
-    if not combined_data.empty:
-        attained_reviews_per_pm = (
-            combined_data
+    tables = {}
+    for review_type in ("Attained", "Negative"):
+        label = f"{review_type} Reviews"
+        reviews_per_pm = (
+            combined_data[combined_data["Trustpilot Review"] == review_type]
             .groupby("Project Manager")["Trustpilot Review"]
             .count()
-            .reset_index()
+            .reset_index(name=label)
         )
-        attained_reviews_per_pm.columns = ["Project Manager", "Attained Reviews"]
-        attained_reviews_per_pm = attained_reviews_per_pm.sort_values(by="Attained Reviews", ascending=False)
-        attained_reviews_per_pm.index = range(1, len(attained_reviews_per_pm) + 1)
-
-        review_details_df = combined_data.sort_values(by="Project Manager", ascending=True)
-        review_details_df["Trustpilot Review Date"] = pd.to_datetime(
-            review_details_df["Trustpilot Review Date"], errors="coerce"
-        ).dt.strftime("%d-%B-%Y")
+        reviews_per_pm = reviews_per_pm.sort_values(by=label, ascending=False)
+        reviews_per_pm.index = range(1, len(reviews_per_pm) + 1)
+
+        details = review_details_df[review_details_df["Trustpilot Review"] == review_type][review_detail_columns]
+        details.index = range(1, len(details) + 1)
+
+        tables[f"{review_type.lower()}_reviews_per_pm"] = reviews_per_pm
+        tables[f"{review_type.lower()}_details"] = details
+
+    return tables
+
+
+def _range_review_tables(usa_rows: pd.DataFrame, uk_rows: pd.DataFrame, review_type: str) -> dict[str, pd.DataFrame]:
+    """Reviews of one type per PM, their details and their count per month, from both sheets' PM reviews"""
+    label = f"{review_type} Reviews"
+    prefix = review_type.lower()
+    combined_data = safe_concat([usa_rows, uk_rows])
+    if combined_data.empty:
+        return {
+            f"{prefix}_reviews_per_pm": pd.DataFrame(columns=["Project Manager", label]),
+            f"{prefix}_details": pd.DataFrame(columns=review_detail_columns),
+            f"{prefix}_reviews_per_month": pd.DataFrame(columns=["Month", f"Total {label}"]),
+        }
+
+    reviews_per_pm = (
+        combined_data
+        .groupby("Project Manager")["Trustpilot Review"]
+        .count()
+        .reset_index()
+    )
+    reviews_per_pm.columns = ["Project Manager", label]
+    reviews_per_pm = reviews_per_pm.sort_values(by=label, ascending=False)
+    reviews_per_pm.index = range(1, len(reviews_per_pm) + 1)
 
-        attained_details = review_details_df[
-            ["Project Manager", "Name", "Brand", "Trustpilot Review Date", "Trustpilot Review Links", "Status"]
-        ]
-        attained_details.index = range(1, len(attained_details) + 1)
+    details = combined_data.sort_values(by="Project Manager", ascending=True)[review_detail_columns]
+    details.index = range(1, len(details) + 1)
 
-        attained_details["Trustpilot Review Date"] = pd.to_datetime(
-            attained_details["Trustpilot Review Date"], errors="coerce"
-        )
-        attained_count = (
-            attained_details
-            .groupby("Project Manager")
-            .size()
-            .reset_index(name="Count")
-        )
-        attained_clients = (
-            attained_details
-            .groupby("Project Manager")
-            ["Name"].apply(list)
-            .reset_index(name="Clients")
-        )
+    tables = {f"{prefix}_reviews_per_pm": reviews_per_pm}
+    if review_type == "Attained":
+        attained_count = details.groupby("Project Manager").size().reset_index(name="Count")
+        attained_clients = details.groupby("Project Manager")["Name"].apply(list).reset_index(name="Clients")
         merged_attained = attained_count.merge(attained_clients, on="Project Manager", how="left")
         merged_attained = merged_attained.sort_values(by="Count", ascending=False)
         merged_attained.index = range(1, len(merged_attained) + 1)
+        tables["merged_attained"] = merged_attained
 
-        if not usa_reviews_per_pm.empty:
-            usa_attained_monthly = (
-                usa_reviews_per_pm.groupby(usa_reviews_per_pm["Trustpilot Review Date"].dt.to_period("M"))
-                .size()
-                .reset_index(name="USA Attained Reviews")
-            )
-            usa_attained_monthly["Month"] = usa_attained_monthly["Trustpilot Review Date"].dt.strftime("%B %Y")
-            usa_attained_monthly = usa_attained_monthly[["Month", "USA Attained Reviews"]]
-        else:
-            usa_attained_monthly = pd.DataFrame(columns=["Month", "USA Attained Reviews"])
-
-        if not uk_reviews_per_pm.empty:
-            uk_attained_monthly = (
-                uk_reviews_per_pm.groupby(uk_reviews_per_pm["Trustpilot Review Date"].dt.to_period("M"))
-                .size()
-                .reset_index(name="UK Attained Reviews")
-            )
-            uk_attained_monthly["Month"] = uk_attained_monthly["Trustpilot Review Date"].dt.strftime("%B %Y")
-            uk_attained_monthly = uk_attained_monthly[["Month", "UK Attained Reviews"]]
-        else:
-            uk_attained_monthly = pd.DataFrame(columns=["Month", "UK Attained Reviews"])
-        attained_reviews_per_month = pd.merge(
-            usa_attained_monthly,
-            uk_attained_monthly,
-            on="Month",
-            how="outer"
-        ).fillna(0)
-
-        attained_reviews_per_month["Total Attained Reviews"] = (
-                attained_reviews_per_month["USA Attained Reviews"] + attained_reviews_per_month["UK Attained Reviews"]
-        )
-
-        attained_reviews_per_month["Month_Num"] = pd.to_datetime(attained_reviews_per_month["Month"], format="%B %Y")
-        attained_reviews_per_month = attained_reviews_per_month.sort_values(by="Total Attained Reviews",
-                                                                            ascending=False)
-        attained_reviews_per_month.index = range(1, len(attained_reviews_per_month) + 1)
-        attained_reviews_per_month = attained_reviews_per_month.drop(columns="Month_Num")
+    monthly = []
+    for country, rows in (("USA", usa_rows), ("UK", uk_rows)):
+        column = f"{country} {label}"
+        if rows.empty:
+            monthly.append(pd.DataFrame(columns=["Month", column]))
+            continue
 
-        attained_details["Trustpilot Review Date"] = pd.to_datetime(
-            attained_details["Trustpilot Review Date"], errors="coerce"
-        ).dt.strftime("%d-%B-%Y")
+        country_monthly = (
+            rows.groupby(rows["Trustpilot Review Date"].dt.to_period("M"))
+            .size()
+            .reset_index(name=column)
+        )
+        country_monthly["Month"] = country_monthly["Trustpilot Review Date"].dt.strftime("%B %Y")
+        monthly.append(country_monthly[["Month", column]])
 
-    else:
-        attained_reviews_per_pm = pd.DataFrame(columns=["Project Manager", "Attained Reviews"])
-        attained_details = pd.DataFrame(
-            columns=["Project Manager", "Name", "Brand", "Trustpilot Review Date", "Trustpilot Review Links", "Status"])
-        attained_reviews_per_month = pd.DataFrame(columns=["Month", "Total Attained Reviews"])
+    reviews_per_month = pd.merge(*monthly, on="Month", how="outer").fillna(0)
+    reviews_per_month[f"Total {label}"] = reviews_per_month[f"USA {label}"] + reviews_per_month[f"UK {label}"]
+    reviews_per_month = reviews_per_month.sort_values(by=f"Total {label}", ascending=False)
+    reviews_per_month.index = range(1, len(reviews_per_month) + 1)
+    tables[f"{prefix}_reviews_per_month"] = reviews_per_month
 
-    usa_negative_per_pm = [load_reviews_year_multiple(sheet_usa, start_year, end_year,  pm, "Negative") for pm in pm_list_usa]
-    usa_negative_per_pm = safe_concat([df for df in usa_negative_per_pm if not df.empty])
+    details["Trustpilot Review Date"] = format_dates(details["Trustpilot Review Date"])
+    tables[f"{prefix}_details"] = details
 
-    uk_negative_per_pm = [load_reviews_year_multiple(sheet_uk, start_year, end_year, pm, "Negative") for pm in pm_list_uk]
-    uk_negative_per_pm = safe_concat([df for df in uk_negative_per_pm if not df.empty])
+    return tables
 
-    combined_negative_data = safe_concat([usa_negative_per_pm, uk_negative_per_pm])
 
-    if not usa_negative_per_pm.empty:
-        usa_negative_pm = (
-            usa_negative_per_pm
-            .groupby("Project Manager")["Trustpilot Review"]
-            .count()
-            .reset_index()
+@st.cache_data(show_spinner=False, max_entries=64)
+def _review_details(period: tuple, data_version: str) -> dict[str, pd.DataFrame]:
+    """Attained and negative review tables of a summary"""
+    if period[0] == "month":
+        _, month, year = period
+        usa_reviews_df, uk_reviews_df = run_parallel(
+            lambda: load_reviews(sheet_usa, year, month),
+            lambda: load_reviews(sheet_uk, year, month),
         )
-        usa_negative_pm.columns = ["Project Manager", "Negative Reviews"]
-        usa_negative_pm.index = range(1, len(usa_negative_pm) + 1)
-        usa_total_negative = usa_negative_pm["Negative Reviews"].sum()
-    else:
-        usa_negative_pm = pd.DataFrame(columns=["Project Manager", "Negative Reviews"])
-        usa_total_negative = 0
+        return _month_review_tables(safe_concat([usa_reviews_df, uk_reviews_df]))
 
-    if not uk_negative_per_pm.empty:
-        uk_negative_pm = (
-            uk_negative_per_pm
-            .groupby("Project Manager")["Trustpilot Review"]
-            .count()
-            .reset_index()
-        )
-        uk_negative_pm.columns = ["Project Manager", "Negative Reviews"]
-        uk_negative_pm.index = range(1, len(uk_negative_pm) + 1)
-        uk_total_negative = uk_negative_pm["Negative Reviews"].sum()
-    else:
-        uk_negative_pm = pd.DataFrame(columns=["Project Manager", "Negative Reviews"])
-        uk_total_negative = 0
+    _, start_year, end_year, _ = period
+    (usa_pm_reviews, _), (uk_pm_reviews, _) = _range_pm_reviews(get_summary_cube(), start_year, end_year)
 
-    if not combined_negative_data.empty:
+    tables = {"merged_attained": pd.DataFrame(columns=["Project Manager", "Count", "Clients"])}
+    tables.update(_range_review_tables(usa_pm_reviews["Attained"], uk_pm_reviews["Attained"], "Attained"))
+    tables.update(_range_review_tables(usa_pm_reviews["Negative"], uk_pm_reviews["Negative"], "Negative"))
 
-        negative_reviews_per_pm = (
-            combined_negative_data
-            .groupby("Project Manager")["Trustpilot Review"]
-            .count()
-            .reset_index()
-        )
-        negative_reviews_per_pm.columns = ["Project Manager", "Negative Reviews"]
-        negative_reviews_per_pm = negative_reviews_per_pm.sort_values(by="Negative Reviews", ascending=False)
-        negative_reviews_per_pm.index = range(1, len(negative_reviews_per_pm) + 1)
+    return tables
 
-        negative_details_df = combined_negative_data.sort_values(by="Project Manager", ascending=True)
-        negative_details_df["Trustpilot Review Date"] = pd.to_datetime(
-            negative_details_df["Trustpilot Review Date"], errors="coerce"
-        ).dt.strftime("%d-%B-%Y")
 
-        negative_details = negative_details_df[
-            ["Project Manager", "Name", "Brand", "Trustpilot Review Date", "Trustpilot Review Links", "Status"]
-        ]
-        negative_details.index = range(1, len(negative_details) + 1)
+_section_builders = {"clients": _client_details, "reviews": _review_details}
 
-        negative_details["Trustpilot Review Date"] = pd.to_datetime(
-            negative_details["Trustpilot Review Date"], errors="coerce"
-        )
 
-        if not usa_negative_per_pm.empty:
-            usa_negative_monthly = (
-                usa_negative_per_pm.groupby(usa_negative_per_pm["Trustpilot Review Date"].dt.to_period("M"))
-                .size()
-                .reset_index(name="USA Negative Reviews")
-            )
-            usa_negative_monthly["Month"] = usa_negative_monthly["Trustpilot Review Date"].dt.strftime("%B %Y")
-            usa_negative_monthly = usa_negative_monthly[["Month", "USA Negative Reviews"]]
-        else:
-            usa_negative_monthly = pd.DataFrame(columns=["Month", "USA Negative Reviews"])
-
-        # UK monthly negative reviews
-        if not uk_negative_per_pm.empty:
-            uk_negative_monthly = (
-                uk_negative_per_pm.groupby(uk_negative_per_pm["Trustpilot Review Date"].dt.to_period("M"))
-                .size()
-                .reset_index(name="UK Negative Reviews")
-            )
-            uk_negative_monthly["Month"] = uk_negative_monthly["Trustpilot Review Date"].dt.strftime("%B %Y")
-            uk_negative_monthly = uk_negative_monthly[["Month", "UK Negative Reviews"]]
-        else:
-            uk_negative_monthly = pd.DataFrame(columns=["Month", "UK Negative Reviews"])
-
-        # Merge USA and UK negative trends
-        negative_reviews_per_month = pd.merge(
-            usa_negative_monthly,
-            uk_negative_monthly,
-            on="Month",
-            how="outer"
-        ).fillna(0)
-
-        negative_reviews_per_month["Total Negative Reviews"] = (
-                negative_reviews_per_month["USA Negative Reviews"] + negative_reviews_per_month["UK Negative Reviews"]
-        )
+def _month_version(month: int, year: int) -> str | None:
+    """Combined digest of the month's partitions, so edits to other months keep its summary cached"""
+    if get_data_version(summary_sheets) is None:
+        return None
 
-        # Sort by month
-        negative_reviews_per_month["Month_Num"] = pd.to_datetime(negative_reviews_per_month["Month"], format="%B %Y")
-        negative_reviews_per_month = negative_reviews_per_month.sort_values(by="Total Negative Reviews",
-                                                                            ascending=False)
-        negative_reviews_per_month.index = range(1, len(negative_reviews_per_month) + 1)
-        negative_reviews_per_month = negative_reviews_per_month.drop(columns="Month_Num")
-        negative_details["Trustpilot Review Date"] = pd.to_datetime(
-            negative_details["Trustpilot Review Date"], errors="coerce"
-        ).dt.strftime("%d-%B-%Y")
+    versions = [get_partition_version(sheet_name, date_column, year, month)
+                for sheet_name, date_column in month_partitions]
+    if None in versions:
+        return get_data_version(summary_sheets)
 
-    else:
-        negative_reviews_per_pm = pd.DataFrame(columns=["Project Manager", "Negative Reviews"])
-        negative_details = pd.DataFrame(
-            columns=["Project Manager", "Name", "Brand", "Trustpilot Review Date", "Trustpilot Review Links", "Status"])
-        negative_reviews_per_month = pd.DataFrame(columns=["Month", "Total Negative Reviews"])
+    return "-".join(versions)
 
-    usa_review = {
-        "Attained": usa_total_attained,
-        "Sent": usa_review_sent,
-        "Pending": usa_review_pending,
-        "Negative": usa_total_negative
-    }
 
-    uk_review = {
-        "Attained": uk_total_attained,
-        "Sent": uk_review_sent,
-        "Pending": uk_review_pending,
-        "Negative": uk_total_negative
-    }
+def summary(month: int, year: int) -> SummaryResult | None:
+    """Monthly summary, recomputed only when rows of that month change in one of the summary sheets"""
+    data_version = _month_version(month, year)
+    if data_version is None:
+        return _summary.__wrapped__(month, year, data_version)
+    return _summary(month, year, data_version)
 
-    printing_data, monthly_printing = printing_data_year_multiple(start_year, end_year)
-    Total_copies = printing_data["No of Copies"].sum() if "No of Copies" in printing_data.columns else 0
-    Total_cost = printing_data["Order Cost"].sum() if "Order Cost" in printing_data.columns else 0
-    Highest_cost = printing_data["Order Cost"].max() if "Order Cost" in printing_data.columns else 0
-    Highest_copies = printing_data["No of Copies"].max() if "No of Copies" in printing_data.columns else 0
-    Lowest_cost = printing_data["Order Cost"].min() if "Order Cost" in printing_data.columns else 0
-    Lowest_copies = printing_data["No of Copies"].min() if "No of Copies" in printing_data.columns else 0
-
-    Average = Total_cost / Total_copies if Total_copies > 0 else 0
-    if all(col in printing_data.columns for col in ["Order Cost", "No of Copies"]):
-        printing_data['Cost_Per_Copy'] = printing_data['Order Cost'] / printing_data['No of Copies']
-
-    copyright_data, result_count, result_count_no = copyright_year_multiple(start_year, end_year)
-    Total_copyrights = len(copyright_data)
-    country = copyright_data["Country"].value_counts()
-    usa = country.get("USA", 0)
-    canada = country.get("Canada", 0)
-    uk = country.get("UK", 0)
-    Total_cost_copyright = (usa * 65) + (canada * 46) + (uk * 42)
-
-    a_plus, a_plus_count = get_A_plus_year_multiple(start_year, end_year)
-
-    usa_brands = {'BookMarketeers': bookmarketeers, 'Writers Clique': writers_clique, 'KDP': kdp,
-                  'Aurora Writers': aurora_writers}
-    uk_brands = {'Authors Solution': authors_solution, 'Book Publication': book_publication}
-
-    usa_platforms = {'Amazon': usa_amazon, 'Barnes & Noble': usa_bn, 'Ingram Spark': usa_ingram,"Draft2Digital":usa_d2d,"Kobo": usa_kobo, "LULU":usa_lulu, "FAV": usa_fav, "ACX": usa_acx}
-    uk_platforms = {'Amazon': uk_amazon, 'Barnes & Noble': uk_bn, 'Ingram Spark': uk_ingram, "Draft2Digital":uk_d2d,"Kobo": uk_kobo,"LULU":uk_lulu, "FAV": uk_fav,
-                     "ACX": uk_acx}
-
-    printing_stats = {
-        'Total_copies': Total_copies,
-        'Total_cost': Total_cost,
-        'Highest_cost': Highest_cost,
-        'Lowest_cost': Lowest_cost,
-        'Highest_copies': Highest_copies,
-        'Lowest_copies': Lowest_copies,
-        'Average': Average
-    }
 
-    copyright_stats = {
-        'Total_copyrights': Total_copyrights,
-        'Total_cost_copyright': Total_cost_copyright,
-        'result_count': result_count,
-        'result_count_no': result_count_no,
-        'usa_copyrights': usa,
-        'canada_copyrights': canada,
-        'uk': uk
-    }
+def generate_year_summary(year: int) -> SummaryResult | None:
+    """Yearly summary, recomputed only when one of the summary sheets changes"""
+    data_version = get_data_version(summary_sheets)
+    if data_version is None:
+        return _year_summary.__wrapped__(year, data_version)
+    return _year_summary(year, data_version)
+
 
-    return usa_review, uk_review, usa_brands, uk_brands, usa_platforms, uk_platforms, printing_stats, monthly_printing, copyright_stats, a_plus_count, total_unique_clients, combined, attained_reviews_per_pm, attained_details, merged_attained, attained_reviews_per_month, pending_sent_details, negative_reviews_per_pm, negative_details, negative_reviews_per_month, combined_monthly, Issues_usa, Issues_uk
+def generate_year_summary_multiple(start_year: int, end_year: int) -> SummaryResult | None:
+    """Summary over a range of years, recomputed only when one of the summary sheets changes"""
+    data_version = get_data_version(summary_sheets)
+    if data_version is None:
+        return _year_summary_multiple.__wrapped__(start_year, end_year, data_version)
+    return _year_summary_multiple(start_year, end_year, data_version)
@@ -0,0 +1,58 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable
+
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+try:
+    from streamlit.runtime.scriptrunner_utils.script_run_context import SCRIPT_RUN_CONTEXT_ATTR_NAME
+except ImportError:
+    # Private module that moves between Streamlit releases, the attribute name has stayed the same
+    SCRIPT_RUN_CONTEXT_ATTR_NAME = "streamlit_script_run_ctx"
+
+# Threads shared by every session for independent report sections (sheet reads and pandas work),
+# one per core up to 4 by default; with a single worker sections simply run one after another
+SECTION_WORKERS = int(os.getenv("SECTION_WORKERS", min(4, os.cpu_count() or 1)))
+
+_executor = ThreadPoolExecutor(max_workers=max(SECTION_WORKERS, 1), thread_name_prefix="section")
+_worker = threading.local()
+
+
+def run_parallel(*calls: Callable[[], object]) -> list:
+    """Run independent calls side by side and return their results in call order.
+
+    The calling thread runs the last call itself while the others go to the section pool. An
+    exception is raised only once every call has finished: the calling thread's own first, else
+    that of the first failing call in call order. Calls made from inside a section run inline,
+    so nested sections cannot use up the pool and wait on themselves.
+    """
+    if len(calls) < 2 or SECTION_WORKERS < 2 or getattr(_worker, "active", False):
+        return [call() for call in calls]
+
+    # Sections may write Streamlit errors, which need the session that asked for them (each
+    # task attaches its caller's context to the pool thread it runs on, and puts the thread's
+    # own context back when done, so no session outlives its tasks on a pool thread)
+    ctx = get_script_run_ctx(suppress_warning=True)
+
+    def run(call):
+        thread = threading.current_thread()
+        previous = get_script_run_ctx(suppress_warning=True)
+        if ctx is not None:
+            add_script_run_ctx(thread, ctx)
+        _worker.active = True
+        try:
+            return call()
+        finally:
+            _worker.active = False
+            # add_script_run_ctx cannot detach (a None ctx means the current one), so reset the attribute
+            setattr(thread, SCRIPT_RUN_CONTEXT_ATTR_NAME, previous)
+
+    futures = [_executor.submit(run, call) for call in calls[:-1]]
+    try:
+        last = calls[-1]()
+    finally:
+        # Every section finishes before anything is raised, the caller's own exception first
+        wait(futures)
+
+    return [future.result() for future in futures] + [last]
@@ -0,0 +1,281 @@
+import hashlib
+import threading
+
+import numpy as np
+import pandas as pd
+from API_loader import get_sheet_data, get_sheet_version, get_sync_delta, get_row_hashes
+
+DATE_FORMAT = "%d-%B-%Y"
+
+# How each sheet is cut, typed and converted once per fetched version.
+# "end_column" drops the helper columns to the right of it, "as_str" mirrors the
+# loaders that stringify every cell first, a None "date_format" lets pandas infer it.
+# "numeric_columns" maps each number column to its nullable dtype, and every other
+# column is kept as text (TEXT_DTYPE).
+SHEET_SCHEMAS = {
+    "USA": {
+        "end_column": "Issues",
+        "date_columns": ["Publishing Date", "Last Edit (Revision)", "Trustpilot Review Date"],
+    },
+    "UK": {
+        "end_column": "Issues",
+        "date_columns": ["Publishing Date", "Last Edit (Revision)", "Trustpilot Review Date"],
+    },
+    "AudioBook": {
+        "end_column": "Issues",
+        "date_columns": ["Publishing Date", "Last Edit (Revision)", "Trustpilot Review Date"],
+    },
+    "Printing": {
+        "end_column": "Accepted",
+        "as_str": True,
+        "date_columns": ["Order Date", "Shipping Date", "Fulfilled"],
+        "numeric_columns": {"Order Cost": "Float64", "No of Copies": "Int64"},
+    },
+    "Copyright": {
+        "end_column": "Country",
+        "as_str": True,
+        "date_columns": ["Submission Date"],
+    },
+    "A_plus": {
+        "end_column": "Issues",
+        "as_str": True,
+        "date_columns": ["A+ Content Date"],
+    },
+    "Sales": {
+        "end_column": "Payment",
+        "date_columns": ["Payment Date"],
+        "date_format": None,
+        "numeric_columns": {"Payment": "Float64"},
+    },
+}
+
+# Text columns are stored as Arrow strings instead of Python objects: a brand, status or PM cell
+# costs its bytes plus an offset, and comparisons, isin and group-by keys run in Arrow. The NaN
+# missing value keeps the object semantics (masks are plain bool arrays, empty cells are NaN).
+TEXT_DTYPE = pd.StringDtype("pyarrow", na_value=np.nan)
+
+_typed_cache: dict[str, tuple[str, pd.DataFrame]] = {}
+# (sheet name, date column) -> (version, {(year, month): row positions})
+_partition_cache: dict[tuple[str, str], tuple[str, dict[tuple[int, int], np.ndarray]]] = {}
+# (sheet name, date column) -> (version, {(year, month): content digest of the rows in that month})
+_digest_cache: dict[tuple[str, str], tuple[str, dict[tuple[int, int], str]]] = {}
+_typed_lock = threading.Lock()
+_build_locks: dict[str, threading.Lock] = {}
+
+# Date codec lookup table: (format, date string) -> parsed date. Date columns only hold
+# a few hundred distinct strings, so each one is parsed once and reused across sheet versions
+_date_lookup: dict[tuple[str, str], pd.Timestamp] = {}
+
+
+def parse_dates(values: pd.Series, date_format: str | None = DATE_FORMAT) -> pd.Series:
+    """Parse a column of date strings through the lookup table (invalid dates become NaT)"""
+    codes, uniques = pd.factorize(values)
+    uniques = list(uniques)
+
+    if date_format is None:
+        # Inferred formats depend on the whole column, so these are not remembered
+        parsed = pd.to_datetime(pd.Series(uniques, dtype=object), errors="coerce")
+    else:
+        missing = [value for value in uniques if (date_format, value) not in _date_lookup]
+        if missing:
+            new_dates = pd.to_datetime(pd.Series(missing, dtype=object), format=date_format, errors="coerce")
+            _date_lookup.update(zip([(date_format, value) for value in missing], new_dates))
+        parsed = pd.Series([_date_lookup[(date_format, value)] for value in uniques], dtype="datetime64[ns]")
+
+    # Missing cells get code -1, which picks the trailing NaT
+    lookup = pd.DatetimeIndex(list(parsed) + [pd.NaT])
+    return pd.Series(lookup[codes], index=values.index, name=values.name)
+
+
+def format_dates(dates: pd.Series, date_format: str = DATE_FORMAT, missing=np.nan) -> pd.Series:
+    """Render a date column as text at the display boundary, formatting each distinct date once"""
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, errors="coerce")
+
+    codes, uniques = pd.factorize(dates)
+    lookup = np.append(pd.DatetimeIndex(uniques).strftime(date_format).to_numpy(dtype=object), missing)
+    return pd.Series(lookup[codes], index=dates.index, name=dates.name)
+
+
+def to_number(series: pd.Series, dtype: str | None = None) -> pd.Series:
+    """Convert money / count strings like "$1,250.00" to numbers (invalid values become NaN).
+
+    With a nullable dtype ("Int64" / "Float64") invalid values become <NA> instead, and a count
+    column holding fractions stays Float64 rather than being truncated.
+    """
+    numbers = pd.to_numeric(
+        series.astype(str).str.replace("$", "", regex=False).str.replace(",", "", regex=False),
+        errors="coerce"
+    )
+    if dtype is None:
+        return numbers
+
+    try:
+        return numbers.astype(dtype)
+    except TypeError:
+        return numbers.astype("Float64")
+
+
+def build_typed_frame(data: pd.DataFrame, schema: dict) -> pd.DataFrame:
+    """Apply a sheet schema to a raw string frame"""
+    if data.empty:
+        return pd.DataFrame()
+
+    columns = list(data.columns)
+    end_column = schema.get("end_column")
+    if end_column in columns:
+        end_col_index = columns.index(end_column)
+        data = data.iloc[:, :end_col_index + 1]
+
+    data = data.astype(str) if schema.get("as_str") else data.copy(deep=False)
+
+    date_format = schema.get("date_format", DATE_FORMAT)
+    date_columns = schema.get("date_columns", [])
+    numeric_columns = schema.get("numeric_columns", {})
+    for col in date_columns:
+        if col in data.columns:
+            data[col] = parse_dates(data[col], date_format)
+
+    for col, dtype in numeric_columns.items():
+        if col in data.columns:
+            data[col] = to_number(data[col], dtype)
+
+    text_columns = [col for col in data.columns if col not in date_columns and col not in numeric_columns]
+    if text_columns:
+        data[text_columns] = data[text_columns].astype(TEXT_DTYPE)
+
+    return data
+
+
+def _typed_entry(sheet_name: str) -> tuple[str | None, pd.DataFrame]:
+    """(version, shared typed frame) for a sheet, the frame must not be modified"""
+    version = get_sheet_version(sheet_name)
+
+    with _typed_lock:
+        cached = _typed_cache.get(sheet_name)
+    if version is not None and cached is not None and cached[0] == version:
+        return cached
+
+    # One thread parses a sheet version, concurrent readers of the same sheet wait for it
+    with _typed_lock:
+        build_lock = _build_locks.setdefault(sheet_name, threading.Lock())
+    with build_lock:
+        with _typed_lock:
+            cached = _typed_cache.get(sheet_name)
+        if version is not None and cached is not None and cached[0] == version:
+            return cached
+
+        return _build_entry(sheet_name, version, cached)
+
+
+def _build_entry(sheet_name: str, version: str | None,
+                 cached: tuple[str, pd.DataFrame] | None) -> tuple[str | None, pd.DataFrame]:
+    """Parse a sheet version, reusing the cached frame's rows after an incremental sync"""
+    schema = SHEET_SCHEMAS.get(sheet_name, {})
+    delta = get_sync_delta(sheet_name)
+    if version is not None and cached is not None and delta is not None and delta[0] == cached[0]:
+        # Incremental sync: only the re-read rows are parsed, the rest comes from the cached frame
+        kept_rows = delta[1]
+        tail = build_typed_frame(get_sheet_data(sheet_name).iloc[kept_rows:], schema)
+        data = pd.concat([cached[1].iloc[:kept_rows], tail], ignore_index=True) if not tail.empty \
+            else cached[1].iloc[:kept_rows].copy()
+    else:
+        data = build_typed_frame(get_sheet_data(sheet_name), schema)
+
+    if version is not None:
+        with _typed_lock:
+            _typed_cache[sheet_name] = (version, data)
+
+    return version, data
+
+
+def get_typed_frame(sheet_name: str) -> pd.DataFrame:
+    """Get a sheet with its dates and numbers already parsed, built once per sheet version.
+
+    The frame is a lazy copy of the shared one: it costs nothing until a column is written.
+    """
+    return _typed_entry(sheet_name)[1].copy(deep=False)
+
+
+def build_partition_index(dates: pd.Series) -> dict[tuple[int, int], np.ndarray]:
+    """Map (year, month) to the row positions holding a date in that month (NaT rows are left out)"""
+    valid = dates.notna().to_numpy()
+    positions = np.flatnonzero(valid)
+    months = (dates.dt.year * 12 + dates.dt.month - 1).to_numpy()[valid].astype(np.int64)
+
+    # Group positions by month, keeping sheet order inside each month
+    order = np.argsort(months, kind="stable")
+    months, positions = months[order], positions[order]
+    keys, starts = np.unique(months, return_index=True)
+    ends = np.append(starts[1:], len(months))
+
+    return {(int(key) // 12, int(key) % 12 + 1): positions[start:end] for key, start, end in zip(keys, starts, ends)}
+
+
+def _partition_index(sheet_name: str, date_column: str, version: str | None,
+                     data: pd.DataFrame) -> dict[tuple[int, int], np.ndarray]:
+    """(year, month) index of a typed frame's date column, built once per sheet version"""
+    key = (sheet_name, date_column)
+    with _typed_lock:
+        cached = _partition_cache.get(key)
+    if version is not None and cached is not None and cached[0] == version:
+        return cached[1]
+
+    index = build_partition_index(data[date_column])
+    if version is not None:
+        with _typed_lock:
+            _partition_cache[key] = (version, index)
+
+    return index
+
+
+def get_typed_slice(sheet_name: str, date_column: str, start_year: int, end_year: int | None = None,
+                    month: int | None = None) -> pd.DataFrame:
+    """Rows of a typed sheet whose date_column falls in start_year..end_year (optionally one month of it).
+
+    Same rows, order and index as a .dt.year / .dt.month mask over get_typed_frame, but read
+    straight from the partition index. Sheets without the column are returned whole, a sheet
+    without data comes back without columns while an empty slice keeps them.
+    """
+    end_year = start_year if end_year is None else end_year
+
+    version, data = _typed_entry(sheet_name)
+    if data.empty or date_column not in data.columns:
+        return data.copy(deep=False)
+
+    index = _partition_index(sheet_name, date_column, version, data)
+    months = [month] if month else range(1, 13)
+    parts = [index[(year, m)] for year in range(start_year, end_year + 1) for m in months if (year, m) in index]
+    positions = np.sort(np.concatenate(parts)) if parts else np.array([], dtype=np.int64)
+
+    return data.iloc[positions]
+
+
+def get_partition_version(sheet_name: str, date_column: str, year: int, month: int) -> str | None:
+    """Content digest of the rows one month of a sheet holds, None for sheets outside the store.
+
+    Unlike the sheet version it only changes when a row of that month is added, edited or
+    removed, so results computed from a single month can be kept across sheet versions.
+    """
+    version, data = _typed_entry(sheet_name)
+    if version is None or date_column not in data.columns:
+        return None
+
+    key = (sheet_name, date_column)
+    with _typed_lock:
+        cached = _digest_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1].get((year, month), "empty")
+
+    # Typed frames keep every sheet row in place, so the stored row hashes line up with them
+    hashes_version, row_hashes = get_row_hashes(sheet_name)
+    if hashes_version != version or row_hashes is None or len(row_hashes) != len(data):
+        return None
+
+    index = _partition_index(sheet_name, date_column, version, data)
+    digests = {part: hashlib.blake2b(row_hashes[positions].tobytes(), digest_size=16).hexdigest()
+               for part, positions in index.items()}
+    with _typed_lock:
+        _digest_cache[key] = (version, digests)
+
+    return digests.get((year, month), "empty")